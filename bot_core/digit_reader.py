@@ -0,0 +1,117 @@
+import os
+
+import cv2
+import numpy as np
+
+GLYPH_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'game_assets', 'digits'))
+GLYPH_SIZE = (12, 20)  # (width, height) every glyph is normalized to
+
+class DigitReader:
+  """
+  Glyph-template digit reader for the game's fixed number font.
+  Segments a numeric field into connected components and labels each one by
+  nearest glyph template. Glyphs live in game_assets/digits/ as <digit>.png or
+  <digit>_<anything>.png (see tools/digit_samples.py to build them).
+  """
+  def __init__(self, glyph_dir=GLYPH_DIR, min_confidence=0.8):
+    self.glyph_dir = glyph_dir
+    self.min_confidence = min_confidence
+    self.labels = []
+    self.glyphs = None
+    self.load_glyphs()
+
+  @property
+  def available(self):
+    return self.glyphs is not None and len(self.labels) > 0
+
+  def load_glyphs(self):
+    """(Re)load glyph templates from glyph_dir"""
+    labels, glyphs = [], []
+    if os.path.isdir(self.glyph_dir):
+      for filename in sorted(os.listdir(self.glyph_dir)):
+        label = filename[0]
+        if not (label.isdigit() and filename.lower().endswith(".png")):
+          continue
+        img = cv2.imread(os.path.join(self.glyph_dir, filename), cv2.IMREAD_GRAYSCALE)
+        if img is None:
+          continue
+        labels.append(label)
+        glyphs.append(normalize_glyph(img > 127))
+    self.labels = labels
+    self.glyphs = np.stack(glyphs) if glyphs else None
+
+  def segment(self, img):
+    """Split a numeric field (PIL image or array) into normalized glyphs, left to right"""
+    gray = np.array(img.convert("L")) if hasattr(img, "convert") else img
+    if gray.ndim == 3:
+      gray = cv2.cvtColor(gray, cv2.COLOR_RGB2GRAY)
+    return [normalize_glyph(mask) for mask in split_glyphs(gray)]
+
+  def read(self, img):
+    """Return (value, confidence); value is None when nothing could be read"""
+    if not self.available:
+      return None, 0.0
+    glyphs = self.segment(img)
+    if not glyphs:
+      return None, 0.0
+
+    digits = []
+    confidence = 1.0
+    for glyph in glyphs:
+      label, score = self.classify(glyph)
+      digits.append(label)
+      confidence = min(confidence, score)
+    return int("".join(digits)), confidence
+
+  def classify(self, glyph):
+    """Nearest glyph template by normalized correlation; returns (label, score)"""
+    flat = glyph.reshape(1, -1)
+    templates = self.glyphs.reshape(len(self.glyphs), -1)
+    a = flat - flat.mean()
+    b = templates - templates.mean(axis=1, keepdims=True)
+    denom = np.linalg.norm(a) * np.linalg.norm(b, axis=1)
+    scores = (b @ a.ravel()) / np.where(denom == 0, 1, denom)
+    best = int(np.argmax(scores))
+    return self.labels[best], float(scores[best])
+
+def split_glyphs(gray):
+  """Binarize a field and return one boolean mask per character, left to right"""
+  _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+  text = binary > 0
+  # Text is the minority class, whatever the colours of the field
+  if text.mean() > 0.5:
+    text = ~text
+
+  count, labels, stats, _ = cv2.connectedComponentsWithStats(text.astype(np.uint8), connectivity=8)
+  if count <= 1:
+    return []
+  tallest = stats[1:, cv2.CC_STAT_HEIGHT].max()
+  boxes = []
+  for i in range(1, count):
+    x, y, w, h, area = stats[i]
+    # Drop specks and anything far shorter than a digit (commas, dots, noise)
+    if h < tallest * 0.6 or area < 4:
+      continue
+    boxes.append([x, y, x + w, y + h])
+  boxes.sort()
+
+  # Merge components that overlap horizontally (broken strokes of one glyph)
+  merged = []
+  for box in boxes:
+    if merged and box[0] < merged[-1][2] - 1:
+      last = merged[-1]
+      merged[-1] = [min(last[0], box[0]), min(last[1], box[1]), max(last[2], box[2]), max(last[3], box[3])]
+    else:
+      merged.append(box)
+  return [text[top:bottom, left:right] for left, top, right, bottom in merged]
+
+def normalize_glyph(mask):
+  """Crop a glyph mask to its ink and resize to GLYPH_SIZE as float32 in [0, 1]"""
+  mask = np.asarray(mask, dtype=np.uint8)
+  ys, xs = np.nonzero(mask)
+  if len(xs):
+    mask = mask[ys.min():ys.max() + 1, xs.min():xs.max() + 1]
+  return cv2.resize(mask.astype(np.float32), GLYPH_SIZE, interpolation=cv2.INTER_AREA)
+
+# Global digit reader instance
+digit_reader = DigitReader()
@@ -1,7 +1,6 @@
-import pyautogui
-import time
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from PIL import ImageGrab
 from monitor_manager import monitor_manager
 
@@ -14,30 +13,59 @@ try:
     USE_SMART_MOUSE = True
     USE_HUMAN_BEHAVIOR = True
 except ImportError:
-    print("Warning: mouse_utils or human_behavior not available, using default pyautogui")
+    print("Warning: mouse_utils or human_behavior not available, using default mouse input")
     USE_SMART_MOUSE = False
     USE_HUMAN_BEHAVIOR = False
 
-pyautogui.useImageNotFoundException(False)
-
 import bot_core.state as state
-from bot_core.state import check_support_card, check_failure, check_turn, check_mood, check_current_year, check_criteria, check_skill_pts
+from bot_core.state import check_support_card, check_special_supporters, check_failure, check_skill_pts
 from bot_core.logic import do_something
-from bot_utils.constants import MOOD_LIST
-from bot_core.recognizer import is_btn_active, match_template, multi_match_templates
+from bot_utils.constants import MOOD_LIST, LIST_REGION
+from bot_core.recognizer import is_btn_active, match_template, multi_match_templates, wait_for, box_center
 from bot_utils.scenario import ura
 from bot_core.skill import buy_skill
-
+from bot_utils.input_sink import input_sink
+from bot_utils.tracing import tracer
+from bot_core.screen_change import wait_for_transition, wait_for_stable
+from bot_core.screen_classifier import screen_classifier
+from bot_core.position_cache import position_cache
+from bot_core.support_slots import slot_classifier, count_types, count_specials
+from bot_core.game_state import game_state
+
+# Lobby templates in the order career_lobby_iteration acts on them
 templates = {
   "event": "game_assets/icons/event_choice_1.png",
   "inspiration": "game_assets/buttons/inspiration_btn.png",
   "next": "game_assets/buttons/next_btn.png",
   "cancel": "game_assets/buttons/cancel_btn.png",
+  "retry": "game_assets/buttons/retry_btn.png",
   "tazuna": "game_assets/ui/tazuna_hint.png",
-  "infirmary": "game_assets/buttons/infirmary_btn.png",
-  "retry": "game_assets/buttons/retry_btn.png"
+  "infirmary": "game_assets/buttons/infirmary_btn.png"
+}
+# Any of these gets clicked straight away, so nothing after it needs matching
+click_templates = ("event", "inspiration", "next", "cancel", "retry")
+# Lobby templates worth matching on each classified screen type; other types
+# ("unknown", no references, ...) match the whole set
+screen_templates = {
+  "lobby": ("tazuna", "infirmary"),
+  "event": ("event",),
+  "dialog": ("inspiration", "next", "cancel", "retry"),
+  "race_result": ("next",)
 }
 
+def match_lobby_templates(screen):
+  """Match the lobby template set, limited to what the classified screen type can show"""
+  screen_type, _ = screen_classifier.classify(screen)
+  names = screen_templates.get(screen_type)
+  if names:
+    matches = multi_match_templates({name: templates[name] for name in names}, screen=screen, stop_on=click_templates)
+    if any(matches.values()):
+      return {name: matches.get(name, []) for name in templates}
+    # Nothing where the classifier said it would be: don't trust it this time
+    print(f"[WARNING] Screen classified as {screen_type} but none of its templates matched")
+  return multi_match_templates(templates, screen=screen, stop_on=click_templates)
+
+@tracer.span("click")
 def click(img: str = None, confidence: float = 0.8, minSearch:float = 2, click: int = 1, text: str = "", boxes = None):
   if not state.is_bot_running:
     return False
@@ -65,57 +93,69 @@ def click(img: str = None, confidence: float = 0.8, minSearch:float = 2, click:
     # Add human-like delay before clicking
     if USE_HUMAN_BEHAVIOR:
       delay = human_behavior.get_human_delay(0.3, 0.1)
-      time.sleep(delay)
+      input_sink.sleep(delay)
     
     if USE_SMART_MOUSE:
         smart_move_and_click(center[0], center[1], clicks=click)
     else:
-        pyautogui.moveTo(center[0], center[1], duration=0.175)
-        pyautogui.click(clicks=click)
+        input_sink.moveTo(center[0], center[1], duration=0.175)
+        input_sink.click(clicks=click)
+    monitor_manager.invalidate_frame()
     return True
 
   if img is None:
     return False
 
-  btn = pyautogui.locateCenterOnScreen(img, confidence=confidence, minSearchTime=minSearch)
+  btn = wait_for(img, threshold=confidence, timeout=minSearch)
   if btn:
     if text:
       print(text)
+    center = box_center(btn[0])
     if USE_SMART_MOUSE:
-        smart_move_and_click(btn.x, btn.y, clicks=click)
+        smart_move_and_click(center[0], center[1], clicks=click)
     else:
-        pyautogui.moveTo(btn, duration=0.175)
-        pyautogui.click(clicks=click)
+        input_sink.moveTo(center[0], center[1], duration=0.175)
+        input_sink.click(clicks=click)
+    monitor_manager.invalidate_frame()
     return True
   
   return False
 
+# Lobby training buttons, the alternative one first (since it has more matches)
+training_buttons = {
+  "training_btn2": "game_assets/buttons/training_btn2.png",
+  "training_btn": "game_assets/buttons/training_btn.png"
+}
+
 def go_to_training():
-  # Try the alternative training button first (since it has more matches)
-  if click("game_assets/buttons/training_btn2.png", confidence=0.7, text="[INFO] Found training_btn2.png"):
-    return True
-  
-  # Try the original training button
-  if click("game_assets/buttons/training_btn.png", confidence=0.7, text="[INFO] Found training_btn.png"):
-    return True
-  
-  # If neither button clicked successfully, let's see what training-related elements are detected
-  screen = monitor_manager.get_screenshot()
-  training_matches = multi_match_templates({
-    "training_btn": "game_assets/buttons/training_btn.png",
-    "training_btn2": "game_assets/buttons/training_btn2.png"
-  }, screen=screen, threshold=0.7)
-  
-  # Try to click training_btn2 first, then training_btn
-  if training_matches['training_btn2']:
-    if click(boxes=training_matches['training_btn2'][:1], text="[INFO] Clicking training button"):
-      return True
-  
-  if training_matches['training_btn']:
-    if click(boxes=training_matches['training_btn'][:1], text="[INFO] Clicking training button"):
-      return True
-  
-  return False
+  # Last turn's button position is checked first; otherwise both buttons are searched together
+  name, boxes = position_cache.locate_any(training_buttons, "lobby", threshold=0.7, timeout=2)
+  if not boxes:
+    return False
+  return click(boxes=boxes[0][:4], text=f"[INFO] Found {name}.png")
+
+# Reads the captured training previews while the mouse moves on to the next training
+training_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="training")
+
+def read_training(frame, turn=None, training=None):
+  """Support cards, special supporters and failure chance of one captured training preview"""
+  slots = None
+  with tracer.bind(turn):
+    if slot_classifier.enabled:
+      slots = slot_classifier.classify(frame, training)
+      support_counts = count_types(slots)
+      special_counts = count_specials(slots)
+    else:
+      support_counts = check_support_card(frame=frame)
+      special_counts = check_special_supporters(frame=frame)
+    failure_chance = check_failure(frame=frame)
+  return {
+    "support": support_counts,
+    "total_support": sum(support_counts.values()),
+    "special": special_counts,
+    "slots": slots,
+    "failure": failure_chance
+  }
 
 def check_training():
   training_types = {
@@ -125,99 +165,90 @@ def check_training():
     "guts": "game_assets/icons/train_guts.png",
     "wit": "game_assets/icons/train_wit.png"
   }
-  results = {}
+  pending = {}
+  turn = tracer.current_turn()
 
+  # The hover loop only captures; matching and OCR run in training_pool meanwhile
   for key, icon_path in training_types.items():
-    pos = pyautogui.locateCenterOnScreen(icon_path, confidence=0.8)
+    pos = position_cache.locate(icon_path, "training", threshold=0.8)
     if pos:
-      pyautogui.moveTo(pos, duration=0.1)
-      pyautogui.mouseDown()
-      support_counts = check_support_card()
-      total_support = sum(support_counts.values())
-      failure_chance = check_failure()
-      results[key] = {
-        "support": support_counts,
-        "total_support": total_support,
-        "failure": failure_chance
-      }
-      print(f"[{key.upper()}] → {support_counts}, Fail: {failure_chance}%")
-      time.sleep(0.1)
+      input_sink.moveTo(box_center(pos[0]), duration=0.1)
+      input_sink.mouseDown()
+      # The hovered training changes the preview, so it needs a new frame
+      frame = monitor_manager.refresh_frame()
+      pending[key] = training_pool.submit(read_training, frame, turn, key)
+      input_sink.sleep(0.1)
   
-  pyautogui.mouseUp()
+  input_sink.mouseUp()
+
+  results = {}
+  for key, future in pending.items():
+    results[key] = future.result()
+    print(f"[{key.upper()}] → {results[key]['support']}, Fail: {results[key]['failure']}%")
+
   click(img="game_assets/buttons/back_btn.png")
   return results
 
 def do_train(train):
-  # Use our template matching system instead of PyAutoGUI's locateCenterOnScreen
   train_icon_path = f"game_assets/icons/train_{train}.png"
   
-  # Find training icon using template matching
+  # Find training icon using template matching (retrying on new frames for a moment)
   try:
-    train_matches = match_template(train_icon_path, threshold=0.8)
+    # check_training located it a moment ago, so this is normally a small ROI check
+    train_matches = position_cache.locate(train_icon_path, "training", threshold=0.8, timeout=1)
     
     if train_matches:
-      # Get the first match
-      x, y, w, h = train_matches[0]
-      
-      # Convert to absolute screen coordinates
-      abs_x, abs_y = monitor_manager.monitor_to_screen_coords(x, y)
-      center = (abs_x + w // 2, abs_y + h // 2)
+      # Convert the best match to absolute screen coordinates
+      center = box_center(train_matches[0])
       
       print(f"[INFO] Clicking {train} training at {center}")
-      pyautogui.tripleClick(center, interval=0.1, duration=0.2)
+      input_sink.tripleClick(center, interval=0.1, duration=0.2)
     else:
-      print(f"[WARNING] Could not find {train} training icon using template matching")
-      # Fallback to PyAutoGUI method
-      train_btn = pyautogui.locateCenterOnScreen(train_icon_path, confidence=0.8)
-      if train_btn:
-        print(f"[DEBUG] Found {train} using PyAutoGUI at {train_btn}")
-        pyautogui.tripleClick(train_btn, interval=0.1, duration=0.2)
-      else:
-        print(f"[ERROR] Could not find {train} training icon at all")
+      print(f"[ERROR] Could not find {train} training icon at all")
   except Exception as e:
     print(f"[ERROR] do_train exception: {e}")
     raise
 
 def do_rest():
-  rest_btn = pyautogui.locateCenterOnScreen("game_assets/buttons/rest_btn.png", confidence=0.8)
-  rest_summber_btn = pyautogui.locateCenterOnScreen("game_assets/buttons/rest_summer_btn.png", confidence=0.8)
+  rest_btn = position_cache.locate("game_assets/buttons/rest_btn.png", "lobby", threshold=0.8)
+  rest_summber_btn = position_cache.locate("game_assets/buttons/rest_summer_btn.png", "lobby", threshold=0.8)
 
   if rest_btn:
-    pyautogui.moveTo(rest_btn, duration=0.15)
-    pyautogui.click(rest_btn)
+    input_sink.moveTo(box_center(rest_btn[0]), duration=0.15)
+    input_sink.click(box_center(rest_btn[0]))
   elif rest_summber_btn:
-    pyautogui.moveTo(rest_summber_btn, duration=0.15)
-    pyautogui.click(rest_summber_btn)
+    input_sink.moveTo(box_center(rest_summber_btn[0]), duration=0.15)
+    input_sink.click(box_center(rest_summber_btn[0]))
 
 def do_recreation():
-  recreation_btn = pyautogui.locateCenterOnScreen("game_assets/buttons/recreation_btn.png", confidence=0.8)
-  recreation_summer_btn = pyautogui.locateCenterOnScreen("game_assets/buttons/rest_summer_btn.png", confidence=0.8)
+  recreation_btn = position_cache.locate("game_assets/buttons/recreation_btn.png", "lobby", threshold=0.8)
+  recreation_summer_btn = position_cache.locate("game_assets/buttons/rest_summer_btn.png", "lobby", threshold=0.8)
 
   if recreation_btn:
-    pyautogui.moveTo(recreation_btn, duration=0.15)
-    pyautogui.click(recreation_btn)
+    input_sink.moveTo(box_center(recreation_btn[0]), duration=0.15)
+    input_sink.click(box_center(recreation_btn[0]))
   elif recreation_summer_btn:
-    pyautogui.moveTo(recreation_summer_btn, duration=0.15)
-    pyautogui.click(recreation_summer_btn)
+    input_sink.moveTo(box_center(recreation_summer_btn[0]), duration=0.15)
+    input_sink.click(box_center(recreation_summer_btn[0]))
 
 def do_race(prioritize_g1 = False):
   click(img="game_assets/buttons/races_btn.png", minSearch=10)  
 
-  consecutive_cancel_btn = pyautogui.locateCenterOnScreen("game_assets/buttons/cancel_btn.png", minSearchTime=0.7, confidence=0.8)
+  consecutive_cancel_btn = wait_for("game_assets/buttons/cancel_btn.png", threshold=0.8, timeout=0.7)
   if state.CANCEL_CONSECUTIVE_RACE and consecutive_cancel_btn:
     click(img="game_assets/buttons/cancel_btn.png", text="[INFO] Already raced 3+ times consecutively. Cancelling race and doing training.")
     return False
   elif not state.CANCEL_CONSECUTIVE_RACE and consecutive_cancel_btn:
     click(img="game_assets/buttons/ok_btn.png", minSearch=0.7)
 
-  time.sleep(0.7)
+  wait_for_transition(timeout=0.7)
   found = race_select(prioritize_g1=prioritize_g1)
   if not found:
     print("[INFO] No race found.")
     return False
 
   race_prep()
-  time.sleep(1)
+  wait_for_transition(timeout=1)
   after_race()
   return True
 
@@ -225,22 +256,23 @@ def race_day():
   click(img="game_assets/buttons/race_day_btn.png", minSearch=10)
   
   click(img="game_assets/buttons/ok_btn.png")
-  time.sleep(0.5)
+  wait_for_transition(timeout=0.5)
 
   for i in range(2):
     click(img="game_assets/buttons/race_btn.png", minSearch=2)
-    time.sleep(0.5)
+    wait_for_transition(timeout=0.5)
 
   race_prep()
-  time.sleep(1)
+  wait_for_transition(timeout=1)
   after_race()
 
 def race_select(prioritize_g1 = False):
   # Convert monitor-relative coordinates to absolute screen coordinates
   abs_x, abs_y = monitor_manager.monitor_to_screen_coords(560, 680)
-  pyautogui.moveTo(x=abs_x, y=abs_y)
+  input_sink.moveTo(x=abs_x, y=abs_y)
 
-  time.sleep(0.2)
+  input_sink.sleep(0.2)
+  monitor_manager.invalidate_frame()
 
   if prioritize_g1:
     print("[INFO] Looking for G1 race.")
@@ -249,92 +281,87 @@ def race_select(prioritize_g1 = False):
 
       if race_card:
         for x, y, w, h in race_card:
-          # Convert monitor-relative region to absolute screen coordinates for PyAutoGUI
-          abs_x, abs_y = monitor_manager.monitor_to_screen_coords(x, y)
-          # Ensure region coordinates are valid and within screen bounds
-          region_width = min(310, 1920 - abs_x) if abs_x >= 0 else 310
-          region_height = min(90, 1080 - abs_y) if abs_y >= 0 else 90
-          
-          # Only proceed if we have valid coordinates
-          if abs_x >= 0 and abs_y >= 0 and region_width > 0 and region_height > 0:
-            region = (abs_x, abs_y, region_width, region_height)
-            match_aptitude = pyautogui.locateCenterOnScreen("game_assets/ui/match_track.png", confidence=0.8, minSearchTime=0.7, region=region)
-          else:
-            # Skip this region if coordinates are invalid
-            continue
+          # Look for the aptitude marker on this race card only (monitor-relative, clamped to the frame)
+          region = (x, y, x + 310, y + 90)
+          match_aptitude = wait_for("game_assets/ui/match_track.png", roi=region, threshold=0.8, timeout=0.7, fallback=False)
           if match_aptitude:
             print("[INFO] G1 race found.")
-            pyautogui.moveTo(match_aptitude, duration=0.2)
-            pyautogui.click()
+            input_sink.moveTo(box_center(match_aptitude[0]), duration=0.2)
+            input_sink.click()
             for i in range(2):
               click(img="game_assets/buttons/race_btn.png")
-              time.sleep(0.5)
+              wait_for_transition(timeout=0.5)
             return True
       
       for i in range(4):
-        pyautogui.scroll(-300)
+        input_sink.scroll(-300)
+      wait_for_stable(LIST_REGION, settle_ms=100, timeout=0.5)
     
     return False
   else:
     print("[INFO] Looking for race.")
     for i in range(4):
-      match_aptitude = pyautogui.locateCenterOnScreen("game_assets/ui/match_track.png", confidence=0.8, minSearchTime=0.7)
+      match_aptitude = wait_for("game_assets/ui/match_track.png", threshold=0.8, timeout=0.7)
       if match_aptitude:
         print("[INFO] Race found.")
-        pyautogui.moveTo(match_aptitude, duration=0.2)
-        pyautogui.click(match_aptitude)
+        input_sink.moveTo(box_center(match_aptitude[0]), duration=0.2)
+        input_sink.click(box_center(match_aptitude[0]))
 
         for i in range(2):
           click(img="game_assets/buttons/race_btn.png")
-          time.sleep(0.5)
+          wait_for_transition(timeout=0.5)
         return True
       
       for i in range(4):
-        pyautogui.scroll(-300)
+        input_sink.scroll(-300)
+      wait_for_stable(LIST_REGION, settle_ms=100, timeout=0.5)
     
     return False
 
 def race_prep():
-  view_result_btn = pyautogui.locateCenterOnScreen("game_assets/buttons/view_results.png", confidence=0.8, minSearchTime=10)
+  view_result_btn = wait_for("game_assets/buttons/view_results.png", threshold=0.8, timeout=10)
   if view_result_btn:
-    pyautogui.click(view_result_btn)
-    time.sleep(0.5)
+    input_sink.click(box_center(view_result_btn[0]))
+    wait_for_transition(timeout=0.5)
     for i in range(3):
-      pyautogui.tripleClick(interval=0.2)
-      time.sleep(0.5)
+      input_sink.tripleClick(interval=0.2)
+      wait_for_transition(timeout=0.5)
 
 def after_race():
   click(img="game_assets/buttons/next_btn.png", minSearch=5)
-  time.sleep(0.3)
-  pyautogui.click()
+  wait_for_transition(timeout=0.3)
+  input_sink.click()
   click(img="game_assets/buttons/next2_btn.png", minSearch=5)
 
-def auto_buy_skill():
-  if check_skill_pts() < state.SKILL_PTS_CHECK:
+def auto_buy_skill(skill_pts=None):
+  if (check_skill_pts() if skill_pts is None else skill_pts) < state.SKILL_PTS_CHECK:
     return
 
   click(img="game_assets/buttons/skills_btn.png")
   print("[INFO] Buying skills")
-  time.sleep(0.5)
+  wait_for_transition(timeout=0.5)
 
   if buy_skill():
+    game_state.invalidate("skill_pts")
     click(img="game_assets/buttons/confirm_btn.png", minSearch=0.5)
     click(img="game_assets/buttons/learn_btn.png", minSearch=0.5)
-    time.sleep(0.5)
+    wait_for_transition(timeout=0.5)
     click(img="game_assets/buttons/close_btn.png", minSearch=2)
-    time.sleep(0.5)
+    wait_for_transition(timeout=0.5)
     click(img="game_assets/buttons/back_btn.png")
   else:
     print("[INFO] No matching skills found. Going back.")
     click(img="game_assets/buttons/back_btn.png")
 
+@tracer.turn()
 def career_lobby_iteration():
   """Run one iteration of the career lobby logic"""
   if not state.is_bot_running:
     return False
     
-  screen = monitor_manager.get_screenshot()
-  matches = multi_match_templates(templates, screen=screen)
+  # One fresh frame per tick; every reader below crops from this snapshot
+  screen = monitor_manager.refresh_frame().image
+  matches = match_lobby_templates(screen)
 
   if click(boxes=matches["event"], text="[INFO] Event found, selecting top choice."):
     return True
@@ -351,18 +378,22 @@ def career_lobby_iteration():
     print("[INFO] Should be in career lobby.")
     return True
 
+  # Values carried over from the last turn; only fields whose pixels changed are read again.
+  # Read before any action of this tick, so the last action's predictions are checked first
+  lobby = game_state.read()
+
   if matches["infirmary"]:
     if is_btn_active(matches["infirmary"][0]):
       click(boxes=matches["infirmary"][0], text="[INFO] Character debuffed, going to infirmary.")
+      game_state.advance("infirmary")
       return True
 
-  mood = check_mood()
+  mood = lobby["mood"]
   mood_index = MOOD_LIST.index(mood)
   minimum_mood = MOOD_LIST.index(state.MINIMUM_MOOD)
-  turn = check_turn()
-  year = check_current_year()
-  criteria = check_criteria()
-  year_parts = year.split(" ")
+  turn = lobby["turn"]
+  year = lobby["year"]
+  criteria = lobby["criteria"]
 
   print("\n=======================================================================================\n")
   print(f"Year: {year}")
@@ -370,53 +401,58 @@ def career_lobby_iteration():
   print(f"Turn: {turn}\n")
 
   # URA SCENARIO
-  if year == "Finale Season" and turn == "Race Day":
+  if year.is_finale and turn == "Race Day":
     print("[INFO] URA Finale")
     if state.IS_AUTO_BUY_SKILL:
-      auto_buy_skill()
+      auto_buy_skill(lobby["skill_pts"])
     ura()
     for _ in range(2):
       if click(img="game_assets/buttons/race_btn.png", minSearch=2):
-        time.sleep(0.5)
+        wait_for_transition(timeout=0.5)
     
     race_prep()
-    time.sleep(1)
+    wait_for_transition(timeout=1)
     after_race()
+    game_state.advance("race")
     return True
 
   # If calendar is race day, do race
-  if turn == "Race Day" and year != "Finale Season":
+  if turn == "Race Day" and not year.is_finale:
     print("[INFO] Race Day.")
-    if state.IS_AUTO_BUY_SKILL and year_parts[0] != "Junior":
-      auto_buy_skill()
+    if state.IS_AUTO_BUY_SKILL and year.stage != "Junior":
+      auto_buy_skill(lobby["skill_pts"])
     race_day()
+    game_state.advance("race")
     return True
 
   # Mood check
   if mood_index < minimum_mood:
     print("[INFO] Mood is low, trying recreation to increase mood")
     do_recreation()
+    game_state.advance("recreation")
     return True
 
-  # Check if goals is not met criteria AND it is not Pre-Debut AND turn is less than 10 AND Goal is already achieved
-  if criteria.split(" ")[0] != "criteria" and year != "Junior Year Pre-Debut" and turn < 10 and criteria != "Goal Achievedl":
+  # Race while the goal is still pending (not met or achieved yet), after Pre-Debut, with fewer than 10 turns left
+  if criteria.pending and not year.is_pre_debut and turn < 10:
     race_found = do_race()
     if race_found:
+      game_state.advance("race")
       return True
     else:
       # If there is no race matching to aptitude, go back and do training instead
       click(img="game_assets/buttons/back_btn.png", minSearch=1, text="[INFO] Race not found. Proceeding to training.")
-      time.sleep(0.5)
+      wait_for_transition(timeout=0.5)
 
   # If Prioritize G1 Race is true, check G1 race every turn
-  if state.PRIORITIZE_G1_RACE and year_parts[0] != "Junior" and len(year_parts) > 3 and year_parts[3] not in ["Jul", "Aug"]:
+  if state.PRIORITIZE_G1_RACE and year.stage in ("Classic", "Senior") and year.month not in ("Jul", "Aug"):
     g1_race_found = do_race(state.PRIORITIZE_G1_RACE)
     if g1_race_found:
+      game_state.advance("race")
       return True
     else:
       # If there is no G1 race, go back and do training
       click(img="game_assets/buttons/back_btn.png", minSearch=1, text="[INFO] G1 race not found. Proceeding to training.")
-      time.sleep(0.5)
+      wait_for_transition(timeout=0.5)
 
   # Check training button
   if not go_to_training():
@@ -424,26 +460,30 @@ def career_lobby_iteration():
     return True
 
   # Last, do training
-  time.sleep(0.5)
+  wait_for_transition(timeout=0.5)
   results_training = check_training()
   
   training_logic = state.get_training_logic()
-  best_training = do_something(results_training, training_logic)
+  best_training = do_something(results_training, training_logic, mood=mood, stats=lobby["stats"], year=year)
   
   if best_training == "recreation":
     do_recreation()
+    game_state.advance("recreation")
   elif best_training:
     go_to_training()
-    time.sleep(0.5)
+    wait_for_transition(timeout=0.5)
     do_train(best_training)
+    game_state.advance("train", best_training)
   else:
     do_rest()
-  time.sleep(1)
+    game_state.advance("rest")
+  wait_for_transition(timeout=1)
   
   return True
 
 def career_lobby():
   # Program start
+  game_state.reset()
   while state.is_bot_running:
     if not career_lobby_iteration():
       break
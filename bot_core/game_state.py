@@ -0,0 +1,189 @@
+import sys
+import os
+from collections import deque
+
+import numpy as np
+
+# Add bot_utils to path for config access
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'bot_utils'))
+
+try:
+    from config_manager import get_performance_settings
+    use_game_state_tracker = get_performance_settings()['game_state_tracker']
+except ImportError:
+    use_game_state_tracker = True
+
+from monitor_manager import monitor_manager
+from bot_core.ocr import OCRJob
+from bot_core.lexicon import lexicon_reader, YEARS, UNKNOWN_YEAR
+from bot_core.state import parse_turn
+from bot_utils.constants import TURN_REGION, SKILL_PTS_REGION, STAT_REGIONS, MOOD_LIST
+from bot_utils.tracing import tracer
+
+LEXICON_FIELDS = ("mood", "year", "criteria")
+OCR_FIELDS = {
+  "turn": OCRJob(TURN_REGION, "text"),
+  "skill_pts": OCRJob(SKILL_PTS_REGION, "number", detect=False),
+  **{stat: OCRJob(region, "number", detect=False) for stat, region in STAT_REGIONS.items()}
+}
+FIELDS = LEXICON_FIELDS + tuple(OCR_FIELDS)
+
+PIXEL_DELTA = 40          # a pixel changed when its gray level moved more than this
+CHANGED_PIXELS = 8        # changed pixels that make a field worth re-reading (one digit moves far more)
+MAX_CONTRADICTIONS = 50
+
+def field_region(name):
+  return lexicon_reader.fields[name].region if name in LEXICON_FIELDS else OCR_FIELDS[name].region
+
+def field_pixels(frame, name):
+  return np.asarray(frame.crop(field_region(name)).convert("L"), dtype=np.int16)
+
+def pixels_changed(before, after):
+  if before is None or before.shape != after.shape:
+    return True
+  return int((np.abs(before - after) > PIXEL_DELTA).sum()) > CHANGED_PIXELS
+
+def next_year(year):
+  """The career date one turn after year (None when it can't be told, e.g. before the debut)"""
+  if year == UNKNOWN_YEAR or year.is_pre_debut:
+    return None
+  if year.is_finale:
+    return year
+  return YEARS[YEARS.index(year) + 1]
+
+class GameState:
+  """
+  Lobby values (mood, turn, year, criteria, stats, skill points) carried from turn to
+  turn. A field is re-read only when its pixels changed since the last read or it was
+  invalidated; all re-reads share one lexicon/OCR batch. advance() records the action
+  that used up a turn and predicts what the next read should show; readings that
+  disagree are flagged as contradictions (the reading is kept, and re-read next time).
+  """
+  def __init__(self, enabled=True):
+    self.enabled = enabled
+    self.values = {}
+    self.pixels = {}
+    self.predictions = {}    # field -> (expected, check(value) -> bool)
+    self.action = None
+    self.contradictions = deque(maxlen=MAX_CONTRADICTIONS)
+    self.stats = {"reads": 0, "fields_read": 0, "fields_carried": 0, "contradictions": 0}
+
+  def reset(self):
+    """Forget everything, e.g. when a new career starts"""
+    self.values.clear()
+    self.pixels.clear()
+    self.predictions.clear()
+    self.action = None
+
+  def invalidate(self, *names):
+    """Re-read these fields (default: all) on the next read, whatever their pixels show"""
+    for name in names or FIELDS:
+      self.pixels.pop(name, None)
+
+  def read(self, frame=None):
+    """Lobby values of a FrameSnapshot: read_lobby's fields plus "stats" and "skill_pts\""""
+    if frame is None:
+      frame = monitor_manager.get_frame()
+    pixels = {name: field_pixels(frame, name) for name in FIELDS}
+    stale = [name for name in FIELDS
+             if not self.enabled or name not in self.values or pixels_changed(self.pixels.get(name), pixels[name])]
+
+    if stale:
+      values = lexicon_reader.read(frame, [name for name in stale if name in LEXICON_FIELDS],
+                                   extra_jobs={name: OCR_FIELDS[name] for name in stale if name in OCR_FIELDS})
+      for name in stale:
+        value = values[name]
+        if name == "turn":
+          value = parse_turn(value.text)
+        elif name in OCR_FIELDS:
+          value = value.value
+        # Unreadable (a sentinel, or lexicon text that snapped to nothing, e.g. an empty
+        # criteria read during a transition): keep it, but read it again next time
+        unreadable = value in (-1, "UNKNOWN", UNKNOWN_YEAR) or name in lexicon_reader.unrecognized
+        if name == "criteria" and not unreadable and self.values.get(name, value).state != value.state:
+          # A new goal restarts the turn counter
+          self.predictions.pop("turn", None)
+        self.values[name] = value
+        self.pixels[name] = pixels[name]
+        if unreadable:
+          self.pixels.pop(name)
+
+    self.stats["reads"] += 1
+    self.stats["fields_read"] += len(stale)
+    self.stats["fields_carried"] += len(FIELDS) - len(stale)
+    tracer.note("fields_read", len(stale))
+    self._check_predictions()
+    return self.get_values()
+
+  def get_values(self):
+    values = self.values
+    return {
+      "mood": values.get("mood", "UNKNOWN"),
+      "turn": values.get("turn", -1),
+      "year": values.get("year", UNKNOWN_YEAR),
+      "criteria": values.get("criteria"),
+      "stats": {stat: values.get(stat, -1) for stat in STAT_REGIONS},
+      "skill_pts": values.get("skill_pts", -1)
+    }
+
+  def advance(self, action, training=None):
+    """
+    Record an action that used up a turn ("train" with its training key, "rest",
+    "recreation", "race" or "infirmary") and predict the next read
+    """
+    values = self.values
+    if self.predictions:
+      # No read since the last action: predict from what that action predicted, not from
+      # values a turn old. Only turn and year are known exactly; the rest can't be chained
+      values = {name: expected for name, (expected, _) in self.predictions.items()
+                if name == "year" or (name == "turn" and isinstance(expected, int))}
+      print(f"[WARNING] Game state: {self.action} was not followed by a read; chaining its turn/year predictions")
+    predictions = {}
+    turn = values.get("turn")
+    if isinstance(turn, int) and turn > 0:
+      expected = turn - 1 if turn > 1 else "Race Day"
+      predictions["turn"] = (expected, lambda value, turn=turn: value in (turn - 1, "Race Day"))
+    year = next_year(values.get("year", UNKNOWN_YEAR))
+    if year is not None:
+      predictions["year"] = (year, lambda value, year=year: value == year)
+    mood = values.get("mood", "UNKNOWN")
+    if action == "recreation" and mood != "UNKNOWN":
+      predictions["mood"] = (f"{mood} or better", lambda value, mood=mood: MOOD_LIST.index(value) >= MOOD_LIST.index(mood))
+    stat = values.get(training, -1)
+    if action == "train" and stat >= 0:
+      predictions[training] = (f"more than {stat}", lambda value, stat=stat: value > stat)
+    skill_pts = values.get("skill_pts", -1)
+    if action in ("train", "race") and skill_pts >= 0:
+      predictions["skill_pts"] = (f"at least {skill_pts}", lambda value, skill_pts=skill_pts: value >= skill_pts)
+
+    self.predictions = predictions
+    self.action = action if training is None else f"{action} {training}"
+    # Fields expected to change are read even if their pixels look the same
+    for name in predictions:
+      if name not in ("mood", "skill_pts"):
+        self.pixels.pop(name, None)
+
+  def _check_predictions(self):
+    for name, (expected, check) in self.predictions.items():
+      value = self.values.get(name)
+      if value in (None, -1, "UNKNOWN", UNKNOWN_YEAR) or check(value):
+        continue
+      self.contradictions.append({"turn": tracer.current_turn(), "field": name, "expected": expected,
+                                  "read": value, "action": self.action})
+      self.stats["contradictions"] += 1
+      self.invalidate(name)
+      print(f"[WARNING] Game state: {name} read as {value}, expected {expected} after {self.action}")
+    self.predictions = {}
+
+  def get_stats(self):
+    stats = dict(self.stats)
+    stats["fields_per_read"] = stats["fields_read"] / stats["reads"] if stats["reads"] else 0.0
+    return stats
+
+  def format_summary(self):
+    stats = self.get_stats()
+    return (f"Game state: {stats['fields_per_read']:.1f} of {len(FIELDS)} fields read/turn, "
+            f"{stats['contradictions']} contradictions")
+
+# Global game state instance (performance_settings.game_state_tracker off: every field is read every turn)
+game_state = GameState(enabled=use_game_state_tracker)
@@ -0,0 +1,218 @@
+import re
+import threading
+from typing import NamedTuple, Optional
+
+import numpy as np
+import Levenshtein
+from PIL import Image
+
+from bot_core.ocr import extract_batch, OCRJob
+from bot_core.mood_classifier import mood_classifier
+from bot_utils.constants import MOOD_REGION, YEAR_REGION, CRITERIA_REGION, MOOD_LIST
+
+YEAR_STAGES = ("Junior", "Classic", "Senior")
+YEAR_HALVES = ("Early", "Late")
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+class Year(NamedTuple):
+  """Career date as shown in the lobby header"""
+  stage: str                    # "Junior", "Classic", "Senior", "Finale" or "Unknown"
+  month: Optional[str] = None   # "Jan" .. "Dec"; None before the debut and in the finale
+  half: Optional[str] = None    # "Early" or "Late"
+
+  @property
+  def is_pre_debut(self):
+    return self.stage == "Junior" and self.month is None
+
+  @property
+  def is_finale(self):
+    return self.stage == "Finale"
+
+  @property
+  def text(self):
+    if self.is_finale:
+      return "Finale Season"
+    if self.is_pre_debut:
+      return "Junior Year Pre-Debut"
+    if self.month is None:
+      return self.stage
+    return f"{self.stage} Year {self.half} {self.month}"
+
+  def __str__(self):
+    return self.text
+
+UNKNOWN_YEAR = Year("Unknown")
+YEARS = [Year("Junior")] + [Year(stage, month, half) for stage in YEAR_STAGES for month in MONTHS for half in YEAR_HALVES] + [Year("Finale")]
+
+class Criteria(NamedTuple):
+  """Goal banner: whether the current goal still needs work, plus the text as read"""
+  state: str   # "pending" (a goal to work towards), "met" or "achieved"
+  text: str = ""
+
+  @property
+  def pending(self):
+    return self.state == "pending"
+
+# Banner phrases that end the goal; anything else is a goal description
+CRITERIA_PHRASES = {"criteria met": "met", "goal achieved": "achieved"}
+
+SNAP_SCORE = 0.7     # below this the field is reported as unknown
+LEARN_SCORE = 0.85   # OCR snaps at least this good teach the fingerprint table
+CLEAN_TEXT = 0.9            # share of letters, digits, spaces, commas and % in a trusted goal read
+CRITERIA_NEAR_MISS = 0.5    # a goal read this close to an end-of-goal phrase is a garbled one
+
+def normalize_text(text):
+  return " ".join(re.sub(r"[^a-z0-9]+", " ", (text or "").lower()).split())
+
+def snap_year(text):
+  """(Year, score) of the known career date closest to an OCR read"""
+  query = normalize_text(text)
+  best, best_score = UNKNOWN_YEAR, 0.0
+  for year in YEARS:
+    score = Levenshtein.ratio(query, normalize_text(year.text))
+    if score > best_score:
+      best, best_score = year, score
+  return (best, best_score) if best_score >= SNAP_SCORE else (UNKNOWN_YEAR, best_score)
+
+def snap_mood(text):
+  """(MOOD_LIST entry, score) for an OCR read of the mood label"""
+  query = normalize_text(text).upper()
+  moods = [mood for mood in MOOD_LIST if mood != "UNKNOWN"]
+  for mood in moods:
+    if mood in query.split():
+      return mood, 1.0
+  best, best_score = "UNKNOWN", 0.0
+  for word in query.split() or [""]:
+    for mood in moods:
+      score = Levenshtein.ratio(word, mood)
+      if score > best_score:
+        best, best_score = mood, score
+  return (best, best_score) if best_score >= SNAP_SCORE else ("UNKNOWN", best_score)
+
+def snap_criteria(text):
+  """(Criteria, score) for an OCR read of the goal banner"""
+  query = normalize_text(text)
+  best_score = 0.0
+  for phrase, state in CRITERIA_PHRASES.items():
+    score = Levenshtein.ratio(" ".join(query.split()[:2]), phrase)
+    if score >= SNAP_SCORE:
+      return Criteria(state, text), score
+    best_score = max(best_score, score)
+  # Free-form goal descriptions all snap to "pending", but only a clean read is trusted:
+  # a few words, mostly letters and digits, and not a mangled end-of-goal phrase
+  words = query.split()
+  clean = sum(c.isalnum() or c in " ,%" for c in text or "") / max(1, len(text or ""))
+  if len(words) >= 2 and clean >= CLEAN_TEXT and best_score < CRITERIA_NEAR_MISS:
+    return Criteria("pending", text), 1.0
+  return Criteria("pending", text), min(best_score, SNAP_SCORE / 2) if query else 0.0
+
+FINGERPRINT_SIZE = (96, 16)
+MAX_FINGERPRINT_DISTANCE = 0.005   # fraction of differing bits; the game renders a value identically
+MAX_FINGERPRINTS = 256
+
+def fingerprint(img):
+  """Binarized thumbnail of a field crop (text vs. background)"""
+  gray = np.asarray(img.convert("L").resize(FINGERPRINT_SIZE, Image.BOX), dtype=np.float32)
+  return (gray > gray.mean()).ravel()
+
+class FieldLexicon:
+  """
+  Fingerprints of crops already read for one field, and the value each snapped to.
+  classifier (optional) answers first when confident: classify(crop) -> (value,
+  confidence) and learn(crop, value), as bot_core.mood_classifier does.
+  """
+  def __init__(self, name, region, snap, enhance=True, classifier=None):
+    self.name = name
+    self.region = region
+    self.snap = snap
+    self.enhance = enhance
+    self.classifier = classifier
+    self.bits = np.zeros((0, FINGERPRINT_SIZE[0] * FINGERPRINT_SIZE[1]), dtype=bool)
+    self.values = []
+    self._lock = threading.Lock()
+
+  def lookup(self, bits):
+    with self._lock:
+      if not self.values:
+        return None
+      distances = (self.bits != bits).mean(axis=1)
+      best = int(np.argmin(distances))
+      return self.values[best] if distances[best] <= MAX_FINGERPRINT_DISTANCE else None
+
+  def learn(self, bits, value):
+    with self._lock:
+      if len(self.values) >= MAX_FINGERPRINTS:
+        self.bits, self.values = self.bits[1:], self.values[1:]
+      self.bits = np.vstack([self.bits, bits])
+      self.values.append(value)
+
+class LexiconReader:
+  """
+  Reads the lobby's closed-vocabulary fields (mood, year, criteria) as typed values.
+  The mood badge is classified by colour; a crop that looks like one read before is
+  answered from its fingerprint; the rest go to EasyOCR in one batch and are snapped
+  to the nearest known value.
+  """
+  def __init__(self):
+    self.fields = {
+      "mood": FieldLexicon("mood", MOOD_REGION, snap_mood, enhance=False, classifier=mood_classifier),
+      "year": FieldLexicon("year", YEAR_REGION, snap_year),
+      "criteria": FieldLexicon("criteria", CRITERIA_REGION, snap_criteria)
+    }
+    self.stats = {"classifier": 0, "fingerprint": 0, "ocr": 0, "unknown": 0}
+    self.unrecognized = set()   # fields of the latest read whose OCR text snapped below SNAP_SCORE
+
+  def read(self, frame, names=None, extra_jobs=None):
+    """
+    {field: value} for the named fields (default: all) of a FrameSnapshot. extra_jobs
+    ({name: OCRJob}) ride along in the same OCR batch; their OCRResults are added by name.
+    """
+    extra_jobs = extra_jobs or {}
+    names = list(self.fields) if names is None else names
+    self.unrecognized = set()
+    values = {}
+    misses = []
+    for name in names:
+      field = self.fields[name]
+      crop = frame.crop(field.region)
+      if field.classifier is not None:
+        value, confidence = field.classifier.classify(crop)
+        if confidence >= field.classifier.min_confidence:
+          self.stats["classifier"] += 1
+          values[name] = value
+          continue
+      bits = fingerprint(crop)
+      value = field.lookup(bits)
+      if value is not None:
+        self.stats["fingerprint"] += 1
+        values[name] = value
+      else:
+        misses.append((field, crop, bits))
+
+    if misses or extra_jobs:
+      jobs = [OCRJob(field.region, "text", enhance=field.enhance) for field, _, _ in misses] + list(extra_jobs.values())
+      results = extract_batch(jobs, frame)
+      values.update(zip(extra_jobs, results[len(misses):]))
+      for (field, crop, bits), result in zip(misses, results):
+        value, score = field.snap(result.text)
+        self.stats["ocr"] += 1
+        if score < SNAP_SCORE:
+          self.stats["unknown"] += 1
+          self.unrecognized.add(field.name)
+          print(f"[WARNING] {field.name.capitalize()} not recognized: {result.text}")
+        elif score >= LEARN_SCORE:
+          field.learn(bits, value)
+          if field.classifier is not None:
+            field.classifier.learn(crop, value)
+        values[field.name] = value
+    return values
+
+  def get_stats(self):
+    stats = dict(self.stats)
+    reads = stats["classifier"] + stats["fingerprint"] + stats["ocr"]
+    stats["fingerprint_rate"] = stats["fingerprint"] / reads if reads else 0.0
+    stats["ocr_rate"] = stats["ocr"] / reads if reads else 0.0
+    return stats
+
+# Global lexicon reader instance
+lexicon_reader = LexiconReader()
@@ -1,5 +1,6 @@
 import bot_core.state as state
 from bot_core.state import check_current_year, stat_state
+from bot_utils.tracing import tracer
 
 # Helper function to get max failure with default
 def get_max_failure():
@@ -194,11 +195,8 @@ def balanced_training(results):
   return best_key
 
 # Training logic: Point-based system
-def point_based_training(results):
+def point_based_training(results, mood=None):
   """Advanced point-based training system with supporter recognition"""
-  from bot_core.recognizer import match_template
-  from bot_core.state import check_mood
-  
   max_failure = get_max_failure()
   safe_trainings = {
     stat: data for stat, data in results.items()
@@ -226,15 +224,13 @@ def point_based_training(results):
   print(f"\n[INFO] Best training: {best_key.upper()} with {best_points:.1f} points")
   
   # Check if we should do recreation instead
-  if should_do_recreation(best_points):
+  if should_do_recreation(best_points, mood):
     return "recreation"
   
   return best_key
 
 def calculate_training_points(stat, data):
   """Calculate points for a specific training"""
-  from bot_core.recognizer import match_template
-  
   # Validate input data structure
   if not isinstance(data, dict):
     print(f"[ERROR] Invalid data structure for {stat}: {type(data)}")
@@ -257,7 +253,7 @@ def calculate_training_points(stat, data):
     return 0.0
   
   # Add special supporter bonuses
-  points += calculate_special_supporter_bonuses(support_details)
+  points += calculate_special_supporter_bonuses(data, support_details)
   
   # Speed and Wit training bonus (+0.5 points)
   if stat.lower() in ["spd", "wit"]:
@@ -270,43 +266,39 @@ def calculate_training_points(stat, data):
   print(f"[INFO] {stat.upper()}: {points:.1f} points ({', '.join(support_details)})")
   return points
 
-def calculate_special_supporter_bonuses(support_details):
-  """Calculate bonuses from special supporters"""
-  from bot_core.recognizer import match_template
-  
+def calculate_special_supporter_bonuses(data, support_details):
+  """Calculate bonuses from the special supporters check_training counted in this training"""
   bonus_points = 0.0
   
   try:
+    special_counts = data.get("special", {})
+
     # Kitasan Black (1.5 points)
-    kitasan_matches = match_template("game_assets/icons/kitasan.png", threshold=0.8)
-    if kitasan_matches:
-      kitasan_count = len(kitasan_matches)
+    kitasan_count = special_counts.get("kitasan", 0)
+    if kitasan_count:
       bonus_points += kitasan_count * 0.5  # 1.5 - 1.0 base = 0.5 extra
       support_details.append(f"{kitasan_count} Kitasan (+{kitasan_count * 0.5})")
     
     # Exclamation mark supporters (1.5 points)
-    exclamation_matches = match_template("game_assets/icons/exclamation_mark.png", threshold=0.8)
-    if exclamation_matches:
-      exclamation_count = len(exclamation_matches)
+    exclamation_count = special_counts.get("exclamation", 0)
+    if exclamation_count:
       bonus_points += exclamation_count * 0.5  # 1.5 - 1.0 base = 0.5 extra
       support_details.append(f"{exclamation_count} Exclamation supporters (+{exclamation_count * 0.5})")
     
     # Director (0.5 points instead of 1.0)
-    director_matches = match_template("game_assets/icons/director.png", threshold=0.8)
-    if director_matches:
-      director_count = len(director_matches)
+    director_count = special_counts.get("director", 0)
+    if director_count:
       bonus_points -= director_count * 0.5  # 0.5 - 1.0 base = -0.5
       support_details.append(f"{director_count} Director (-{director_count * 0.5})")
     
     # Otonashi (0.5 points instead of 1.0)
-    otonashi_matches = match_template("game_assets/icons/otonashi.png", threshold=0.8)
-    if otonashi_matches:
-      otonashi_count = len(otonashi_matches)
+    otonashi_count = special_counts.get("otonashi", 0)
+    if otonashi_count:
       bonus_points -= otonashi_count * 0.5  # 0.5 - 1.0 base = -0.5
       support_details.append(f"{otonashi_count} Otonashi (-{otonashi_count * 0.5})")
       
   except Exception as e:
-    print(f"[WARNING] Error detecting special supporters: {e}")
+    print(f"[WARNING] Error scoring special supporters: {e}")
   
   return bonus_points
 
@@ -357,12 +349,13 @@ def calculate_rainbow_bonuses(stat, data, support_details):
       return 4.0  # 5.0 - 1.0 base = 4.0 extra
   return 0.0
 
-def should_do_recreation(best_points):
-  """Check if recreation should be done instead of training"""
-  from bot_core.state import check_mood
-  
+def should_do_recreation(best_points, mood=None):
+  """Check if recreation should be done instead of training (mood: as read in the lobby)"""
   if best_points < 3.0:
-    current_mood = check_mood()
+    current_mood = mood
+    if current_mood is None:
+      from bot_core.state import check_mood
+      current_mood = check_mood()
     if current_mood != "GREAT":
       threshold_text = "moderate" if 2.5 <= best_points < 3.0 else "low"
       print(f"\n[INFO] Training points ({best_points:.1f}) are {threshold_text} and mood is {current_mood} (not GREAT). Doing recreation for 20% bonus.")
@@ -370,7 +363,7 @@ def should_do_recreation(best_points):
   return False
 
 # Training logic selector
-def select_training_logic(logic_type, results):
+def select_training_logic(logic_type, results, mood=None, year=None):
   """Select training based on chosen logic type"""
   if logic_type == "most_support":
     return most_support_card(results)
@@ -379,13 +372,14 @@ def select_training_logic(logic_type, results):
   elif logic_type == "rainbow_only":
     return rainbow_only_training(results, state.get_rainbow_strict())
   elif logic_type == "point_based":
-    return point_based_training(results)
+    return point_based_training(results, mood)
   elif logic_type == "balanced":
     return balanced_training(results)
   else:  # auto or unknown
     # Default auto logic (year-based)
-    year = check_current_year()
-    if "Junior Year" in year:
+    if year is None:
+      year = check_current_year()
+    if year.stage == "Junior":
       return most_support_card(results)
     else:
       result = rainbow_training(results)
@@ -395,8 +389,10 @@ def select_training_logic(logic_type, results):
       return result
   
 # Decide training
-def do_something(results, training_logic="auto"):
-  current_stats = stat_state()
+@tracer.span("logic")
+def do_something(results, training_logic="auto", mood=None, stats=None, year=None):
+  """Pick a training; mood, stats and year are the lobby's (read here when not given)"""
+  current_stats = stat_state() if stats is None else stats
   print(f"Current stats: {current_stats}")
   print(f"Training logic: {training_logic}")
 
@@ -406,4 +402,4 @@ def do_something(results, training_logic="auto"):
     print("[INFO] All stats capped or no valid training.")
     return None
 
-  return select_training_logic(filtered, training_logic)
+  return select_training_logic(training_logic, filtered, mood, year)
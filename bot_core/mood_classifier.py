@@ -0,0 +1,98 @@
+import os
+import threading
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from bot_utils.constants import MOOD_LIST
+
+MOOD_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'game_assets', 'moods'))
+HUE_BINS = 18           # OpenCV hue runs 0-179: 10 degrees per bin
+MIN_SATURATION = 80     # badge pixels; the white label text and grey background are left out
+MIN_VALUE = 80
+MAX_DISTANCE = 0.6      # L1 distance (0-2) beyond which a badge matches no known mood
+MIN_CONFIDENCE = 0.5
+MAX_SAMPLES = 64        # per mood; older samples are averaged away once this is reached
+
+def mood_signature(img):
+  """Hue histogram of the coloured pixels of a MOOD_REGION crop (PIL), plus their share of the crop"""
+  rgb = np.asarray(img.convert("RGB"))
+  hsv = cv2.cvtColor(rgb, cv2.COLOR_RGB2HSV)
+  mask = cv2.inRange(hsv, (0, MIN_SATURATION, MIN_VALUE), (179, 255, 255))
+  hist = cv2.calcHist([hsv], [0], mask, [HUE_BINS], [0, 180]).ravel()
+  colored = hist.sum()
+  if colored:
+    hist /= colored
+  return np.append(hist, colored / mask.size).astype(np.float32)
+
+class MoodClassifier:
+  """
+  Mood badge by colour. Every mood has its own badge colour, so the hue histogram of
+  MOOD_REGION is compared with one mean histogram per mood. Means come from reference
+  crops in game_assets/moods/<MOOD>/*.png (see tools/bench_mood.py) and from mood
+  labels OCR read with confidence during a run.
+  """
+  def __init__(self, mood_dir=MOOD_DIR, max_distance=MAX_DISTANCE, min_confidence=MIN_CONFIDENCE):
+    self.mood_dir = mood_dir
+    self.max_distance = max_distance
+    self.min_confidence = min_confidence
+    self.sums = {}
+    self.counts = {}
+    self._lock = threading.Lock()
+    self.load_references()
+
+  @property
+  def moods(self):
+    return sorted(self.counts, key=MOOD_LIST.index)
+
+  def load_references(self):
+    """Learn the reference crops in mood_dir (one folder per MOOD_LIST entry)"""
+    if not self.mood_dir or not os.path.isdir(self.mood_dir):
+      return
+    for mood in MOOD_LIST:
+      folder = os.path.join(self.mood_dir, mood)
+      if mood == "UNKNOWN" or not os.path.isdir(folder):
+        continue
+      for filename in sorted(os.listdir(folder)):
+        if filename.lower().endswith(".png"):
+          with Image.open(os.path.join(folder, filename)) as img:
+            self.learn_signature(mood_signature(img), mood)
+
+  def learn_signature(self, signature, mood):
+    with self._lock:
+      count = self.counts.get(mood, 0)
+      if count >= MAX_SAMPLES:
+        # Keep a running mean instead of growing the count without bound
+        self.sums[mood] *= (MAX_SAMPLES - 1) / MAX_SAMPLES
+        count = MAX_SAMPLES - 1
+      self.sums[mood] = self.sums.get(mood, 0) + signature
+      self.counts[mood] = count + 1
+
+  def learn(self, img, mood):
+    """Add a MOOD_REGION crop known to show mood"""
+    if mood in MOOD_LIST and mood != "UNKNOWN":
+      self.learn_signature(mood_signature(img), mood)
+
+  def classify_signature(self, signature):
+    """(mood, confidence): the nearest mood mean, confidence from how much nearer it is than the runner-up"""
+    with self._lock:
+      means = [(mood, self.sums[mood] / count) for mood, count in self.counts.items()]
+    if not means:
+      return "UNKNOWN", 0.0
+    distances = sorted((float(np.abs(mean - signature).sum()), mood) for mood, mean in means)
+    best, mood = distances[0]
+    if best > self.max_distance:
+      return "UNKNOWN", 0.0
+    if len(distances) == 1:
+      # Nothing to tell it apart from yet
+      return mood, 0.0
+    runner_up = distances[1][0]
+    return mood, 1.0 - best / runner_up if runner_up else 0.0
+
+  def classify(self, img):
+    """(MOOD_LIST entry, confidence 0-1) for a MOOD_REGION crop (PIL)"""
+    return self.classify_signature(mood_signature(img))
+
+# Global mood classifier instance
+mood_classifier = MoodClassifier()
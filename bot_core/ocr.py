@@ -1,9 +1,11 @@
-import easyocr
 from PIL import Image
 import numpy as np
 import re
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional
 
-import easyocr
 import sys
 import os
 
@@ -11,24 +13,180 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'bot_utils'))
 
 try:
-    from config_manager import should_use_gpu
-    use_gpu = should_use_gpu()
-    print(f"OCR initialized with GPU: {use_gpu}")
+    from config_manager import should_use_gpu, get_performance_settings
+    use_digit_reader = get_performance_settings()['digit_reader']
+    ocr_cache_size = get_performance_settings()['ocr_cache_size']
 except ImportError:
-    use_gpu = False
-    print("OCR initialized with GPU: False (config_manager not available)")
+    should_use_gpu = None
+    use_digit_reader = True
+    ocr_cache_size = 512
 
-reader = easyocr.Reader(["en"], gpu=use_gpu)
+from bot_core.digit_reader import digit_reader
+from bot_utils.tracing import tracer
 
-def extract_text(pil_img: Image.Image) -> str:
+# The EasyOCR reader (torch model) is created lazily: importing this module stays cheap
+_reader = None
+_reader_lock = threading.Lock()
+_reader_thread = None
+reader_status = "not loaded"  # "not loaded" -> "loading" -> "ready" / "failed"
+# One inference at a time: reads can come from the bot thread and worker threads
+_inference_lock = threading.Lock()
+
+def get_reader():
+  """EasyOCR reader, loaded on first use (blocks until it is ready)"""
+  global _reader, reader_status
+  if _reader is not None:
+    return _reader
+  with _reader_lock:
+    if _reader is None:
+      reader_status = "loading"
+      try:
+        import easyocr
+        use_gpu = should_use_gpu() if should_use_gpu else False
+        _reader = easyocr.Reader(["en"], gpu=use_gpu)
+        reader_status = "ready"
+        print(f"OCR initialized with GPU: {use_gpu}")
+      except Exception:
+        reader_status = "failed"
+        raise
+  return _reader
+
+def run_reader(method, *args, **kwargs):
+  """Call an EasyOCR reader method (readtext, recognize, ...) under the inference lock"""
+  reader = get_reader()
+  with _inference_lock:
+    return getattr(reader, method)(*args, **kwargs)
+
+def warm_up_reader():
+  """Start loading the reader in a background thread; returns immediately"""
+  global _reader_thread
+  if _reader is not None or (_reader_thread and _reader_thread.is_alive()):
+    return
+
+  def load():
+    try:
+      get_reader()
+    except Exception as e:
+      print(f"[ERROR] OCR reader failed to load: {e}")
+
+  _reader_thread = threading.Thread(target=load, daemon=True)
+  _reader_thread.start()
+
+def is_reader_ready() -> bool:
+  return _reader is not None
+
+def get_reader_status() -> str:
+  return reader_status
+
+class OCRCache:
+  """
+  LRU cache of OCR results keyed by a hash of the (preprocessed) crop pixels plus
+  the read settings, so fields that did not change skip EasyOCR entirely.
+  """
+  def __init__(self, max_entries=512):
+    self.max_entries = max_entries
+    self.hits = 0
+    self.misses = 0
+    self._entries = OrderedDict()
+    self._lock = threading.Lock()
+
+  @staticmethod
+  def key(img_np, *settings):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((img_np.shape, img_np.dtype.str) + settings).encode())
+    digest.update(np.ascontiguousarray(img_np).data)
+    return digest.digest()
+
+  def get(self, key):
+    """Cached value, or None on a miss"""
+    with self._lock:
+      if key in self._entries:
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return self._entries[key]
+      self.misses += 1
+      return None
+
+  def put(self, key, value):
+    if self.max_entries <= 0:
+      return
+    with self._lock:
+      self._entries[key] = value
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.max_entries:
+        self._entries.popitem(last=False)
+
+  def clear(self):
+    with self._lock:
+      self._entries.clear()
+      self.hits = 0
+      self.misses = 0
+
+  def get_stats(self):
+    total = self.hits + self.misses
+    return {
+      "entries": len(self._entries),
+      "max_entries": self.max_entries,
+      "hits": self.hits,
+      "misses": self.misses,
+      "hit_rate": self.hits / total if total else 0.0
+    }
+
+# Global OCR result cache
+ocr_cache = OCRCache(ocr_cache_size)
+
+def get_ocr_cache_stats():
+  return ocr_cache.get_stats()
+
+@tracer.span("ocr")
+def extract_text(pil_img: Image.Image, detect: bool = True, cache: bool = True) -> str:
   img_np = np.array(pil_img)
-  result = reader.readtext(img_np)
+  if cache:
+    key = ocr_cache.key(img_np, "text", detect)
+    cached = ocr_cache.get(key)
+    if cached is not None:
+      return cached
+
+  result = run_reader("readtext", img_np) if detect else recognize_only(img_np)
   texts = [text[1] for text in result]
-  return " ".join(texts)
+  text = " ".join(texts)
+  if cache:
+    ocr_cache.put(key, text)
+  return text
 
-def extract_number(pil_img: Image.Image) -> int:
+def read_digits(pil_img: Image.Image):
+  """Glyph-template digit read as (value, confidence); value is None when EasyOCR should be used instead"""
+  if not (use_digit_reader and digit_reader.available):
+    return None, 0.0
+  value, confidence = digit_reader.read(pil_img)
+  if value is None or confidence < digit_reader.min_confidence:
+    return None, confidence
+  return value, confidence
+
+@tracer.span("ocr")
+def extract_number(pil_img: Image.Image, detect: bool = True, cache: bool = True) -> int:
   img_np = np.array(pil_img)
-  result = reader.readtext(img_np, allowlist="0123456789")
+  if cache:
+    key = ocr_cache.key(img_np, "number", detect)
+    cached = ocr_cache.get(key)
+    if cached is not None:
+      return cached
+
+  value = _extract_number(pil_img, img_np, detect)
+  if cache:
+    ocr_cache.put(key, value)
+  return value
+
+def _extract_number(pil_img, img_np, detect):
+  value, _ = read_digits(pil_img)
+  if value is not None:
+    return value
+
+  if detect:
+    result = run_reader("readtext", img_np, allowlist="0123456789")
+  else:
+    # Fixed-layout field: the crop already is the text box
+    result = recognize_only(img_np, allowlist="0123456789")
   texts = [text[1] for text in result]
   joined_text = "".join(texts)
 
@@ -38,3 +196,141 @@ def extract_number(pil_img: Image.Image) -> int:
     return int(digits)
   
   return -1
+
+DIGITS = "0123456789"
+
+def recognize_only(img_np, allowlist=None):
+  """Run only the EasyOCR recognizer on an image that is exactly one line of text (no detection)"""
+  if img_np.ndim == 3:
+    img_np = np.array(Image.fromarray(img_np).convert("L"))
+  height, width = img_np.shape[:2]
+  return run_reader("recognize", img_np, horizontal_list=[[0, width, 0, height]], free_list=[], allowlist=allowlist)
+
+class OCRJob(NamedTuple):
+  region: object                  # (left, top, right, bottom) on the frame, or a ready PIL image
+  mode: str = "text"              # "text" -> str value, "number" -> int value (-1 when unreadable)
+  allowlist: Optional[str] = None # defaults to digits in number mode
+  enhance: bool = True            # apply the enhanced_screenshot preprocessing
+  detect: bool = True             # False: region is exactly one text line, skip the text detector
+  cache: bool = True              # reuse the result of an identical earlier crop
+
+class OCRResult(NamedTuple):
+  text: str
+  value: object
+  confidence: float
+
+def _job_image(job, frame):
+  from bot_utils.screenshot import enhance_image
+
+  img = job.region if isinstance(job.region, Image.Image) else frame.crop(job.region)
+  if job.enhance:
+    img = enhance_image(img)
+  return img.convert("L")
+
+def _pad_to(img, height, width):
+  # Pad with the border colour so the detector doesn't see a fake edge
+  if img.shape == (height, width):
+    return img
+  border = np.concatenate([img[0], img[-1], img[:, 0], img[:, -1]])
+  canvas = np.full((height, width), int(np.median(border)), dtype=np.uint8)
+  canvas[:img.shape[0], :img.shape[1]] = img
+  return canvas
+
+def _stack(images, gap=8):
+  """Stack crops vertically on one canvas; returns it with each crop's [x_min, x_max, y_min, y_max]"""
+  width = max(img.shape[1] for img in images)
+  height = sum(img.shape[0] for img in images) + gap * (len(images) - 1)
+  border = np.concatenate([img[0] for img in images] + [img[-1] for img in images])
+  canvas = np.full((height, width), int(np.median(border)), dtype=np.uint8)
+  boxes = []
+  y = 0
+  for img in images:
+    canvas[y:y + img.shape[0], :img.shape[1]] = img
+    boxes.append([0, img.shape[1], y, y + img.shape[0]])
+    y += img.shape[0] + gap
+  return canvas, boxes
+
+def _recognize_batch(images, allowlist):
+  """Recognizer-only pass over many fixed boxes in one call; one detection list per image"""
+  canvas, boxes = _stack(images)
+  recognized = run_reader("recognize", canvas, horizontal_list=boxes, free_list=[], allowlist=allowlist)
+  batch = [[] for _ in images]
+  for item in recognized:
+    # Map each result back to its crop by the vertical centre of its box
+    center_y = sum(point[1] for point in item[0]) / len(item[0])
+    for index, (_, _, y_min, y_max) in enumerate(boxes):
+      if y_min <= center_y <= y_max:
+        batch[index].append(item)
+        break
+  return batch
+
+def _to_result(job, detections):
+  texts = [text for _, text, _ in detections]
+  confidence = float(np.mean([conf for _, _, conf in detections])) if detections else 0.0
+  if job.mode == "number":
+    joined = "".join(texts)
+    digits = re.sub(r"[^\d]", "", joined)
+    return OCRResult(joined, int(digits) if digits else -1, confidence)
+  joined = " ".join(texts)
+  return OCRResult(joined, joined, confidence)
+
+@tracer.span("ocr")
+def extract_batch(jobs, frame=None):
+  """
+  Read many regions with one EasyOCR call per allowlist (and per detect setting).
+  jobs is a list of OCRJob or (region, mode, allowlist) tuples; regions are cropped from
+  frame (a FrameSnapshot, default: the shared snapshot). Jobs with detect=False skip the
+  text detector and only run the recognizer. Crops identical to an earlier read come
+  from ocr_cache unless the job sets cache=False. Returns OCRResults in job order.
+  """
+  jobs = [job if isinstance(job, OCRJob) else OCRJob(*job) for job in jobs]
+  if not jobs:
+    return []
+  if frame is None and not all(isinstance(job.region, Image.Image) for job in jobs):
+    from monitor_manager import monitor_manager
+    frame = monitor_manager.get_frame()
+
+  groups = {}
+  for index, job in enumerate(jobs):
+    allowlist = job.allowlist if job.allowlist is not None else (DIGITS if job.mode == "number" else None)
+    groups.setdefault((allowlist, job.detect), []).append(index)
+
+  results = [None] * len(jobs)
+  keys = {}
+  for (allowlist, detect), indices in groups.items():
+    images = {i: _job_image(jobs[i], frame) for i in indices}
+
+    # Unchanged crops come straight from the cache
+    for i in indices:
+      if jobs[i].cache:
+        keys[i] = ocr_cache.key(np.array(images[i]), jobs[i].mode, allowlist, detect)
+        results[i] = ocr_cache.get(keys[i])
+    indices = [i for i in indices if results[i] is None]
+
+    # Number fields the digit reader is confident about never reach EasyOCR
+    for i in indices:
+      if jobs[i].mode == "number":
+        value, confidence = read_digits(images[i])
+        if value is not None:
+          results[i] = OCRResult(str(value), value, confidence)
+          if i in keys:
+            ocr_cache.put(keys[i], results[i])
+    indices = [i for i in indices if results[i] is None]
+    if not indices:
+      continue
+
+    images = [np.array(images[i]) for i in indices]
+    if not detect:
+      batch = _recognize_batch(images, allowlist)
+    elif len(images) == 1:
+      batch = [run_reader("readtext", images[0], allowlist=allowlist)]
+    else:
+      # readtext_batched needs equally sized images
+      height = max(img.shape[0] for img in images)
+      width = max(img.shape[1] for img in images)
+      batch = run_reader("readtext_batched", [_pad_to(img, height, width) for img in images], allowlist=allowlist)
+    for i, detections in zip(indices, batch):
+      results[i] = _to_result(jobs[i], detections)
+      if i in keys:
+        ocr_cache.put(keys[i], results[i])
+  return results
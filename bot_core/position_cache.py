@@ -0,0 +1,125 @@
+import time
+
+from monitor_manager import monitor_manager
+from bot_core.recognizer import match_template, multi_match_templates, wait_for, wait_stats
+from bot_core.template_cache import template_cache
+from bot_utils.input_sink import input_sink
+from bot_utils.tracing import tracer
+
+VERIFY_MARGIN = 12   # pixels around the last known box searched to confirm it (hovered buttons lift a little)
+POLL_INTERVAL = 0.1
+
+class PositionCache:
+  """
+  Last known position of UI elements, per screen type. A cached element is confirmed
+  with a template match in a small window around where it was; only a miss (or an
+  element not seen yet) pays for the wide search, whose result replaces the entry.
+  """
+  def __init__(self, margin=VERIFY_MARGIN):
+    self.margin = margin
+    self.entries = {}        # (screen type, template) -> last (x, y, w, h) in monitor coordinates
+    self.search_costs = {}   # (screen type, template) -> seconds of the latest wide search
+    self.stats = {"hits": 0, "misses": 0, "searches": 0, "saved_seconds": 0.0}
+
+  def _key(self, template_path, screen_type):
+    return screen_type, template_cache.normalize_name(template_path)
+
+  def verify(self, template_path, screen_type, threshold=0.8):
+    """Scored boxes of the element at its cached position (empty when not cached or gone)"""
+    key = self._key(template_path, screen_type)
+    box = self.entries.get(key)
+    if box is None:
+      return []
+
+    start = time.perf_counter()
+    x, y, w, h = box
+    region = (max(0, x - self.margin), max(0, y - self.margin), x + w + self.margin, y + h + self.margin)
+    boxes = match_template(template_path, region=region, threshold=threshold, scored=True)
+    elapsed = time.perf_counter() - start
+
+    if not boxes:
+      self.stats["misses"] += 1
+      del self.entries[key]
+      return []
+    boxes = [(bx + region[0], by + region[1], bw, bh, score) for bx, by, bw, bh, score in boxes]
+    self.entries[key] = boxes[0][:4]
+    saved = max(0.0, self.search_costs.get(key, 0.0) - elapsed)
+    self.stats["hits"] += 1
+    self.stats["saved_seconds"] += saved
+    tracer.note("position_saved", saved)
+    return boxes
+
+  def store(self, template_path, screen_type, boxes, search_seconds):
+    """Remember the best box of a wide search and what that search cost"""
+    key = self._key(template_path, screen_type)
+    self.stats["searches"] += 1
+    self.search_costs[key] = search_seconds
+    if boxes:
+      self.entries[key] = boxes[0][:4]
+
+  def locate(self, template_path, screen_type, threshold=0.8, timeout=0.0):
+    """
+    Scored boxes of an element in monitor coordinates, best first: the cached position
+    if it still matches, else recognizer.wait_for (polling up to timeout seconds).
+    """
+    boxes = self.verify(template_path, screen_type, threshold)
+    if boxes:
+      return boxes
+    boxes = wait_for(template_path, threshold=threshold, timeout=timeout)
+    self.store(template_path, screen_type, boxes, wait_stats["last_search"])
+    return boxes
+
+  def locate_any(self, templates, screen_type, threshold=0.8, timeout=0.0):
+    """
+    First element of templates ({name: path}, in priority order) that is on screen, as
+    (name, scored boxes) or (None, []). Cached positions are tried first; the wide search
+    matches the whole set in one multi_match_templates pass per poll.
+    """
+    for name, path in templates.items():
+      boxes = self.verify(path, screen_type, threshold)
+      if boxes:
+        return name, boxes
+
+    deadline = input_sink.now() + timeout
+    polls = 0
+    while True:
+      if polls:
+        monitor_manager.refresh_frame()
+      polls += 1
+      search_start = time.perf_counter()
+      matches = multi_match_templates(templates, screen=monitor_manager.get_frame().image, threshold=threshold, scored=True)
+      search_seconds = time.perf_counter() - search_start
+      found = [name for name in templates if matches[name]]
+      if found or input_sink.now() >= deadline:
+        break
+      input_sink.sleep(POLL_INTERVAL)
+
+    for name in found:
+      self.store(templates[name], screen_type, matches[name], search_seconds)
+    if not found:
+      self.stats["searches"] += 1
+      return None, []
+    return found[0], matches[found[0]]
+
+  def invalidate(self, screen_type=None):
+    """Forget cached positions (of one screen type), e.g. after the game window moved"""
+    if screen_type is None:
+      self.entries.clear()
+    else:
+      self.entries = {key: box for key, box in self.entries.items() if key[0] != screen_type}
+
+  def get_stats(self):
+    """Hits/misses of cached positions, hit rate, and time saved overall and per traced turn"""
+    stats = dict(self.stats)
+    verified = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / verified if verified else 0.0
+    stats["saved_per_turn"] = tracer.get_note_mean("position_saved")
+    return stats
+
+  def format_summary(self):
+    stats = self.get_stats()
+    return (f"Position cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%}), "
+            f"{stats['saved_per_turn'] * 1000:.0f} ms saved/turn")
+
+# Global position cache instance
+position_cache = PositionCache()
@@ -1,59 +1,311 @@
+import time
+
 import cv2
 import numpy as np
 from PIL import ImageGrab, ImageStat
 from monitor_manager import monitor_manager
 
 from bot_utils.screenshot import capture_region
+from bot_core.template_cache import template_cache
+from bot_utils.constants import TEMPLATE_ROIS
+from bot_utils.tracing import tracer
+from bot_utils.input_sink import input_sink
 
-def match_template(template_path, region=None, threshold=0.85):
-  # Get screenshot using monitor manager
-  if region:
-    screen = np.array(monitor_manager.get_screenshot(region=region))
-  else:
-    screen = np.array(monitor_manager.get_screenshot())
-  screen = cv2.cvtColor(screen, cv2.COLOR_RGB2BGR)
-
-  # Load template
-  template = cv2.imread(template_path, cv2.IMREAD_COLOR)  # safe default
-  if template.shape[2] == 4:
-    template = cv2.cvtColor(template, cv2.COLOR_BGRA2BGR)
-  result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
-  loc = np.where(result >= threshold)
+# Pixels handed to cv2.matchTemplate, compared to what full-frame searches would have cost
+scan_stats = {"searches": 0, "pixels_scanned": 0, "full_frame_pixels": 0, "fallbacks": 0}
+
+def get_scan_stats():
+  """Template matching scan statistics (pixels scanned vs. full-frame equivalent)"""
+  stats = dict(scan_stats)
+  full = stats["full_frame_pixels"]
+  stats["saved_ratio"] = 1 - stats["pixels_scanned"] / full if full else 0.0
+  return stats
+
+def reset_scan_stats():
+  for key in scan_stats:
+    scan_stats[key] = 0
+
+def get_template_roi(template_path):
+  """Declared search region for an asset (bot_utils.constants.TEMPLATE_ROIS), or None"""
+  return TEMPLATE_ROIS.get(template_cache.normalize_name(template_path))
 
+def to_bgr(pil_img):
+  return cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+
+def _match_in(screen_bgr, template, threshold, roi=None, frame_pixels=None):
+  """Match one template inside roi of a BGR image; scored boxes come back in that image's coordinates"""
+  offset_x, offset_y = 0, 0
+  if roi:
+    left, top, right, bottom = roi
+    left, top = max(0, left), max(0, top)
+    screen_bgr = screen_bgr[top:bottom, left:right]
+    offset_x, offset_y = left, top
+
+  sh, sw = screen_bgr.shape[:2]
   h, w = template.shape[:2]
-  boxes = [(x, y, w, h) for (x, y) in zip(*loc[::-1])]
+  scan_stats["searches"] += 1
+  scan_stats["pixels_scanned"] += sh * sw
+  scan_stats["full_frame_pixels"] += sh * sw if frame_pixels is None else frame_pixels
+  if sh < h or sw < w:
+    return []
+
+  result = cv2.matchTemplate(screen_bgr, template, cv2.TM_CCOEFF_NORMED)
+  xs, ys, scores = extract_peaks(result, threshold)
+  return [(int(x) + offset_x, int(y) + offset_y, w, h, float(score)) for x, y, score in zip(xs, ys, scores)]
+
+def _strip_scores(boxes):
+  return [box[:4] for box in boxes]
+
+@tracer.span("match")
+def match_template(template_path, region=None, threshold=0.85, fallback=True, scored=False, frame=None):
+  """
+  Find a template in frame (a FrameSnapshot, default: the current one), best match first.
+  With an explicit region, boxes are relative to that region. Otherwise the asset's
+  declared ROI is searched (boxes in monitor coordinates), falling back to the full
+  frame on a miss unless fallback is False. scored=True returns (x, y, w, h, score).
+  """
+  boxes = _match_template_scored(template_path, region, threshold, fallback, frame)
+  return boxes if scored else _strip_scores(boxes)
+
+def _match_template_scored(template_path, region, threshold, fallback, frame=None):
+  # Cached, pre-converted template
+  cached = template_cache.get(template_path)
+  if cached is None:
+    return []
+
+  if frame is None:
+    frame = monitor_manager.get_frame()
+  frame_pixels = frame.image.width * frame.image.height
+
+  if region:
+    # Crop from the shared frame snapshot
+    screen = to_bgr(frame.crop(region))
+    return _match_in(screen, cached.bgr, threshold, frame_pixels=frame_pixels)
+
+  roi = get_template_roi(template_path)
+  if roi:
+    screen = to_bgr(frame.crop(roi))
+    boxes = _match_in(screen, cached.bgr, threshold, frame_pixels=frame_pixels)
+    left, top = max(0, roi[0]), max(0, roi[1])
+    boxes = [(x + left, y + top, w, h, score) for x, y, w, h, score in boxes]
+    if boxes or not fallback:
+      return boxes
+    scan_stats["fallbacks"] += 1
+
+  screen = to_bgr(frame.image)
+  boxes = _match_in(screen, cached.bgr, threshold, frame_pixels=frame_pixels)
+  if roi and boxes:
+    report_roi_miss(template_path, roi, boxes[0])
+  return boxes
+
+# Templates whose declared ROI missed a match the full-frame fallback found (logged once each)
+roi_misses = {}
+
+def report_roi_miss(template_path, roi, box):
+  """Log a match found outside the ROI searched first, so the ROI can be corrected"""
+  name = template_cache.normalize_name(template_path)
+  if name not in roi_misses:
+    print(f"[WARNING] {name} found at {tuple(box[:4])}, outside its ROI {tuple(roi)}; check TEMPLATE_ROIS")
+  roi_misses[name] = tuple(box[:4])
+
+# Time spent polling in wait_for, overall and for the latest call (last_search: matching cost of its final poll)
+wait_stats = {"calls": 0, "found": 0, "polls": 0, "waited": 0.0, "last_template": None, "last_wait": 0.0, "last_search": 0.0}
 
-  return deduplicate_boxes(boxes)
+def get_wait_stats():
+  return dict(wait_stats)
 
-def multi_match_templates(templates, screen=None, threshold=0.85):
+@tracer.span("wait")
+def wait_for(template_path, roi=None, timeout=0.0, poll_hz=10, threshold=0.8, fallback=True):
+  """
+  Poll the selected monitor until template_path shows up or timeout seconds pass.
+  Searches roi (monitor-relative left, top, right, bottom), or the asset's declared
+  ROI when roi is None; with fallback, the last poll also searches the full frame.
+  Returns scored (x, y, w, h, score) boxes in monitor coordinates, best first
+  (empty when not found). The time waited is recorded in wait_stats.
+  """
+  start = input_sink.now()
+  deadline = start + timeout
+  polls = 0
+  while True:
+    # First poll reuses the current snapshot; later polls need a new frame
+    if polls:
+      monitor_manager.refresh_frame()
+    polls += 1
+    last = input_sink.now() >= deadline
+    search_start = time.perf_counter()
+    if roi:
+      boxes = _match_template_scored(template_path, roi, threshold, False)
+      left, top = max(0, roi[0]), max(0, roi[1])
+      boxes = [(x + left, y + top, w, h, score) for x, y, w, h, score in boxes]
+      if not boxes and fallback and last:
+        boxes = _match_template_scored(template_path, None, threshold, True)
+        if boxes:
+          report_roi_miss(template_path, roi, boxes[0])
+    else:
+      boxes = _match_template_scored(template_path, None, threshold, fallback and last)
+    search_seconds = time.perf_counter() - search_start
+    if boxes or last:
+      break
+    input_sink.sleep(1 / poll_hz)
+
+  waited = input_sink.now() - start
+  wait_stats["calls"] += 1
+  wait_stats["found"] += bool(boxes)
+  wait_stats["polls"] += polls
+  wait_stats["waited"] += waited
+  wait_stats["last_template"] = template_path
+  wait_stats["last_wait"] = waited
+  wait_stats["last_search"] = search_seconds
+  return boxes
+
+def box_center(box):
+  """Absolute screen coordinates of the centre of a monitor-relative box"""
+  x, y, w, h = box[:4]
+  abs_x, abs_y = monitor_manager.monitor_to_screen_coords(x, y)
+  return abs_x + w // 2, abs_y + h // 2
+
+# Coarse first pass for multi_match_templates: half-resolution grayscale
+COARSE_SCALE = 0.5
+COARSE_THRESHOLD_MARGIN = 0.2
+COARSE_MIN_SIZE = 8
+MAX_COARSE_CANDIDATES = 20
+
+def _scale_roi(roi, scale, shape):
+  if not roi:
+    return 0, 0, shape[1], shape[0]
+  left, top, right, bottom = roi
+  return (max(0, int(left * scale)), max(0, int(top * scale)),
+          min(shape[1], int(right * scale)), min(shape[0], int(bottom * scale)))
+
+def _coarse_candidates(small_gray, template, threshold, roi, frame_pixels):
+  """Candidate top-left corners (full-resolution coordinates) from the downscaled pass"""
+  left, top, right, bottom = _scale_roi(roi, COARSE_SCALE, small_gray.shape)
+  search = small_gray[top:bottom, left:right]
+  small_template = template.scaled_gray(COARSE_SCALE)
+  scan_stats["searches"] += 1
+  scan_stats["pixels_scanned"] += search.shape[0] * search.shape[1]
+  scan_stats["full_frame_pixels"] += frame_pixels
+  if search.shape[0] < small_template.shape[0] or search.shape[1] < small_template.shape[1]:
+    return []
+
+  result = cv2.matchTemplate(search, small_template, cv2.TM_CCOEFF_NORMED)
+  xs, ys, _ = extract_peaks(result, threshold - COARSE_THRESHOLD_MARGIN, min_dist=2)
+  return [(int((x + left) / COARSE_SCALE), int((y + top) / COARSE_SCALE))
+          for x, y in zip(xs[:MAX_COARSE_CANDIDATES], ys[:MAX_COARSE_CANDIDATES])]
+
+def _confirm_candidates(screen_bgr, template, threshold, candidates):
+  """Full-resolution BGR match in a small window around each coarse candidate"""
+  pad = int(2 / COARSE_SCALE) + 2
+  boxes = []
+  for x, y in candidates:
+    window = (x - pad, y - pad, x + template.w + pad, y + template.h + pad)
+    boxes.extend(_match_in(screen_bgr, template.bgr, threshold, roi=window, frame_pixels=0))
+  return nms_boxes(boxes)
+
+@tracer.span("match")
+def multi_match_templates(templates, screen=None, threshold=0.85, stop_on=None, scored=False, region=None):
+  """
+  Match a whole template set against one frame, best match first for each template.
+  The screen is converted once; each template is first searched at half resolution in
+  grayscale and only candidates are confirmed at full resolution. templates is in
+  priority order: once a template named in stop_on is found, the rest are skipped
+  (and reported as no match). With region (monitor-relative left, top, right, bottom)
+  only that part of the screen is converted and searched; boxes stay in monitor
+  coordinates.
+  """
   if screen is None:
-    screen = monitor_manager.get_screenshot()
-  screen_bgr = cv2.cvtColor(np.array(screen), cv2.COLOR_RGB2BGR)
+    screen = monitor_manager.get_frame().image
+  offset_x, offset_y = 0, 0
+  if region:
+    offset_x, offset_y = max(0, region[0]), max(0, region[1])
+    screen = screen.crop((offset_x, offset_y, min(screen.width, region[2]), min(screen.height, region[3])))
+  screen_bgr = to_bgr(screen)
+  screen_gray = cv2.cvtColor(screen_bgr, cv2.COLOR_BGR2GRAY)
+  small_gray = cv2.resize(screen_gray, None, fx=COARSE_SCALE, fy=COARSE_SCALE, interpolation=cv2.INTER_AREA)
+  frame_pixels = screen_bgr.shape[0] * screen_bgr.shape[1]
 
-  results = {}
+  results = {name: [] for name in templates}
   for name, path in templates.items():
-    template = cv2.imread(path, cv2.IMREAD_COLOR)
-    if template is None:
-      results[name] = []
+    cached = template_cache.get(path)
+    if cached is None:
       continue
-    if template.shape[2] == 4:
-      template = cv2.cvtColor(template, cv2.COLOR_BGRA2BGR)
-
-    result = cv2.matchTemplate(screen_bgr, template, cv2.TM_CCOEFF_NORMED)
-    loc = np.where(result >= threshold)
-    h, w = template.shape[:2]
-    boxes = [(x, y, w, h) for (x, y) in zip(*loc[::-1])]
-    results[name] = boxes
+    roi = get_template_roi(path)
+    if region:
+      # Declared ROI clipped to the region, in the coordinates of the cropped screen
+      left, top, right, bottom = roi or region
+      roi = (max(left, offset_x) - offset_x, max(top, offset_y) - offset_y,
+             min(right, region[2]) - offset_x, min(bottom, region[3]) - offset_y)
+      if roi[2] <= roi[0] or roi[3] <= roi[1]:
+        continue
+
+    if min(cached.w, cached.h) * COARSE_SCALE < COARSE_MIN_SIZE:
+      # Too small to survive downscaling, match directly
+      results[name] = _match_in(screen_bgr, cached.bgr, threshold, roi=roi, frame_pixels=frame_pixels)
+    else:
+      candidates = _coarse_candidates(small_gray, cached, threshold, roi, frame_pixels)
+      results[name] = _confirm_candidates(screen_bgr, cached, threshold, candidates)
+
+    if region:
+      results[name] = [(x + offset_x, y + offset_y, w, h, score) for x, y, w, h, score in results[name]]
+    if stop_on and name in stop_on and results[name]:
+      break
+
+  if not scored:
+    results = {name: _strip_scores(boxes) for name, boxes in results.items()}
   return results
 
+def non_max_suppression(centers_x, centers_y, scores, min_dist=5):
+  """
+  Greedy NMS on box centers, best score first; returns the kept indices.
+  Two boxes are duplicates when both center offsets are within min_dist.
+  """
+  scores = np.asarray(scores)
+  if scores.size == 0:
+    return np.empty(0, dtype=np.intp)
+  order = np.argsort(-scores, kind="stable")
+  cx = np.asarray(centers_x)[order]
+  cy = np.asarray(centers_y)[order]
+  suppressed = np.zeros(order.size, dtype=bool)
+  keep = []
+  for i in range(order.size):
+    if suppressed[i]:
+      continue
+    keep.append(order[i])
+    suppressed[i + 1:] |= (np.abs(cx[i + 1:] - cx[i]) <= min_dist) & (np.abs(cy[i + 1:] - cy[i]) <= min_dist)
+  return np.array(keep, dtype=np.intp)
+
+def extract_peaks(result, threshold, min_dist=5):
+  """
+  Scored peaks of a matchTemplate response map as (xs, ys, scores), best first.
+  Only local maxima are kept before NMS, so busy screens with thousands of raw
+  hits above threshold reduce to a handful of candidates.
+  """
+  mask = result >= threshold
+  if not mask.any():
+    empty = np.empty(0, dtype=np.intp)
+    return empty, empty, np.empty(0, dtype=result.dtype)
+  size = 2 * min_dist + 1
+  dilated = cv2.dilate(result, np.ones((size, size), np.uint8))
+  ys, xs = np.nonzero(mask & (result >= dilated))
+  scores = result[ys, xs]
+  keep = non_max_suppression(xs, ys, scores, min_dist)
+  return xs[keep], ys[keep], scores[keep]
+
+def nms_boxes(boxes, min_dist=5):
+  """De-duplicate scored (x, y, w, h, score) boxes, best score first"""
+  if not boxes:
+    return []
+  arr = np.array(boxes, dtype=np.float64)
+  keep = non_max_suppression(arr[:, 0] + arr[:, 2] // 2, arr[:, 1] + arr[:, 3] // 2, arr[:, 4], min_dist)
+  return [boxes[i] for i in keep]
+
 def deduplicate_boxes(boxes, min_dist=5):
-  filtered = []
-  for x, y, w, h in boxes:
-    cx, cy = x + w // 2, y + h // 2
-    if all(abs(cx - (fx + fw // 2)) > min_dist or abs(cy - (fy + fh // 2)) > min_dist
-        for fx, fy, fw, fh in filtered):
-      filtered.append((x, y, w, h))
-  return filtered
+  """De-duplicate unscored (x, y, w, h) boxes, keeping the first box of each cluster"""
+  if not boxes:
+    return []
+  arr = np.array([box[:4] for box in boxes], dtype=np.int64)
+  keep = non_max_suppression(arr[:, 0] + arr[:, 2] // 2, arr[:, 1] + arr[:, 3] // 2, -np.arange(len(boxes)), min_dist)
+  return [boxes[i] for i in keep]
 
 def is_btn_active(region, treshold = 150):
   try:
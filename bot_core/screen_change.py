@@ -0,0 +1,86 @@
+import numpy as np
+from PIL import Image
+
+from monitor_manager import monitor_manager
+from bot_utils.input_sink import input_sink
+from bot_utils.tracing import tracer
+from bot_utils.constants import GAME_REGION
+
+# Frames are compared as small grayscale thumbnails of a region
+SIGNATURE_SCALE = 8           # downsample factor (box filter)
+CELL_DELTA = 16               # a thumbnail cell changed when its gray level moved more than this
+CHANGE_THRESHOLD = 0.005      # fraction of changed cells (vs. before the input) that counts as a transition
+STABLE_THRESHOLD = 0.01       # at most this between two polls counts as settled (idle animations keep moving)
+POLL_INTERVAL = 0.05
+
+def frame_signature(frame, region=GAME_REGION):
+  """Downsampled grayscale thumbnail of a region of a FrameSnapshot"""
+  img = frame.crop(region).convert("L")
+  size = (max(1, img.width // SIGNATURE_SCALE), max(1, img.height // SIGNATURE_SCALE))
+  return np.asarray(img.resize(size, Image.BOX), dtype=np.int16)
+
+def signature_diff(a, b):
+  """Fraction of thumbnail cells that changed (1.0 when the signatures are not comparable)"""
+  if a is None or b is None or a.shape != b.shape:
+    return 1.0
+  return float((np.abs(a - b) > CELL_DELTA).mean())
+
+def _poll():
+  # Each poll becomes the shared snapshot, so readers after the wait reuse it
+  return monitor_manager.refresh_frame()
+
+def wait_for_change(region=GAME_REGION, timeout=1.0, threshold=CHANGE_THRESHOLD, reference=None, poll=POLL_INTERVAL):
+  """
+  Wait until the region differs from reference (default: the frame from before the
+  latest click/scroll, if no wait used it yet; otherwise the current frame). Returns
+  True as soon as it changed, False after timeout seconds.
+  """
+  if reference is None:
+    reference = input_sink.take_reference()
+  if reference is None:
+    # No input since the last wait: an older frame would show a change straight away
+    reference = _poll()
+  before = frame_signature(reference, region)
+
+  with tracer.span("wait"):
+    deadline = input_sink.now() + timeout
+    while True:
+      if signature_diff(frame_signature(_poll(), region), before) >= threshold:
+        return True
+      if input_sink.now() >= deadline:
+        return False
+      input_sink.sleep(poll)
+
+def wait_for_stable(region=GAME_REGION, settle_ms=150, timeout=2.0, threshold=STABLE_THRESHOLD, poll=POLL_INTERVAL):
+  """
+  Wait until the region has not changed for settle_ms. Returns True once settled,
+  False after timeout seconds (the screen kept moving).
+  """
+  with tracer.span("wait"):
+    deadline = input_sink.now() + timeout
+    last = frame_signature(_poll(), region)
+    stable_since = input_sink.now()
+    while True:
+      if (input_sink.now() - stable_since) * 1000 >= settle_ms:
+        return True
+      if input_sink.now() >= deadline:
+        return False
+      input_sink.sleep(poll)
+      current = frame_signature(_poll(), region)
+      if signature_diff(current, last) > threshold:
+        stable_since = input_sink.now()
+      last = current
+
+def wait_for_transition(region=GAME_REGION, timeout=1.0, settle_ms=150, settle_timeout=None):
+  """
+  Replacement for a fixed post-click sleep of timeout seconds, and never longer: wait
+  for the click to change the screen, then for the new screen to settle in what is
+  left of timeout (and at most settle_timeout).
+  """
+  deadline = input_sink.now() + timeout
+  if not wait_for_change(region, timeout=timeout):
+    return False
+  remaining = max(0.0, deadline - input_sink.now())
+  if settle_timeout is not None:
+    remaining = min(remaining, settle_timeout)
+  return wait_for_stable(region, settle_ms=settle_ms, timeout=remaining)
@@ -0,0 +1,90 @@
+import os
+import time
+
+import numpy as np
+from PIL import Image
+
+from bot_utils.constants import GAME_REGION
+from bot_utils.tracing import tracer
+
+SCREEN_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'game_assets', 'screens'))
+REFERENCE_SCALE = 4       # references are stored as GAME_REGION crops at 1/4 size
+THUMB_SIZE = (18, 27)     # (width, height) of the signature compared between frames
+SAMPLE_SIZE = (72, 108)
+UNKNOWN = "unknown"
+
+# Screen types the labelling tool offers (any folder name under game_assets/screens works)
+SCREEN_TYPES = ("lobby", "event", "dialog", "training", "race_list", "race_result", "skill_list")
+
+def screen_signature(img, box=None):
+  """Zero-mean, unit-norm grayscale thumbnail of a game-column image (PIL), or of box within it"""
+  # Point-sample 4x4 pixels per thumbnail cell, then average them: a box filter over
+  # the full-resolution column alone costs ~2 ms
+  sample = img.resize(SAMPLE_SIZE, Image.NEAREST, box=box)
+  thumb = np.asarray(sample.resize(THUMB_SIZE, Image.BOX).convert("L"), dtype=np.float32).ravel()
+  thumb = thumb - thumb.mean()
+  norm = np.linalg.norm(thumb)
+  return thumb / norm if norm else thumb
+
+def reference_image(frame_image):
+  """The GAME_REGION crop of a full frame at reference size, as saved by tools/label_screens.py"""
+  crop = frame_image.crop(GAME_REGION)
+  return crop.resize((crop.width // REFERENCE_SCALE, crop.height // REFERENCE_SCALE), Image.BOX)
+
+class ScreenClassifier:
+  """
+  Nearest-neighbour screen type from a tiny thumbnail of the game column.
+  References live in game_assets/screens/<screen type>/*.png (see tools/label_screens.py);
+  without references every frame is "unknown" and callers run all their detectors.
+  """
+  def __init__(self, screen_dir=SCREEN_DIR, min_similarity=0.9):
+    self.screen_dir = screen_dir
+    self.min_similarity = min_similarity
+    self.labels = []
+    self.signatures = None
+    self.stats = {"classified": 0, "unknown": 0, "seconds": 0.0}
+    self.load_references()
+
+  @property
+  def available(self):
+    return self.signatures is not None
+
+  def load_references(self):
+    """(Re)load labelled reference thumbnails from screen_dir"""
+    labels, signatures = [], []
+    if os.path.isdir(self.screen_dir):
+      for label in sorted(os.listdir(self.screen_dir)):
+        folder = os.path.join(self.screen_dir, label)
+        if not os.path.isdir(folder):
+          continue
+        for filename in sorted(os.listdir(folder)):
+          if filename.lower().endswith(".png"):
+            with Image.open(os.path.join(folder, filename)) as img:
+              signatures.append(screen_signature(img))
+            labels.append(label)
+    self.labels = labels
+    self.signatures = np.stack(signatures) if signatures else None
+
+  def classify_signature(self, signature):
+    """(label, similarity) of the nearest reference, label is "unknown" below min_similarity"""
+    if not self.available:
+      return UNKNOWN, 0.0
+    similarities = self.signatures @ signature
+    best = int(np.argmax(similarities))
+    similarity = float(similarities[best])
+    if similarity < self.min_similarity:
+      return UNKNOWN, similarity
+    return self.labels[best], similarity
+
+  @tracer.span("classify")
+  def classify(self, frame_image):
+    """Screen type of a full frame (PIL image): (label, similarity)"""
+    start = time.perf_counter()
+    label, similarity = self.classify_signature(screen_signature(frame_image, box=GAME_REGION))
+    self.stats["seconds"] += time.perf_counter() - start
+    self.stats["classified"] += 1
+    self.stats["unknown"] += label == UNKNOWN
+    return label, similarity
+
+# Global screen classifier instance
+screen_classifier = ScreenClassifier()
@@ -1,5 +1,3 @@
-import pyautogui
-import Levenshtein
 import sys
 import os
 
@@ -12,12 +10,101 @@ try:
 except ImportError:
     USE_SMART_MOUSE = False
 
+import hashlib
+
 from monitor_manager import monitor_manager
-from bot_utils.screenshot import enhanced_screenshot
-from bot_core.ocr import extract_text
-from bot_core.recognizer import match_template, is_btn_active
+from bot_utils.input_sink import input_sink
+from bot_core.ocr import extract_batch, OCRJob
+from bot_core.recognizer import match_template, is_btn_active, box_center
+from bot_core.skill_matcher import get_skill_matcher
+from bot_core.screen_change import wait_for_stable, frame_signature, signature_diff, STABLE_THRESHOLD
+from bot_utils.constants import LIST_REGION
 import bot_core.state as state
 
+BUY_SKILL_ICON = "game_assets/icons/buy_skill.png"
+MAX_SKILL_PAGES = 10
+SCROLLS_PER_PAGE = 7
+
+# Skill name and cost of a row, relative to the top-left corner of its buy button
+SKILL_NAME_OFFSET = (-420, -40, -145, -35)   # (left, top, right, bottom), right/bottom also add the button's w/h
+SKILL_COST_OFFSET = (-80, 0, -5, 0)
+
+def row_regions(box):
+  """(name region, cost region) of the skill row a buy button box (x, y, w, h) belongs to"""
+  x, y, w, h = box
+  name = (max(0, x + SKILL_NAME_OFFSET[0]), max(0, y + SKILL_NAME_OFFSET[1]),
+          x + w + SKILL_NAME_OFFSET[2], y + h + SKILL_NAME_OFFSET[3])
+  cost = (max(0, x + SKILL_COST_OFFSET[0]), y + SKILL_COST_OFFSET[1],
+          x + SKILL_COST_OFFSET[2], y + h + SKILL_COST_OFFSET[3])
+  return name, cost
+
+def row_hash(frame, region):
+  """Content hash of a row's name crop; the same row hashes the same at any scroll offset"""
+  return hashlib.blake2b(frame.crop(region).tobytes(), digest_size=16).hexdigest()
+
+def scan_skill_list(on_row=None, max_pages=MAX_SKILL_PAGES):
+  """
+  Scroll through the skill list and read every row once. Rows are tracked across pages
+  by the content hash of their name crop, so a row still visible after a scroll is not
+  read again; the scan ends when two consecutive pages are identical. on_row(row) is
+  called for each new row while it is on screen (e.g. to click its buy button).
+  Returns the rows top to bottom: {"name", "cost", "active", "box", "page"}.
+  """
+  rows = {}
+  previous_page = None
+  for page in range(max_pages):
+    frame = monitor_manager.get_frame()
+    buttons = sorted(match_template(BUY_SKILL_ICON, threshold=0.9, frame=frame), key=lambda box: box[1])
+
+    page_keys = []
+    new_rows = []
+    for box in buttons:
+      name_region, cost_region = row_regions(box)
+      if name_region[2] <= name_region[0] or name_region[3] <= name_region[1]:
+        continue
+      key = row_hash(frame, name_region)
+      page_keys.append(key)
+      if key in rows:
+        rows[key]["box"] = box
+        continue
+      rows[key] = {"name": None, "cost": None, "active": is_btn_active(box), "box": box, "page": page}
+      new_rows.append((key, name_region, cost_region))
+
+    # Same rows and same list picture as before the last scroll: the end of the list
+    signature = frame_signature(frame, LIST_REGION)
+    if previous_page is not None and page_keys == previous_page[0] and \
+        signature_diff(signature, previous_page[1]) <= STABLE_THRESHOLD:
+      break
+    previous_page = (page_keys, signature)
+
+    # One OCR call for the names and one for the costs of all new rows on this page
+    jobs = []
+    for _, name_region, cost_region in new_rows:
+      jobs.append(OCRJob(name_region, "text"))
+      jobs.append(OCRJob(cost_region, "number", detect=False))
+    try:
+      results = extract_batch(jobs, frame=frame)
+    except Exception as e:
+      print(f"[WARNING] Skill detection error: {e}; reading the rows one by one")
+      results = None
+    for index, (key, _, _) in enumerate(new_rows):
+      # A bad row costs only that row, not the rest of the list
+      row = rows[key]
+      try:
+        name, cost = results[2 * index:2 * index + 2] if results else extract_batch(jobs[2 * index:2 * index + 2], frame=frame)
+        row["name"] = name.value
+        row["cost"] = cost.value if cost.value >= 0 else None
+        if on_row:
+          on_row(row)
+      except Exception as e:
+        print(f"[WARNING] Skill detection error: {e}")
+
+    for _ in range(SCROLLS_PER_PAGE):
+      input_sink.scroll(-300)
+    wait_for_stable(LIST_REGION, settle_ms=100, timeout=0.5)
+
+  return list(rows.values())
+
 def buy_skill():
   # Set status for detection
   state.skill_buying_status = "Scanning for skills..."
@@ -28,46 +115,35 @@ def buy_skill():
   if USE_SMART_MOUSE:
     smart_move_to(abs_x, abs_y)
   else:
-    pyautogui.moveTo(x=abs_x, y=abs_y)
+    input_sink.moveTo(x=abs_x, y=abs_y)
     
   found = False
 
-  for _ in range(10):
-    state.skill_buying_status = f"Searching skills... (attempt {_+1}/10)"
-    buy_skill_icon = match_template("game_assets/icons/buy_skill.png", threshold=0.9)
-
-    if buy_skill_icon:
-      for x, y, w, h in buy_skill_icon:
-        # Fix coordinate calculation to prevent 'right' < 'left' error
-        left = max(0, x - 420)  # Ensure left edge is not negative
-        top = max(0, y - 40)    # Ensure top edge is not negative
-        width = min(w + 275, 1920 - left)  # Ensure width doesn't exceed screen
-        height = min(h + 5, 1080 - top)    # Ensure height doesn't exceed screen
-        
-        # Only proceed if we have valid dimensions
-        if width > 0 and height > 0:
-          region = (left, top, width, height)
-          try:
-            screenshot = enhanced_screenshot(region)
-            text = extract_text(screenshot)
-            if is_skill_match(text, state.SKILL_LIST):
-              button_region = (x, y, w, h)
-              if is_btn_active(button_region):
-                print(f"[INFO] Buy {text}")
-                state.skill_buying_status = f"Purchasing: {text}"
-                if USE_SMART_MOUSE:
-                    smart_move_and_click(x + 5, y + 5)
-                else:
-                    pyautogui.click(x=x + 5, y=y + 5, duration=0.15)
-                found = True
-              else:
-                print(f"[INFO] {text} found but not enough skill points.")
-                state.skill_buying_status = f"Insufficient points for: {text}"
-          except Exception as e:
-            print(f"[WARNING] Skill detection error: {e}")
-
-    for _ in range(7):  # Use _ instead of i for unused variable
-      pyautogui.scroll(-300)
+  def buy_row(row):
+    nonlocal found
+    text = row["name"]
+    state.skill_buying_status = f"Checking skill: {text}"
+    skill, score = get_skill_matcher(state.SKILL_LIST).match(text)
+    if skill is None:
+      return
+    if row["active"]:
+      print(f"[INFO] Buy {text} (matches {skill}, {score:.2f})")
+      state.skill_buying_status = f"Purchasing: {text}"
+      center = box_center(row["box"])
+      if USE_SMART_MOUSE:
+          smart_move_and_click(center[0], center[1])
+      else:
+          input_sink.click(x=center[0], y=center[1], duration=0.15)
+      found = True
+    else:
+      print(f"[INFO] {text} found but not enough skill points.")
+      state.skill_buying_status = f"Insufficient points for: {text}"
+
+  try:
+    skills = scan_skill_list(on_row=buy_row)
+    print(f"[INFO] Skill list: {len(skills)} skills read")
+  except Exception as e:
+    print(f"[WARNING] Skill detection error: {e}")
 
   # Reset status when done
   if found:
@@ -78,8 +154,5 @@ def buy_skill():
   return found
 
 def is_skill_match(text: str, skill_list: list[str], threshold: float = 0.75) -> bool:
-  for skill in skill_list:
-    similarity = Levenshtein.ratio(text.lower(), skill.lower())
-    if similarity >= threshold:
-      return True
-  return False
+  skill, _ = get_skill_matcher(skill_list, threshold).match(text)
+  return skill is not None
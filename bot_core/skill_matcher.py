@@ -0,0 +1,78 @@
+import re
+import unicodedata
+from collections import Counter
+
+import Levenshtein
+
+NGRAM = 3
+SHORTLIST = 32     # candidates (most shared trigrams) scored with Levenshtein per query
+
+def normalize_skill(text):
+  """Compare form of a skill name: NFKC, lowercase, punctuation/symbols to single spaces"""
+  text = unicodedata.normalize("NFKC", text or "").lower()
+  return " ".join(re.sub(r"[^\w]+", " ", text).split())
+
+def ngrams(text):
+  padded = f" {text} "
+  return {padded[i:i + NGRAM] for i in range(max(1, len(padded) - NGRAM + 1))}
+
+class SkillMatcher:
+  """
+  Fuzzy lookup of OCR'd skill names in a wishlist. Names are normalized once and
+  indexed by character trigrams; a query only scores (Levenshtein ratio) the
+  candidates sharing the most trigrams with it, after dropping those whose length
+  alone rules out reaching the threshold.
+  """
+  def __init__(self, skills, threshold=0.75, shortlist=SHORTLIST):
+    self.threshold = threshold
+    self.shortlist = shortlist
+    self.skills = list(skills)
+    self.names = [normalize_skill(skill) for skill in self.skills]
+    self.exact = {name: index for index, name in enumerate(self.names)}
+    self.index = {}
+    for index, name in enumerate(self.names):
+      for gram in ngrams(name):
+        self.index.setdefault(gram, []).append(index)
+
+  def __len__(self):
+    return len(self.skills)
+
+  def _candidates(self, query):
+    if len(self.names) <= self.shortlist:
+      return range(len(self.names))
+    shared = Counter()
+    for gram in ngrams(query):
+      shared.update(self.index.get(gram, ()))
+    return [index for index, _ in shared.most_common(self.shortlist)]
+
+  def match(self, text):
+    """(wishlist skill, score) of the best match; skill is None when the score is below threshold"""
+    query = normalize_skill(text)
+    if not query:
+      return None, 0.0
+    exact = self.exact.get(query)
+    if exact is not None:
+      return self.skills[exact], 1.0
+
+    best, best_score = None, 0.0
+    length = len(query)
+    for index in self._candidates(query):
+      name = self.names[index]
+      # ratio() can't exceed 2 * shorter / (sum of lengths)
+      if 2 * min(length, len(name)) / (length + len(name)) < max(self.threshold, best_score):
+        continue
+      score = Levenshtein.ratio(query, name)
+      if score > best_score:
+        best, best_score = index, score
+    if best is None or best_score < self.threshold:
+      return None, best_score
+    return self.skills[best], best_score
+
+_matcher = None
+
+def get_skill_matcher(skills, threshold=0.75):
+  """Matcher for a skill list, compiled once and reused until the list changes"""
+  global _matcher
+  if _matcher is None or _matcher.skills != list(skills) or _matcher.threshold != threshold:
+    _matcher = SkillMatcher(skills, threshold)
+  return _matcher
@@ -1,11 +1,13 @@
 import re
 import json
 
-from bot_utils.screenshot import capture_region, enhanced_screenshot
-from bot_core.ocr import extract_text, extract_number
+from bot_utils.screenshot import enhanced_screenshot, enhance_image
+from bot_core.ocr import extract_text, extract_number, extract_batch, OCRJob
 from bot_core.recognizer import match_template
+from bot_core.lexicon import lexicon_reader
+from monitor_manager import monitor_manager
 
-from bot_utils.constants import SUPPORT_CARD_ICON_REGION, MOOD_REGION, TURN_REGION, FAILURE_REGION, YEAR_REGION, MOOD_LIST, CRITERIA_REGION, SKILL_PTS_REGION
+from bot_utils.constants import SUPPORT_CARD_ICON_REGION, SUPPORT_COLUMN_REGION, TURN_REGION, FAILURE_REGION, SKILL_PTS_REGION, STAT_REGIONS
 
 is_bot_running = False
 
@@ -45,7 +47,7 @@ def set_gui_config(config):
     
     # Map GUI mood level to bot minimum mood
     mood_level = config.get("minimal_mood", 3)
-    mood_mapping = {1: "VERY BAD", 2: "BAD", 3: "NORMAL", 4: "GOOD", 5: "VERY GOOD"}
+    mood_mapping = {1: "AWFUL", 2: "BAD", 3: "NORMAL", 4: "GOOD", 5: "GREAT"}
     MINIMUM_MOOD = mood_mapping.get(mood_level, "NORMAL")
     
     # Apply other GUI settings
@@ -82,25 +84,13 @@ def reload_config():
   SKILL_LIST = config["skill"]["skill_list"]
 
 # Get Stat
-def stat_state():
-  # Region coordinates in (left, top, right, bottom) format
-  stat_regions = {
-    "spd": (310, 723, 310+55, 723+20),    # (310, 723, 365, 743)
-    "sta": (405, 723, 405+55, 723+20),    # (405, 723, 460, 743)
-    "pwr": (500, 723, 500+55, 723+20),    # (500, 723, 555, 743)
-    "guts": (595, 723, 595+55, 723+20),   # (595, 723, 650, 743)
-    "wit": (690, 723, 690+55, 723+20)     # (690, 723, 745, 743)
-  }
-
-  result = {}
-  for stat, region in stat_regions.items():
-    img = enhanced_screenshot(region)
-    val = extract_number(img)
-    result[stat] = val
-  return result
+def stat_state(frame=None):
+  # All five boxes in one recognizer-only OCR call
+  readings = extract_batch([OCRJob(region, "number", detect=False) for region in STAT_REGIONS.values()], frame)
+  return {stat: reading.value for stat, reading in zip(STAT_REGIONS, readings)}
 
 # Check support card in each training
-def check_support_card(threshold=0.8):
+def check_support_card(threshold=0.8, frame=None):
   SUPPORT_ICONS = {
     "spd": "game_assets/icons/support_card_type_spd.png",
     "sta": "game_assets/icons/support_card_type_sta.png",
@@ -113,14 +103,31 @@ def check_support_card(threshold=0.8):
   count_result = {}
 
   for key, icon_path in SUPPORT_ICONS.items():
-    matches = match_template(icon_path, SUPPORT_CARD_ICON_REGION, threshold)
+    matches = match_template(icon_path, SUPPORT_CARD_ICON_REGION, threshold, frame=frame)
+    count_result[key] = len(matches)
+
+  return count_result
+
+# Count special supporters in each training (their portraits sit in the support card column)
+def check_special_supporters(threshold=0.8, frame=None):
+  SPECIAL_ICONS = {
+    "kitasan": "game_assets/icons/kitasan.png",
+    "exclamation": "game_assets/icons/exclamation_mark.png",
+    "director": "game_assets/icons/director.png",
+    "otonashi": "game_assets/icons/otonashi.png"
+  }
+
+  count_result = {}
+
+  for key, icon_path in SPECIAL_ICONS.items():
+    matches = match_template(icon_path, SUPPORT_COLUMN_REGION, threshold, frame=frame)
     count_result[key] = len(matches)
 
   return count_result
 
 # Get failure chance (idk how to get energy value)
-def check_failure():
-  failure = enhanced_screenshot(FAILURE_REGION)
+def check_failure(frame=None):
+  failure = enhance_image(frame.crop(FAILURE_REGION)) if frame else enhanced_screenshot(FAILURE_REGION)
   failure_text = extract_text(failure).lower()
 
   if not failure_text.startswith("failure"):
@@ -145,23 +152,30 @@ def check_failure():
 
   return -1
 
+# Read mood, turn, year and criteria from one frame with (at most) a single OCR call.
+# Mood, year and criteria come back as lexicon values (a MOOD_LIST entry, lexicon.Year,
+# lexicon.Criteria); crops seen before skip OCR
+def read_lobby(frame=None):
+  if frame is None:
+    frame = monitor_manager.get_frame()
+  values = lexicon_reader.read(frame, extra_jobs={"turn": OCRJob(TURN_REGION, "text")})
+  return {
+    "mood": values["mood"],
+    "turn": parse_turn(values["turn"].text),
+    "year": values["year"],
+    "criteria": values["criteria"]
+  }
+
 # Check mood
 def check_mood():
-  mood = capture_region(MOOD_REGION)
-  mood_text = extract_text(mood).upper()
-
-  for known_mood in MOOD_LIST:
-    if known_mood in mood_text:
-      return known_mood
-
-  print(f"[WARNING] Mood not recognized: {mood_text}")
-  return "UNKNOWN"
+  return lexicon_reader.read(monitor_manager.get_frame(), ["mood"])["mood"]
 
 # Check turn
 def check_turn():
     turn = enhanced_screenshot(TURN_REGION)
-    turn_text = extract_text(turn)
+    return parse_turn(extract_text(turn))
 
+def parse_turn(turn_text):
     if "Race Day" in turn_text:
         return "Race Day"
 
@@ -181,19 +195,15 @@ def check_turn():
     
     return -1
 
-# Check year
+# Check year (a lexicon.Year)
 def check_current_year():
-  year = enhanced_screenshot(YEAR_REGION)
-  text = extract_text(year)
-  return text
+  return lexicon_reader.read(monitor_manager.get_frame(), ["year"])["year"]
 
-# Check criteria
+# Check criteria (a lexicon.Criteria)
 def check_criteria():
-  img = enhanced_screenshot(CRITERIA_REGION)
-  text = extract_text(img)
-  return text
+  return lexicon_reader.read(monitor_manager.get_frame(), ["criteria"])["criteria"]
 
 def check_skill_pts():
   img = enhanced_screenshot(SKILL_PTS_REGION)
-  text = extract_number(img)
+  text = extract_number(img, detect=False)
   return text
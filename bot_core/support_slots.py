@@ -0,0 +1,268 @@
+import threading
+from collections import deque
+import sys
+import os
+
+import cv2
+import numpy as np
+
+# Add bot_utils to path for config access
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'bot_utils'))
+
+try:
+    from config_manager import get_performance_settings
+    use_slot_classifier = get_performance_settings()['slot_classifier']
+except ImportError:
+    use_slot_classifier = True
+
+from bot_core.recognizer import match_template, multi_match_templates, to_bgr, get_template_roi
+from bot_core.template_cache import template_cache
+from bot_utils.constants import SUPPORT_CARD_ICON_REGION
+
+TYPE_ICONS = {
+  "spd": "game_assets/icons/support_card_type_spd.png",
+  "sta": "game_assets/icons/support_card_type_sta.png",
+  "pwr": "game_assets/icons/support_card_type_pwr.png",
+  "guts": "game_assets/icons/support_card_type_guts.png",
+  "wit": "game_assets/icons/support_card_type_wit.png",
+  "friend": "game_assets/icons/support_card_type_friend.png"
+}
+SPECIAL_ICONS = {
+  "kitasan": "game_assets/icons/kitasan.png",
+  "exclamation": "game_assets/icons/exclamation_mark.png",
+  "director": "game_assets/icons/director.png",
+  "otonashi": "game_assets/icons/otonashi.png"
+}
+
+SLOT_SEARCH = 3        # pixels of slack around a slot's icon position
+RECHECK_EVERY = 30     # full six-template pass every N classifications, to pick up slots not seen yet
+MAX_GAPS = 64          # neighbour gaps kept for the pitch estimate
+
+def estimate_pitch(gaps, tolerance=SLOT_SEARCH):
+  """
+  Slot pitch from gaps between neighbouring icons of the same pass. Cards stack from the
+  top slot, so most gaps are one pitch (a missed card makes two); gaps that are not a
+  whole multiple of their median are left out, and the pitch is the median of the rest.
+  None when nothing agrees.
+  """
+  if not gaps:
+    return None
+  median = float(np.median(gaps))
+  multiples = [(gap, round(gap / median)) for gap in gaps]
+  estimates = [gap / k for gap, k in multiples if k and abs(gap / k - median) <= tolerance]
+  return round(float(np.median(estimates))) if estimates else None
+
+class SupportSlotClassifier:
+  """
+  Support cards in a training preview, one result per occupied card slot. The column
+  is a fixed stack of slots: their position (icon x, first y, pitch) is learned from
+  full six-template passes over SUPPORT_CARD_ICON_REGION, after which each preview
+  only compares the type icons in a small window per slot. Special supporters found
+  in the column are attached to the slot they sit on. A recheck pass that finds icons
+  off the grid twice in a row throws the grid away and learns it again.
+  """
+  def __init__(self, region=SUPPORT_CARD_ICON_REGION, threshold=0.8, enabled=True):
+    self.enabled = enabled
+    self.region = region
+    self.threshold = threshold
+    self._lock = threading.RLock()
+    self.calls = 0
+    self.relearned = 0
+    self.reset()
+
+  def reset(self):
+    """Forget the learned slot grid"""
+    with self._lock:
+      self.icon_x = None
+      self.icon_size = None
+      self.sightings = []      # [sum of tops, count] per distinct slot seen (column coordinates)
+      self.gaps = deque(maxlen=MAX_GAPS)
+      self.pitch = None
+      self.anchor = None       # top of the most often seen slot, which fixes the grid's phase
+      self.suspect = False     # the last recheck found icons off the grid
+
+  @property
+  def calibrated(self):
+    return self.pitch is not None
+
+  @property
+  def slot_tops(self):
+    return sorted(round(total / count) for total, count in self.sightings)
+
+  def slot_positions(self):
+    """Icon top of every slot of the learned grid (column coordinates)"""
+    with self._lock:
+      if not self.calibrated:
+        return self.slot_tops
+      height = self.region[3] - self.region[1]
+      return list(range(self.anchor % self.pitch, height - self.icon_size[1] + 1, self.pitch))
+
+  def learn(self, boxes):
+    """Add type icon boxes (column coordinates) from a full pass to the slot grid"""
+    with self._lock:
+      tops = sorted(y for _, y, _, _, _ in boxes)
+      for x, y, w, h, _ in boxes:
+        self.icon_x = x if self.icon_x is None else min(self.icon_x, x)
+        self.icon_size = (max(w, self.icon_size[0]), max(h, self.icon_size[1])) if self.icon_size else (w, h)
+        # Slots can't overlap: a top within an icon height of a known slot is that slot
+        for sighting in self.sightings:
+          if abs(y - sighting[0] / sighting[1]) < self.icon_size[1]:
+            sighting[0] += y
+            sighting[1] += 1
+            break
+        else:
+          self.sightings.append([y, 1])
+      # Gaps under an icon height would be overlapping slots: a bad match, not a pitch
+      self.gaps.extend(b - a for a, b in zip(tops, tops[1:]) if b - a >= self.icon_size[1])
+      if self.sightings:
+        total, count = max(self.sightings, key=lambda sighting: sighting[1])
+        self.anchor = round(total / count)
+        self.pitch = estimate_pitch(self.gaps) or self.pitch
+
+  def fits_grid(self, boxes):
+    """Whether every box of a full pass sits on the learned grid"""
+    positions = self.slot_positions()
+    return all(abs(x - self.icon_x) <= SLOT_SEARCH and min(abs(y - top) for top in positions) <= SLOT_SEARCH
+               for x, y, _, _, _ in boxes)
+
+  def _update_grid(self, boxes):
+    with self._lock:
+      if not self.calibrated or self.fits_grid(boxes):
+        self.suspect = False
+        self.learn(boxes)
+      elif self.suspect:
+        print("[WARNING] Support card slots moved, learning the slot grid again")
+        self.relearned += 1
+        self.reset()
+        self.learn(boxes)
+      else:
+        # Could be one bad match; the next preview gets a full pass to confirm
+        self.suspect = True
+
+  def _full_pass(self, frame):
+    """The six-template search over the whole column: (type, scored box) per icon found"""
+    found = []
+    for card_type, icon_path in TYPE_ICONS.items():
+      for box in match_template(icon_path, self.region, self.threshold, scored=True, frame=frame):
+        found.append((card_type, box))
+    # One label per slot: the best scoring icon at each height
+    found.sort(key=lambda icon: -icon[1][4])
+    slots = []
+    for card_type, box in found:
+      if all(abs(box[1] - other[1]) >= other[3] for _, other in slots):
+        slots.append((card_type, box))
+    self._update_grid([box for _, box in slots])
+    return slots
+
+  def _grid(self):
+    """(icon x, icon size, slot tops) of the learned grid, taken together under the lock"""
+    with self._lock:
+      return self.icon_x, self.icon_size, self.slot_positions()
+
+  def _classify_slots(self, column_bgr, grid):
+    """Best type icon in a small window at each slot of grid (from _grid): (type, scored box, margin)"""
+    found = []
+    icon_x, (width, height), positions = grid
+    for top in positions:
+      left = max(0, icon_x - SLOT_SEARCH)
+      window = column_bgr[max(0, top - SLOT_SEARCH):top + height + SLOT_SEARCH, left:icon_x + width + SLOT_SEARCH]
+      scores = []
+      for card_type, icon_path in TYPE_ICONS.items():
+        template = template_cache.get(icon_path)
+        if template is None or window.shape[0] < template.h or window.shape[1] < template.w:
+          continue
+        result = cv2.matchTemplate(window, template.bgr, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (x, y) = cv2.minMaxLoc(result)
+        scores.append((score, card_type, (left + x, max(0, top - SLOT_SEARCH) + y, template.w, template.h)))
+      if not scores:
+        continue
+      scores.sort(reverse=True)
+      score, card_type, (x, y, w, h) = scores[0]
+      if score >= self.threshold:
+        margin = score - scores[1][0] if len(scores) > 1 else score
+        found.append((card_type, (x, y, w, h, score), margin))
+    # A card is counted once even if the windows of two slots both reach it
+    found.sort(key=lambda icon: -icon[1][4])
+    kept = []
+    for icon in found:
+      if all(abs(icon[1][1] - other[1][1]) >= height for other in kept):
+        kept.append(icon)
+    return kept
+
+  def classify(self, frame, training=None):
+    """
+    Occupied slots of a training preview (a FrameSnapshot), top to bottom:
+    {"slot", "box" (monitor coordinates), "type", "confidence", "margin",
+     "rainbow" (type is the training's), "friend", "specials" {name: confidence}}
+    """
+    # The other training_pool worker may relearn the grid meanwhile, so the fast path works
+    # on a snapshot of it
+    with self._lock:
+      self.calls += 1
+      full = not self.calibrated or self.suspect or self.calls % RECHECK_EVERY == 0
+      grid = None if full else self._grid()
+
+    if full:
+      icons = [(card_type, box, None) for card_type, box in self._full_pass(frame)]
+    else:
+      icons = self._classify_slots(to_bgr(frame.crop(self.region)), grid)
+
+    left, top = max(0, self.region[0]), max(0, self.region[1])
+    slots = []
+    for card_type, (x, y, w, h, score), margin in sorted(icons, key=lambda icon: icon[1][1]):
+      slots.append({
+        "slot": self._slot_index(y, grid),
+        "box": (x + left, y + top, w, h),
+        "type": card_type,
+        "confidence": round(float(score), 3),
+        "margin": None if margin is None else round(float(margin), 3),
+        "rainbow": card_type == training,
+        "friend": card_type == "friend",
+        "specials": {}
+      })
+    self._attach_specials(frame, slots)
+    return slots
+
+  def _slot_index(self, y, grid=None):
+    if grid is not None:
+      positions = grid[2]
+      return min(range(len(positions)), key=lambda i: abs(positions[i] - y))
+    with self._lock:
+      if self.calibrated:
+        return round((y - self.anchor % self.pitch) / self.pitch)
+      tops = self.slot_tops
+      return min(range(len(tops)), key=lambda i: abs(tops[i] - y), default=0)
+
+  def _attach_specials(self, frame, slots):
+    # Each special icon belongs to the occupied slot nearest to it vertically; only the
+    # band of the column around the occupied slots is searched
+    if not slots:
+      return
+    reach = max(template.h for template in map(template_cache.get, SPECIAL_ICONS.values()) if template)
+    column = get_template_roi(SPECIAL_ICONS["kitasan"]) or self.region
+    band = (column[0], min(slot["box"][1] for slot in slots) - reach,
+            column[2], max(slot["box"][1] + slot["box"][3] for slot in slots) + reach)
+    matches = multi_match_templates(SPECIAL_ICONS, screen=frame.image, threshold=self.threshold, scored=True, region=band)
+    for name, boxes in matches.items():
+      for x, y, w, h, score in boxes:
+        center = y + h / 2
+        slot = min(slots, key=lambda s: abs(s["box"][1] + s["box"][3] / 2 - center))
+        slot["specials"][name] = max(round(float(score), 3), slot["specials"].get(name, 0.0))
+
+def count_types(slots):
+  """Support card counts per type, as state.check_support_card returns them"""
+  counts = {card_type: 0 for card_type in TYPE_ICONS}
+  for slot in slots:
+    counts[slot["type"]] += 1
+  return counts
+
+def count_specials(slots):
+  """Special supporter counts, as state.check_special_supporters returns them"""
+  counts = {name: 0 for name in SPECIAL_ICONS}
+  for slot in slots:
+    for name in slot["specials"]:
+      counts[name] += 1
+  return counts
+
+# Global support slot classifier instance (performance_settings.slot_classifier turns it off)
+slot_classifier = SupportSlotClassifier(enabled=use_slot_classifier)
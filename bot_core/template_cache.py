@@ -0,0 +1,188 @@
+import os
+import threading
+import time
+
+import cv2
+import numpy as np
+
+ASSETS_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'game_assets'))
+ROOT_DIR = os.path.dirname(ASSETS_DIR)
+# Asset folders that hold reference data, not match templates
+NON_TEMPLATE_DIRS = ("digits", "screens", "moods")
+
+class Template:
+  """Pre-converted template image ready for cv2.matchTemplate"""
+  def __init__(self, name, path, bgr, mtime):
+    self.name = name
+    self.path = path
+    self.mtime = mtime
+    self.bgr = np.ascontiguousarray(bgr)
+    self.gray = np.ascontiguousarray(cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY))
+    self.h, self.w = bgr.shape[:2]
+    self.pyramid = {}
+
+  def scaled_gray(self, scale):
+    """Downscaled grayscale copy for coarse matching (memoized per scale)"""
+    scaled = self.pyramid.get(scale)
+    if scaled is None:
+      size = (max(1, round(self.w * scale)), max(1, round(self.h * scale)))
+      scaled = np.ascontiguousarray(cv2.resize(self.gray, size, interpolation=cv2.INTER_AREA))
+      self.pyramid[scale] = scaled
+    return scaled
+
+  @property
+  def nbytes(self):
+    return self.bgr.nbytes + self.gray.nbytes + sum(scaled.nbytes for scaled in self.pyramid.values())
+
+class TemplateCache:
+  """Loads every image under game_assets/ once and hands out cached templates by name"""
+  def __init__(self, assets_dir=ASSETS_DIR):
+    self.assets_dir = assets_dir
+    self.templates = {}
+    self.aliases = {}
+    self.hits = 0
+    self.misses = 0
+    self.reloads = 0
+    # Seconds between automatic checks for changed assets (None = only on reload())
+    self.auto_reload_interval = None
+    self._last_reload_check = time.monotonic()
+    self._reload_listeners = []
+    self._lock = threading.RLock()
+    self.preload()
+
+  def normalize_name(self, name):
+    """Map a path ("game_assets/buttons/back_btn.png", absolute, ...) to its cache key"""
+    path = name if os.path.isabs(name) else os.path.join(ROOT_DIR, name)
+    return os.path.relpath(os.path.normpath(path), ROOT_DIR).replace(os.sep, "/")
+
+  def _load(self, key):
+    path = os.path.join(ROOT_DIR, key)
+    if not os.path.isfile(path):
+      return None
+    bgr = cv2.imread(path, cv2.IMREAD_COLOR)
+    if bgr is None:
+      return None
+    return Template(key, path, bgr, os.path.getmtime(path))
+
+  def _store(self, key, template):
+    self.templates[key] = template
+    stem = os.path.splitext(os.path.basename(key))[0]
+    # Short names ("back_btn") only alias unambiguous file names
+    if self.aliases.get(stem, key) == key:
+      self.aliases[stem] = key
+    else:
+      self.aliases[stem] = None
+
+  def _scan_assets(self):
+    found = []
+    for dirpath, dirnames, filenames in os.walk(self.assets_dir):
+      if dirpath == self.assets_dir:
+        dirnames[:] = [name for name in dirnames if name not in NON_TEMPLATE_DIRS]
+      for filename in filenames:
+        if filename.lower().endswith((".png", ".jpg", ".jpeg", ".bmp")):
+          found.append(self.normalize_name(os.path.join(dirpath, filename)))
+    return sorted(found)
+
+  def preload(self):
+    """Load every asset under game_assets/ into memory"""
+    with self._lock:
+      for key in self._scan_assets():
+        template = self._load(key)
+        if template is not None:
+          self._store(key, template)
+      print(f"[INFO] Template cache: {len(self.templates)} templates loaded ({self.memory_bytes() / 1024:.0f} KB)")
+
+  def get(self, name):
+    """Get a cached Template by path or short name, loading it on a miss"""
+    if self.auto_reload_interval is not None and time.monotonic() - self._last_reload_check > self.auto_reload_interval:
+      self.reload_changed()
+
+    with self._lock:
+      key = self.aliases.get(name) or self.normalize_name(name)
+      template = self.templates.get(key)
+      if template is not None:
+        self.hits += 1
+        return template
+
+      self.misses += 1
+      template = self._load(key)
+      if template is None:
+        print(f"[WARNING] Template not found: {name}")
+        return None
+      self._store(key, template)
+      return template
+
+  def add_reload_listener(self, callback):
+    """Register callback(names) called with the keys of templates that were reloaded"""
+    self._reload_listeners.append(callback)
+
+  def reload(self, name=None):
+    """Hot-reload one template, or every asset when name is None"""
+    with self._lock:
+      if name is None:
+        self.templates = {}
+        self.aliases = {}
+        self.preload()
+        changed = list(self.templates)
+      else:
+        key = self.aliases.get(name) or self.normalize_name(name)
+        template = self._load(key)
+        if template is None:
+          self.templates.pop(key, None)
+        else:
+          self._store(key, template)
+        changed = [key]
+      self.reloads += 1
+    self._notify(changed)
+    return changed
+
+  def reload_changed(self):
+    """Reload assets whose file changed on disk, pick up new ones and drop deleted ones"""
+    changed = []
+    with self._lock:
+      self._last_reload_check = time.monotonic()
+      on_disk = set(self._scan_assets())
+      for key in on_disk:
+        template = self.templates.get(key)
+        path = os.path.join(ROOT_DIR, key)
+        if template is None or os.path.getmtime(path) != template.mtime:
+          template = self._load(key)
+          if template is not None:
+            self._store(key, template)
+            changed.append(key)
+      for key in list(self.templates):
+        if key.startswith("game_assets/") and key not in on_disk:
+          del self.templates[key]
+          changed.append(key)
+      if changed:
+        self.reloads += 1
+    if changed:
+      print(f"[INFO] Template cache reloaded: {', '.join(changed)}")
+      self._notify(changed)
+    return changed
+
+  def _notify(self, changed):
+    for callback in list(self._reload_listeners):
+      try:
+        callback(changed)
+      except Exception as e:
+        print(f"[WARNING] Template reload listener failed: {e}")
+
+  def memory_bytes(self):
+    return sum(template.nbytes for template in self.templates.values())
+
+  def get_stats(self):
+    """Cache statistics for logging / the GUI"""
+    with self._lock:
+      lookups = self.hits + self.misses
+      return {
+        "templates": len(self.templates),
+        "hits": self.hits,
+        "misses": self.misses,
+        "hit_rate": self.hits / lookups if lookups else 0.0,
+        "reloads": self.reloads,
+        "memory_bytes": self.memory_bytes()
+      }
+
+# Global template cache instance
+template_cache = TemplateCache()
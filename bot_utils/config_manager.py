@@ -31,7 +31,12 @@ def get_performance_settings():
     performance_settings = config.get('performance_settings', {})
     
     return {
-        'gpu_mode': performance_settings.get('gpu_mode', 'auto')
+        'gpu_mode': performance_settings.get('gpu_mode', 'auto'),
+        'frame_max_age': performance_settings.get('frame_max_age', 1.0),
+        'digit_reader': performance_settings.get('digit_reader', True),
+        'ocr_cache_size': performance_settings.get('ocr_cache_size', 512),
+        'slot_classifier': performance_settings.get('slot_classifier', True),
+        'game_state_tracker': performance_settings.get('game_state_tracker', True)
     }
 
 def should_use_teleport():
@@ -6,3 +6,67 @@ YEAR_REGION=(255, 35, 420, 60)
 CRITERIA_REGION=(455, 85, 625, 115)
 MOOD_LIST = ["AWFUL", "BAD", "NORMAL", "GOOD", "GREAT", "UNKNOWN"]
 SKILL_PTS_REGION=(760, 780, 825, 815)
+STAT_REGIONS = {
+  "spd": (310, 723, 310+55, 723+20),    # (310, 723, 365, 743)
+  "sta": (405, 723, 405+55, 723+20),    # (405, 723, 460, 743)
+  "pwr": (500, 723, 500+55, 723+20),    # (500, 723, 555, 743)
+  "guts": (595, 723, 595+55, 723+20),   # (595, 723, 650, 743)
+  "wit": (690, 723, 690+55, 723+20)     # (690, 723, 745, 743)
+}
+
+# Template search regions (left, top, right, bottom), same 1920x1080 layout as the regions above
+GAME_REGION=(240, 0, 960, 1080)
+LOBBY_BUTTONS_REGION=(240, 780, 960, 1080)
+DIALOG_BUTTONS_REGION=(240, 540, 960, 1080)
+LIST_REGION=(240, 200, 960, 900)
+SUPPORT_COLUMN_REGION=(780, 120, 980, 720)
+
+# Where each asset in game_assets/ can show up; templates without an entry are searched on the full frame
+TEMPLATE_ROIS = {
+  "game_assets/buttons/back_btn.png": LOBBY_BUTTONS_REGION,
+  "game_assets/buttons/cancel_btn.png": DIALOG_BUTTONS_REGION,
+  "game_assets/buttons/close_btn.png": DIALOG_BUTTONS_REGION,
+  "game_assets/buttons/confirm_btn.png": DIALOG_BUTTONS_REGION,
+  "game_assets/buttons/infirmary_btn.png": LOBBY_BUTTONS_REGION,
+  "game_assets/buttons/inspiration_btn.png": DIALOG_BUTTONS_REGION,
+  "game_assets/buttons/learn_btn.png": DIALOG_BUTTONS_REGION,
+  "game_assets/buttons/next2_btn.png": DIALOG_BUTTONS_REGION,
+  "game_assets/buttons/next_btn.png": DIALOG_BUTTONS_REGION,
+  "game_assets/buttons/ok_btn.png": DIALOG_BUTTONS_REGION,
+  "game_assets/buttons/race_btn.png": DIALOG_BUTTONS_REGION,
+  "game_assets/buttons/race_day_btn.png": LOBBY_BUTTONS_REGION,
+  "game_assets/buttons/races_btn.png": LOBBY_BUTTONS_REGION,
+  "game_assets/buttons/recreation_btn.png": LOBBY_BUTTONS_REGION,
+  "game_assets/buttons/rest_btn.png": LOBBY_BUTTONS_REGION,
+  "game_assets/buttons/rest_summer_btn.png": LOBBY_BUTTONS_REGION,
+  "game_assets/buttons/retry_btn.png": DIALOG_BUTTONS_REGION,
+  "game_assets/buttons/skills_btn.png": LOBBY_BUTTONS_REGION,
+  "game_assets/buttons/skip_btn.png": DIALOG_BUTTONS_REGION,
+  "game_assets/buttons/skip_off.png": DIALOG_BUTTONS_REGION,
+  "game_assets/buttons/skip_x1.png": DIALOG_BUTTONS_REGION,
+  "game_assets/buttons/skip_x2.png": DIALOG_BUTTONS_REGION,
+  "game_assets/buttons/training_btn.png": LOBBY_BUTTONS_REGION,
+  "game_assets/buttons/training_btn2.png": LOBBY_BUTTONS_REGION,
+  "game_assets/buttons/view_results.png": DIALOG_BUTTONS_REGION,
+  "game_assets/icons/buy_skill.png": LIST_REGION,
+  "game_assets/icons/director.png": SUPPORT_COLUMN_REGION,
+  "game_assets/icons/event_choice_1.png": LIST_REGION,
+  "game_assets/icons/exclamation_mark.png": SUPPORT_COLUMN_REGION,
+  "game_assets/icons/kitasan.png": SUPPORT_COLUMN_REGION,
+  "game_assets/icons/otonashi.png": SUPPORT_COLUMN_REGION,
+  "game_assets/icons/support_card_type_friend.png": SUPPORT_CARD_ICON_REGION,
+  "game_assets/icons/support_card_type_guts.png": SUPPORT_CARD_ICON_REGION,
+  "game_assets/icons/support_card_type_pwr.png": SUPPORT_CARD_ICON_REGION,
+  "game_assets/icons/support_card_type_spd.png": SUPPORT_CARD_ICON_REGION,
+  "game_assets/icons/support_card_type_sta.png": SUPPORT_CARD_ICON_REGION,
+  "game_assets/icons/support_card_type_wit.png": SUPPORT_CARD_ICON_REGION,
+  "game_assets/icons/train_guts.png": LOBBY_BUTTONS_REGION,
+  "game_assets/icons/train_pwr.png": LOBBY_BUTTONS_REGION,
+  "game_assets/icons/train_spd.png": LOBBY_BUTTONS_REGION,
+  "game_assets/icons/train_sta.png": LOBBY_BUTTONS_REGION,
+  "game_assets/icons/train_wit.png": LOBBY_BUTTONS_REGION,
+  "game_assets/ui/g1_race.png": LIST_REGION,
+  "game_assets/ui/match_track.png": LIST_REGION,
+  "game_assets/ui/tazuna_hint.png": GAME_REGION,
+  "game_assets/ura/ura_race_btn.png": LOBBY_BUTTONS_REGION
+}
@@ -0,0 +1,93 @@
+"""
+Frame sources for monitor_manager
+By default frames come from the live monitor. A ReplayFrameSource serves
+captured frames from a directory or a .zip archive instead, and a FrameRecorder
+saves every live frame so a session can be replayed later (tools/replay.py).
+"""
+import io
+import os
+import zipfile
+
+from PIL import Image
+
+FRAME_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+class ReplayFrameSource:
+    """
+    Serves recorded frames in file name order.
+    step="tick": the same frame is returned until advance() is called (one frame per bot tick).
+    step="grab": every grab returns the next frame (replays a FrameRecorder capture 1:1).
+    """
+    def __init__(self, path, step="tick"):
+        if step not in ("tick", "grab"):
+            raise ValueError(f"Unknown replay step: {step}")
+        self.path = path
+        self.step = step
+        self.index = 0
+        self.grabs = 0
+        self._zip = None
+        if zipfile.is_zipfile(path):
+            self._zip = zipfile.ZipFile(path)
+            self.names = sorted(name for name in self._zip.namelist() if name.lower().endswith(FRAME_EXTENSIONS))
+        elif os.path.isdir(path):
+            self.names = sorted(name for name in os.listdir(path) if name.lower().endswith(FRAME_EXTENSIONS))
+        else:
+            raise FileNotFoundError(f"No frame directory or archive at {path}")
+        if not self.names:
+            raise ValueError(f"No frames in {path}")
+        self._cache = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def name(self):
+        return self.names[min(self.index, len(self.names) - 1)]
+
+    @property
+    def exhausted(self):
+        return self.index >= len(self.names)
+
+    def _load(self, index):
+        if index not in self._cache:
+            name = self.names[index]
+            if self._zip is not None:
+                img = Image.open(io.BytesIO(self._zip.read(name)))
+            else:
+                img = Image.open(os.path.join(self.path, name))
+            # Keep only the current frame decoded
+            self._cache = {index: img.convert("RGB")}
+        return self._cache[index]
+
+    def grab(self):
+        """Full-monitor frame, like a live capture of the selected monitor"""
+        index = min(self.index, len(self.names) - 1)
+        if self.step == "grab" and self.grabs > 0:
+            self.advance()
+            index = min(self.index, len(self.names) - 1)
+        self.grabs += 1
+        return self._load(index)
+
+    def advance(self):
+        """Move on to the next frame; returns False once every frame has been served"""
+        self.index += 1
+        return not self.exhausted
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+class FrameRecorder:
+    """Live capture that also saves every frame it grabs to a directory"""
+    def __init__(self, directory, capture):
+        self.directory = directory
+        self.capture = capture
+        self.count = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def grab(self):
+        img = self.capture()
+        img.save(os.path.join(self.directory, f"frame_{self.count:05d}.png"))
+        self.count += 1
+        return img
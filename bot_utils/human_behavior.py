@@ -5,6 +5,8 @@ import random
 import time
 import math
 
+from bot_utils.input_sink import input_sink
+
 class HumanBehavior:
     def __init__(self):
         self.last_action_time = time.time()
@@ -59,13 +61,13 @@ class HumanBehavior:
         thinking_time = random.normalvariate(1.2, 0.4)  # Average 1.2s thinking
         thinking_time = max(0.3, min(3.0, thinking_time))  # Clamp 0.3-3s
         
-        time.sleep(thinking_time)
+        input_sink.sleep(thinking_time)
     
     def add_micro_break(self):
         """Add small random pauses"""
         if random.random() < 0.1:  # 10% chance
             micro_break = random.uniform(0.5, 2.0)
-            time.sleep(micro_break)
+            input_sink.sleep(micro_break)
     
     def get_curved_mouse_points(self, start_x, start_y, end_x, end_y, num_points=5):
         """Generate curved mouse movement points instead of straight line"""
@@ -0,0 +1,172 @@
+"""
+Input sink: where the bot's mouse input and waits go
+The live sink forwards to pyautogui. The recording sink only logs what the bot
+meant to do, so the perception and decision path can run headless against
+replayed frames (see bot_utils/frame_source.py and tools/replay.py).
+"""
+import time
+from collections import namedtuple
+
+from bot_utils.tracing import tracer
+
+Point = namedtuple("Point", "x y")
+
+class LiveInput:
+    """Real mouse input through pyautogui (imported on first use)"""
+    def __init__(self):
+        self._pyautogui = None
+
+    @property
+    def pyautogui(self):
+        if self._pyautogui is None:
+            import pyautogui
+            pyautogui.useImageNotFoundException(False)
+            self._pyautogui = pyautogui
+        return self._pyautogui
+
+    def moveTo(self, *args, **kwargs):
+        return self.pyautogui.moveTo(*args, **kwargs)
+
+    def click(self, *args, **kwargs):
+        return self.pyautogui.click(*args, **kwargs)
+
+    def tripleClick(self, *args, **kwargs):
+        return self.pyautogui.tripleClick(*args, **kwargs)
+
+    def mouseDown(self, *args, **kwargs):
+        return self.pyautogui.mouseDown(*args, **kwargs)
+
+    def mouseUp(self, *args, **kwargs):
+        return self.pyautogui.mouseUp(*args, **kwargs)
+
+    def scroll(self, clicks, *args, **kwargs):
+        return self.pyautogui.scroll(clicks, *args, **kwargs)
+
+    def position(self):
+        return self.pyautogui.position()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def now(self):
+        return time.monotonic()
+
+class RecordingInput:
+    """
+    Records intended input instead of sending it. Waits are skipped (only summed up,
+    and they advance a virtual clock so polling loops still time out).
+    """
+    def __init__(self):
+        self.actions = []
+        self.slept = 0.0
+        self.clock = 0.0
+        self.cursor = Point(0, 0)
+
+    def record(self, action, *args, **kwargs):
+        self.actions.append({"action": action, "args": list(args), "kwargs": kwargs, "time": time.perf_counter()})
+
+    def take_actions(self):
+        """Return and clear the actions recorded so far"""
+        actions, self.actions = self.actions, []
+        return actions
+
+    def _move(self, args, kwargs):
+        # pyautogui accepts moveTo(x, y), moveTo((x, y)) or moveTo(x=..., y=...)
+        if args and isinstance(args[0], tuple):
+            x, y = args[0][:2]
+        else:
+            x = args[0] if len(args) > 0 else kwargs.get("x")
+            y = args[1] if len(args) > 1 else kwargs.get("y")
+        if x is not None and y is not None:
+            self.cursor = Point(int(x), int(y))
+
+    def _input(self, action, args, kwargs):
+        self._move(args, kwargs)
+        self.record(action, *args, **kwargs)
+
+    def moveTo(self, *args, **kwargs):
+        self._move(args, kwargs)
+        self.record("moveTo", *args, **kwargs)
+
+    def click(self, *args, **kwargs):
+        self._input("click", args, kwargs)
+
+    def tripleClick(self, *args, **kwargs):
+        self._input("tripleClick", args, kwargs)
+
+    def mouseDown(self, *args, **kwargs):
+        self._input("mouseDown", args, kwargs)
+
+    def mouseUp(self, *args, **kwargs):
+        self._input("mouseUp", args, kwargs)
+
+    def scroll(self, clicks, *args, **kwargs):
+        self._input("scroll", (clicks,) + args, kwargs)
+
+    def position(self):
+        return self.cursor
+
+    def sleep(self, seconds):
+        self.slept += seconds
+        self.clock += seconds
+
+    def now(self):
+        return self.clock
+
+class InputSink:
+    """
+    Forwards input calls to the active backend (live by default). Inputs that change
+    the screen invalidate monitor_manager's frame; clicks and scrolls first record the
+    frame from before the input, so screen_change can tell when the input took effect.
+    """
+    def __init__(self, backend=None):
+        self.backend = backend or LiveInput()
+        self.reference = None   # frame from before the latest click/scroll nobody waited on yet
+
+    def use(self, backend):
+        """Swap the backend; returns the previous one"""
+        previous, self.backend = self.backend, backend
+        return previous
+
+    @property
+    def is_live(self):
+        return isinstance(self.backend, LiveInput)
+
+    def _screen_input(self, action, args, kwargs, before=True):
+        from monitor_manager import monitor_manager
+        if before:
+            self.reference = monitor_manager.get_frame()
+        try:
+            return getattr(self.backend, action)(*args, **kwargs)
+        finally:
+            monitor_manager.invalidate_frame()
+
+    def click(self, *args, **kwargs):
+        return self._screen_input("click", args, kwargs)
+
+    def tripleClick(self, *args, **kwargs):
+        return self._screen_input("tripleClick", args, kwargs)
+
+    def scroll(self, *args, **kwargs):
+        return self._screen_input("scroll", args, kwargs)
+
+    def mouseDown(self, *args, **kwargs):
+        return self._screen_input("mouseDown", args, kwargs, before=False)
+
+    def mouseUp(self, *args, **kwargs):
+        return self._screen_input("mouseUp", args, kwargs, before=False)
+
+    def take_reference(self):
+        """The frame from before the latest click/scroll, once (None if already taken)"""
+        reference, self.reference = self.reference, None
+        return reference
+
+    def sleep(self, seconds):
+        with tracer.span("sleep"):
+            self.backend.sleep(seconds)
+
+    def __getattr__(self, name):
+        return getattr(self.backend, name)
+
+# Global input sink instance
+input_sink = InputSink()
@@ -1,6 +1,7 @@
-import pyautogui
+from bot_utils.input_sink import input_sink
+from bot_core.recognizer import wait_for, box_center
 
 def ura():
-  race_btn = pyautogui.locateCenterOnScreen("game_assets/ura/ura_race_btn.png", confidence=0.8, minSearchTime=5)
+  race_btn = wait_for("game_assets/ura/ura_race_btn.png", threshold=0.8, timeout=5)
   if race_btn:
-    pyautogui.click(race_btn)
+    input_sink.click(box_center(race_btn[0]))
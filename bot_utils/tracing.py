@@ -0,0 +1,138 @@
+"""
+Lightweight per-turn latency tracing
+Spans time the bot's stages (capture, classify, match, ocr, logic, click, wait,
+sleep). The stage totals of each bot turn go into a ring buffer, from which p50/p95/p99
+per stage are computed for the overlay and for tools.
+
+Spans nest (a click span includes the human-like sleep inside it) and worker
+threads bound to a turn record into it concurrently, so stage times can add up
+to more than the turn total.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+DEFAULT_HISTORY = 200
+STAGES = ("capture", "classify", "match", "ocr", "logic", "click", "wait", "sleep")
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of a non-empty list"""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+class Tracer:
+    def __init__(self, history=DEFAULT_HISTORY):
+        self.enabled = True
+        self.turns = deque(maxlen=history)
+        self._lock = threading.Lock()
+        # Only the thread running a turn records into it (the GUI thread may capture too)
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, stage):
+        """Time a block (or, as a decorator, a function) under a stage name"""
+        turn = getattr(self._local, 'turn', None)
+        if not self.enabled or turn is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                turn['stages'][stage] = turn['stages'].get(stage, 0.0) + elapsed
+                turn['counts'][stage] = turn['counts'].get(stage, 0) + 1
+
+    @contextmanager
+    def turn(self):
+        """Collect the spans of one bot turn and store its summary in the ring buffer"""
+        if not self.enabled or getattr(self._local, 'turn', None) is not None:
+            yield
+            return
+        turn = {'started': time.time(), 'stages': {}, 'counts': {}, 'notes': {}}
+        self._local.turn = turn
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            turn['total'] = time.perf_counter() - start
+            self._local.turn = None
+            with self._lock:
+                self.turns.append(turn)
+
+    def note(self, name, amount):
+        """Add a per-turn figure that is not a timed span (e.g. seconds saved by a cache)"""
+        turn = getattr(self._local, 'turn', None)
+        if not self.enabled or turn is None:
+            return
+        with self._lock:
+            turn['notes'][name] = turn['notes'].get(name, 0.0) + amount
+
+    def get_note_mean(self, name):
+        """Mean of a noted figure per turn over the ring buffer (turns without it count as 0)"""
+        with self._lock:
+            turns = list(self.turns)
+        if not turns:
+            return 0.0
+        return sum(turn['notes'].get(name, 0.0) for turn in turns) / len(turns)
+
+    def current_turn(self):
+        """The turn being traced on this thread (pass it to bind() in worker threads)"""
+        return getattr(self._local, 'turn', None)
+
+    @contextmanager
+    def bind(self, turn):
+        """Record this thread's spans into another thread's turn (for worker pools)"""
+        previous = getattr(self._local, 'turn', None)
+        self._local.turn = turn
+        try:
+            yield
+        finally:
+            self._local.turn = previous
+
+    def get_recent_turns(self, count=10):
+        """Latest turn summaries, newest last"""
+        with self._lock:
+            return list(self.turns)[-count:]
+
+    def get_percentiles(self, percentiles=(50, 95, 99)):
+        """{stage: {'p50': s, 'p95': s, 'p99': s, 'count': turns}} over the ring buffer, plus 'total'"""
+        with self._lock:
+            turns = list(self.turns)
+        samples = {'total': [turn['total'] for turn in turns]}
+        for turn in turns:
+            for stage, seconds in turn['stages'].items():
+                samples.setdefault(stage, []).append(seconds)
+
+        stats = {}
+        for stage, values in samples.items():
+            if not values:
+                continue
+            stats[stage] = {f"p{pct}": percentile(values, pct) for pct in percentiles}
+            stats[stage]['count'] = len(values)
+        return stats
+
+    def format_summary(self):
+        """Multi-line p50/p95/p99 table in milliseconds"""
+        stats = self.get_percentiles()
+        if not stats:
+            return "No turns traced yet"
+        order = [stage for stage in STAGES if stage in stats]
+        order += sorted(stage for stage in stats if stage not in STAGES and stage != 'total')
+        lines = [f"{'stage':<8}{'p50':>8}{'p95':>8}{'p99':>8}  ms"]
+        for stage in order + ['total']:
+            row = stats[stage]
+            lines.append(f"{stage:<8}{row['p50'] * 1000:8.0f}{row['p95'] * 1000:8.0f}{row['p99'] * 1000:8.0f}")
+        return "\n".join(lines)
+
+    def reset(self):
+        with self._lock:
+            self.turns.clear()
+
+# Global tracer instance
+tracer = Tracer()
@@ -5,7 +5,9 @@ import keyboard
 import pyautogui
 
 from bot_core.execute import career_lobby, career_lobby_iteration
+from bot_core.game_state import game_state
 import bot_core.state as state
+from bot_core.ocr import warm_up_reader
 
 hotkey = "f1"
 
@@ -45,6 +47,7 @@ def main_loop(is_running_callback=None):
     
     state.reload_config()
     state.is_bot_running = True
+    game_state.reset()
     
     while is_running_callback():
       try:
@@ -79,6 +82,8 @@ def hotkey_listener():
     time.sleep(0.5)
 
 if __name__ == "__main__":
+  # Load the OCR model while waiting for the hotkey
+  warm_up_reader()
   threading.Thread(target=hotkey_listener, daemon=True).start()
   # Note: start_server() removed - use overlay GUI instead
   print("[INFO] Use 'python start_gui.py' to launch the overlay GUI")
@@ -6,14 +6,53 @@ Provides monitor detection and configuration functionality
 import mss
 import json
 import os
+import threading
+import time
 from PIL import Image, ImageGrab
 from pathlib import Path
 
+from bot_utils.tracing import tracer
+
+DEFAULT_FRAME_MAX_AGE = 1.0
+
+class FrameSnapshot:
+    """Full-monitor frame shared by every reader until it gets too old"""
+    def __init__(self, image, monitor_id):
+        self.image = image
+        self.monitor_id = monitor_id
+        self.timestamp = time.monotonic()
+    
+    def age(self):
+        """Seconds since the frame was grabbed"""
+        return time.monotonic() - self.timestamp
+    
+    def crop(self, region=None):
+        """Crop a monitor-relative (left, top, right, bottom) region out of the frame"""
+        if not region or len(region) != 4:
+            return self.image
+        left, top, right, bottom = region
+        # Ensure coordinates are within screen bounds
+        left = max(0, left)
+        top = max(0, top)
+        right = min(self.image.width, right)
+        bottom = min(self.image.height, bottom)
+        return self.image.crop((left, top, right, bottom))
+
 class MonitorManager:
     def __init__(self, config_path="config.json"):
         self.config_path = Path(config_path)
         self.monitors = []
         self.selected_monitor = None
+        # One long-lived mss session per thread (bot thread, GUI thread, ...)
+        self._capture_local = threading.local()
+        self._capture_sessions = []
+        self._capture_lock = threading.Lock()
+        # Per-tick frame snapshot shared by capture_region / match_template / ...
+        self.frame_max_age = DEFAULT_FRAME_MAX_AGE
+        self._frame = None
+        self._frame_lock = threading.Lock()
+        # None: capture the live monitor; otherwise any object with grab() -> PIL image
+        self.frame_source = None
         self.detect_monitors()
         self.load_config()
     
@@ -129,6 +168,7 @@ class MonitorManager:
         monitor = self.get_monitor_by_id(monitor_id)
         if monitor:
             self.selected_monitor = monitor
+            self.invalidate_frame()
             self.save_config()
             return True
         return False
@@ -137,8 +177,66 @@ class MonitorManager:
         """Get currently selected monitor"""
         return self.selected_monitor
     
+    def _get_capture_session(self):
+        """Get the mss session owned by the calling thread, creating it on first use"""
+        sct = getattr(self._capture_local, 'sct', None)
+        if sct is None:
+            sct = mss.mss()
+            self._capture_local.sct = sct
+            with self._capture_lock:
+                self._capture_sessions.append(sct)
+        return sct
+    
+    def _drop_capture_session(self):
+        """Close the calling thread's session so the next grab opens a fresh one"""
+        sct = getattr(self._capture_local, 'sct', None)
+        if sct is None:
+            return
+        self._capture_local.sct = None
+        with self._capture_lock:
+            if sct in self._capture_sessions:
+                self._capture_sessions.remove(sct)
+        try:
+            sct.close()
+        except Exception:
+            pass
+    
+    def close_capture_sessions(self):
+        """Release all capture sessions (call once no thread is capturing anymore)"""
+        with self._capture_lock:
+            sessions = self._capture_sessions
+            self._capture_sessions = []
+            self._capture_local = threading.local()
+        for sct in sessions:
+            try:
+                sct.close()
+            except Exception:
+                pass
+    
+    def _grab(self, monitor_dict):
+        """Grab a monitor area with the thread's persistent session"""
+        try:
+            screenshot = self._get_capture_session().grab(monitor_dict)
+        except mss.ScreenShotError:
+            # Handles can go stale (display change, resolution switch); reopen once
+            self._drop_capture_session()
+            screenshot = self._get_capture_session().grab(monitor_dict)
+        return Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+    
+    def set_frame_source(self, source):
+        """Take frames from source (replay, recorder, ...) instead of the monitor; None restores live capture"""
+        self.frame_source = source
+        self.invalidate_frame()
+    
     def get_screenshot(self, region=None):
         """Get screenshot from selected monitor"""
+        with tracer.span("capture"):
+            if self.frame_source is not None:
+                return FrameSnapshot(self.frame_source.grab(), None).crop(region)
+            return self.grab_monitor(region)
+    
+    def grab_monitor(self, region=None):
+        """Live screenshot of the selected monitor, ignoring any frame source"""
         try:
             if self.selected_monitor:
                 bbox = self.selected_monitor['bbox']
@@ -151,9 +249,7 @@ class MonitorManager:
                     "height": bbox[3] - bbox[1]
                 }
                 
-                with mss.mss() as sct:
-                    screenshot = sct.grab(monitor_dict)
-                    img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+                img = self._grab(monitor_dict)
                 
                 # Apply region cropping if specified
                 # NOTE: Region coordinates should be relative to the monitor, not absolute desktop coordinates
@@ -186,6 +282,27 @@ class MonitorManager:
             print(f"[ERROR] Region: {region}")
             return ImageGrab.grab(bbox=region)
     
+    def get_frame(self, max_age=None):
+        """Get the shared frame snapshot, grabbing a new one if it is older than max_age"""
+        if max_age is None:
+            max_age = self.frame_max_age
+        monitor_id = self.selected_monitor['id'] if self.selected_monitor else None
+        with self._frame_lock:
+            frame = self._frame
+            if frame is None or frame.monitor_id != monitor_id or frame.age() > max_age:
+                frame = FrameSnapshot(self.get_screenshot(), monitor_id)
+                self._frame = frame
+            return frame
+    
+    def refresh_frame(self):
+        """Force a new frame snapshot (start of a bot tick)"""
+        return self.get_frame(max_age=-1)
+    
+    def invalidate_frame(self):
+        """Drop the frame snapshot; call after any input that changes the screen"""
+        with self._frame_lock:
+            self._frame = None
+    
     def monitor_to_screen_coords(self, x, y):
         """Convert monitor-relative coordinates to absolute screen coordinates"""
         if self.selected_monitor:
@@ -259,6 +376,9 @@ class MonitorManager:
                 with open(self.config_path, 'r') as f:
                     config = json.load(f)
                 
+                performance_settings = config.get('performance_settings', {})
+                self.frame_max_age = float(performance_settings.get('frame_max_age', DEFAULT_FRAME_MAX_AGE))
+                
                 if 'monitor_config' in config:
                     monitor_id = config['monitor_config'].get('selected_monitor_id')
                     if monitor_id:
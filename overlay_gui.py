@@ -16,9 +16,12 @@ try:
     import bot_core.state as state
     from bot_core.execute import career_lobby_iteration
     from bot_utils.screenshot import capture_region, enhanced_screenshot
+    from bot_utils.tracing import tracer
+    from bot_core.position_cache import position_cache
+    from bot_core.game_state import game_state
     # Import OCR separately to handle potential issues
     try:
-        from bot_core.ocr import extract_text
+        from bot_core.ocr import extract_text, warm_up_reader, get_reader_status
         OCR_AVAILABLE = True
     except ImportError:
         OCR_AVAILABLE = False
@@ -58,6 +61,15 @@ class TrainingAssistant:
             except Exception as e:
                 print(f"⚠️ Hotkey failed to start: {e}")
         
+        # Refresh per-stage turn timings while the window is open
+        if BOT_AVAILABLE:
+            self.update_timing_stats()
+        
+        # Load the OCR model in the background so the window shows up right away
+        if OCR_AVAILABLE:
+            warm_up_reader()
+            self.update_ocr_status()
+        
     def setup_window(self):
         """Setup the overlay window properties"""
         self.root.title("🎯 Training Assistant")
@@ -196,7 +208,11 @@ class TrainingAssistant:
         
         ttk.Label(status_row, text="Skills:", style='Dark.TLabel').pack(side=tk.LEFT)
         self.skill_status_label = ttk.Label(status_row, text="Not Active", foreground=self.colors['text_secondary'], style='Status.TLabel')
-        self.skill_status_label.pack(side=tk.LEFT, padx=(8, 0))
+        self.skill_status_label.pack(side=tk.LEFT, padx=(8, 20))
+        
+        ttk.Label(status_row, text="OCR:", style='Dark.TLabel').pack(side=tk.LEFT)
+        self.ocr_status_label = ttk.Label(status_row, text="Not loaded", foreground=self.colors['text_secondary'], style='Status.TLabel')
+        self.ocr_status_label.pack(side=tk.LEFT, padx=(8, 0))
         
         # Controls Section (moved to be right after Status)
         self.create_section_header("🎮 Controls")
@@ -353,6 +369,12 @@ class TrainingAssistant:
         self.save_screenshots_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(debug_row2, text="📷 Save Debug Screenshots", variable=self.save_screenshots_var, style='Dark.TCheckbutton').pack(side=tk.LEFT)
         
+        # Turn Timing Section
+        self.create_section_header("⏱️ Turn Timing")
+        self.timing_label = ttk.Label(self.content_frame, text="No turns traced yet", style='Dark.TLabel',
+                                      font=('Consolas', 9), justify=tk.LEFT)
+        self.timing_label.pack(anchor=tk.W, pady=(0, 5))
+        
         # Info Section
         self.create_section_header("ℹ️ Information")
         info_text = ttk.Label(self.content_frame, text="Version: 2.0.0\nMode: Training Assistant\nStatus: Ready", 
@@ -380,6 +402,22 @@ class TrainingAssistant:
         y = self.root.winfo_y() + deltay
         self.root.geometry(f"+{x}+{y}")
         
+    def update_ocr_status(self):
+        """Show OCR model readiness, polling until it is loaded"""
+        status = get_reader_status()
+        if status == "ready":
+            self.ocr_status_label.config(text="✅ Ready", foreground=self.colors['success'])
+        elif status == "failed":
+            self.ocr_status_label.config(text="❌ Failed", foreground=self.colors['danger'])
+        else:
+            self.ocr_status_label.config(text="⏳ Loading...", foreground=self.colors['accent'])
+            self.root.after(500, self.update_ocr_status)
+        
+    def update_timing_stats(self):
+        """Show p50/p95/p99 per bot stage over the recent turns"""
+        self.timing_label.config(text=f"{tracer.format_summary()}\n{position_cache.format_summary()}\n{game_state.format_summary()}")
+        self.root.after(2000, self.update_timing_stats)
+        
     def initialize_data(self):
         """Initialize data and load config"""
         # Initialize priority listbox
@@ -680,6 +718,7 @@ class TrainingAssistant:
         try:
             state.reload_config()
             state.is_bot_running = True
+            game_state.reset()
             
             while self.bot_running:
                 try:
@@ -945,7 +984,15 @@ class TrainingAssistant:
                 
             # Save settings
             self.save_settings()
-            
+
+            # Release screen capture sessions
+            if BOT_AVAILABLE:
+                try:
+                    from monitor_manager import monitor_manager
+                    monitor_manager.close_capture_sessions()
+                except Exception as e:
+                    print(f"⚠️ Error releasing capture sessions: {e}")
+
             # Close application
             self.root.quit()
             
@@ -0,0 +1,67 @@
+"""
+Capture benchmark
+Compares opening a new mss context per frame against the persistent
+capture session owned by MonitorManager.
+
+Usage (from the repository root):
+    python tools/bench_capture.py [--frames 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import mss
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from monitor_manager import monitor_manager
+
+
+def grab_per_call(monitor_dict):
+    """Old capture path: new mss context for every frame"""
+    with mss.mss() as sct:
+        screenshot = sct.grab(monitor_dict)
+        return Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+
+
+def measure(label, grab, frames):
+    grab()  # warm up
+    start = time.perf_counter()
+    for _ in range(frames):
+        grab()
+    elapsed = time.perf_counter() - start
+    fps = frames / elapsed if elapsed else float('inf')
+    print(f"{label:<28} {fps:8.1f} frames/sec  ({elapsed / frames * 1000:6.2f} ms/frame)")
+    return fps
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark screen capture throughput")
+    parser.add_argument("--frames", type=int, default=200, help="frames to grab per method")
+    args = parser.parse_args()
+
+    monitor = monitor_manager.get_selected_monitor()
+    if not monitor:
+        print("[ERROR] No monitor selected")
+        return
+    bbox = monitor['bbox']
+    monitor_dict = {
+        "left": bbox[0],
+        "top": bbox[1],
+        "width": bbox[2] - bbox[0],
+        "height": bbox[3] - bbox[1]
+    }
+
+    print(f"Monitor: {monitor['name']} ({monitor['size']}), {args.frames} frames per method\n")
+    before = measure("mss context per frame", lambda: grab_per_call(monitor_dict), args.frames)
+    after = measure("persistent session", monitor_manager.get_screenshot, args.frames)
+    print(f"\nSpeedup: {after / before:.2f}x")
+
+    monitor_manager.close_capture_sessions()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Startup (import time) benchmark
+Times `import start_gui` in a fresh interpreter, which is what stands between
+launching the GUI and the window appearing, and compares it with the same
+import followed by loading the EasyOCR reader (the cost every launch paid
+while the reader was built at import time).
+
+Usage (from the repository root):
+    python tools/bench_import.py [--runs 3] [--top 15]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+IMPORT_ONLY = "import start_gui"
+IMPORT_AND_LOAD = "import start_gui; from bot_core.ocr import get_reader; get_reader()"
+
+
+def time_subprocess(code, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def slowest_imports(code, top):
+    """Top-level modules with the largest cumulative time from -X importtime"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        # Only direct children of the script, not their dependencies
+        if not name.startswith(" "):
+            rows.append((int(cumulative), name))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark start_gui import time")
+    parser.add_argument("--runs", type=int, default=3, help="runs per measurement (best is reported)")
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list (0 to skip)")
+    args = parser.parse_args()
+
+    import_only = time_subprocess(IMPORT_ONLY, args.runs)
+    print(f"import start_gui:                 {import_only:7.2f} s")
+    try:
+        with_reader = time_subprocess(IMPORT_AND_LOAD, args.runs)
+        print(f"import start_gui + OCR reader:    {with_reader:7.2f} s")
+        print(f"startup saved by lazy loading:    {with_reader - import_only:7.2f} s")
+    except subprocess.CalledProcessError:
+        print("[WARNING] Loading the OCR reader failed; skipped the eager comparison")
+
+    if args.top:
+        print("\nSlowest imports (cumulative):")
+        for cumulative, name in slowest_imports(IMPORT_ONLY, args.top):
+            print(f"  {cumulative / 1000:9.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Mood badge references and colour classifier benchmark
+Saves MOOD_REGION crops to game_assets/moods/<MOOD>/, which
+bot_core/mood_classifier.py learns at startup, and measures how fast and how
+accurately the colour classifier names the mood.
+
+Usage (from the repository root):
+    python tools/bench_mood.py capture MOOD
+        Save the mood badge of the selected monitor as a MOOD reference.
+    python tools/bench_mood.py bench [--samples 500] [--seed 0]
+        Synthetic badges (one colour per mood, jittered and noisy), plus
+        leave-one-out accuracy over the saved references when there are any.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from bot_core.mood_classifier import MOOD_DIR, MoodClassifier, mood_signature
+from bot_utils.constants import MOOD_LIST, MOOD_REGION
+
+# Approximate badge colours; the real ones come from references or OCR-confirmed reads
+BADGE_COLORS = {
+    "AWFUL": (150, 90, 210),
+    "BAD": (80, 140, 230),
+    "NORMAL": (240, 200, 40),
+    "GOOD": (255, 150, 50),
+    "GREAT": (255, 105, 180),
+}
+MOODS = [mood for mood in MOOD_LIST if mood != "UNKNOWN"]
+
+
+def make_badge(mood, rng):
+    """A MOOD_REGION-sized crop: grey background, coloured badge with white text, shifted and noisy"""
+    width, height = MOOD_REGION[2] - MOOD_REGION[0], MOOD_REGION[3] - MOOD_REGION[1]
+    image = Image.new("RGB", (width, height), (235, 235, 235))
+    draw = ImageDraw.Draw(image)
+    color = tuple(max(0, min(255, c + rng.randint(-15, 15))) for c in BADGE_COLORS[mood])
+    dx = rng.randint(-4, 4)
+    draw.rounded_rectangle((10 + dx, 2, width - 10 + dx, height - 2), radius=8, fill=color)
+    draw.text((30 + dx, 6), mood, fill=(255, 255, 255))
+    noise = np.random.default_rng(rng.randrange(1 << 30)).normal(0, 6, (height, width, 3))
+    return Image.fromarray(np.clip(np.asarray(image, dtype=np.float32) + noise, 0, 255).astype(np.uint8))
+
+
+def time_classify(classifier, crops):
+    start = time.perf_counter()
+    results = [classifier.classify(crop) for crop in crops]
+    return results, (time.perf_counter() - start) / max(1, len(crops))
+
+
+def report(label, results, truth, seconds, min_confidence):
+    accepted = [(mood, expected) for (mood, confidence), expected in zip(results, truth) if confidence >= min_confidence]
+    correct = sum(mood == expected for mood, expected in accepted)
+    print(f"{label:<12}{seconds * 1e6:>9.1f}{len(accepted) / len(truth):>10.0%}"
+          f"{correct / len(accepted) if accepted else 0.0:>10.0%}")
+
+
+def bench(args):
+    rng = random.Random(args.seed)
+    classifier = MoodClassifier(mood_dir=None)
+    # One OCR-confirmed read per mood, the way a run teaches the classifier
+    for mood in MOODS:
+        classifier.learn(make_badge(mood, rng), mood)
+    truth = [rng.choice(MOODS) for _ in range(args.samples)]
+    crops = [make_badge(mood, rng) for mood in truth]
+
+    print(f"{'set':<12}{'us/crop':>9}{'answered':>10}{'correct':>10}")
+    results, seconds = time_classify(classifier, crops)
+    report("synthetic", results, truth, seconds, classifier.min_confidence)
+
+    references = []
+    if os.path.isdir(MOOD_DIR):
+        for mood in MOODS:
+            folder = os.path.join(MOOD_DIR, mood)
+            if os.path.isdir(folder):
+                references += [(mood, Image.open(os.path.join(folder, name)).convert("RGB"))
+                               for name in sorted(os.listdir(folder)) if name.lower().endswith(".png")]
+    if references:
+        # Leave one out: classify each reference against the means of all the others
+        signatures = [mood_signature(crop) for _, crop in references]
+        results = []
+        start = time.perf_counter()
+        for index in range(len(references)):
+            held_out = MoodClassifier(mood_dir=None)
+            for other, ((mood, _), signature) in enumerate(zip(references, signatures)):
+                if other != index:
+                    held_out.learn_signature(signature, mood)
+            results.append(held_out.classify_signature(signatures[index]))
+        seconds = (time.perf_counter() - start) / len(references)
+        report("references", results, [mood for mood, _ in references], seconds, classifier.min_confidence)
+
+
+def capture(args):
+    from monitor_manager import monitor_manager
+
+    if args.mood not in MOODS:
+        print(f"[ERROR] MOOD must be one of {', '.join(MOODS)}")
+        return
+    folder = os.path.join(MOOD_DIR, args.mood)
+    os.makedirs(folder, exist_ok=True)
+    index = len([name for name in os.listdir(folder) if name.lower().endswith(".png")])
+    path = os.path.join(folder, f"{args.mood.lower()}_{index:03d}.png")
+    monitor_manager.get_frame().crop(MOOD_REGION).save(path)
+    print(f"[INFO] Saved {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mood badge references and classifier benchmark")
+    commands = parser.add_subparsers(dest="command", required=True)
+    capture_parser = commands.add_parser("capture")
+    capture_parser.add_argument("mood")
+    bench_parser = commands.add_parser("bench")
+    bench_parser.add_argument("--samples", type=int, default=500)
+    bench_parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.command == "capture":
+        capture(args)
+    else:
+        bench(args)
+
+
+if __name__ == "__main__":
+    main()
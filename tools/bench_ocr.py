@@ -0,0 +1,67 @@
+"""
+Per-turn OCR benchmark
+Times the lobby (mood/turn/year/criteria) and stat reads of one turn on a saved
+1920x1080 screenshot: one EasyOCR call per region versus ocr.extract_batch.
+
+Usage (from the repository root):
+    python tools/bench_ocr.py screenshot.png [--runs 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from monitor_manager import FrameSnapshot
+from bot_core.ocr import extract_text, extract_number
+from bot_core.state import read_lobby, stat_state
+from bot_utils.screenshot import enhance_image
+from bot_utils.constants import MOOD_REGION, TURN_REGION, YEAR_REGION, CRITERIA_REGION, STAT_REGIONS
+
+
+def per_region(frame):
+    """The reads of one turn, one OCR call per region (previous behaviour)"""
+    extract_text(frame.crop(MOOD_REGION))
+    for region in (TURN_REGION, YEAR_REGION, CRITERIA_REGION):
+        extract_text(enhance_image(frame.crop(region)))
+    for region in STAT_REGIONS.values():
+        extract_number(enhance_image(frame.crop(region)))
+
+
+def batched(frame):
+    """The same reads through extract_batch: one call for the lobby, one for the stats"""
+    read_lobby(frame)
+    stat_state(frame)
+
+
+def measure(label, fn, frame, runs):
+    fn(frame)  # warm up
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn(frame)
+    elapsed = (time.perf_counter() - start) / runs
+    print(f"{label:<22} {elapsed * 1000:8.1f} ms per turn")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-turn OCR latency")
+    parser.add_argument("screenshot", help="1920x1080 capture of the career lobby")
+    parser.add_argument("--runs", type=int, default=5, help="turns to time per method")
+    args = parser.parse_args()
+
+    frame = FrameSnapshot(Image.open(args.screenshot).convert("RGB"), "bench")
+    print(f"Lobby: {read_lobby(frame)}")
+    print(f"Stats: {stat_state(frame)}\n")
+
+    before = measure("one call per region", per_region, frame, args.runs)
+    after = measure("extract_batch", batched, frame, args.runs)
+    print(f"\nSpeedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Skill wishlist matching benchmark
+Matches OCR-like skill names against synthetic wishlists of 10, 100 and 1,000
+skills: the old linear scan (Levenshtein.ratio against every entry) against
+the trigram-indexed bot_core.skill_matcher.SkillMatcher. Reports microseconds
+per query, how often both pick the same wishlist entry, and how often each
+picks the skill the text was made from (or nothing, for skills not on the list).
+
+Usage (from the repository root):
+    python tools/bench_skill_match.py [--sizes 10 100 1000] [--queries 500] [--seed 0]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import Levenshtein
+
+from bot_core.skill_matcher import SkillMatcher
+
+WORDS = [
+    "Corner", "Straightaway", "Recovery", "Acceleration", "Adept", "Savvy", "Focus", "Concentration",
+    "Professor", "Curvature", "Swinging", "Maestro", "Red", "Shift", "Speed", "Star", "Stamina",
+    "Keep", "Pace", "Lead", "Front", "Runner", "Late", "Surger", "End", "Closer", "Sprint", "Mile",
+    "Medium", "Long", "Dirt", "Turf", "Rainy", "Days", "Firm", "Conditions", "Wet", "Summer", "Winter",
+    "Prudent", "Positioning", "Calm", "Crowd", "Nimble", "Navigator", "Slipstream", "Homestretch",
+    "Haste", "Breath", "Fresh", "Air", "Lone", "Wolf", "Killer", "Tunes", "Gate", "Eater", "Hesitant",
+    "Swift", "Gear", "Shift", "Unyielding", "Spirit", "Triumphant", "Pulse", "Tactical", "Tweak",
+]
+# OCR mix-ups seen on the game font
+CONFUSIONS = {"l": "1", "I": "l", "O": "0", "o": "0", "S": "5", "rn": "m", "c": "e", "a": "o"}
+
+
+def make_skills(count, rng):
+    skills = set()
+    while len(skills) < count:
+        name = " ".join(rng.sample(WORDS, rng.choice((2, 2, 3))))
+        if rng.random() < 0.2:
+            name += rng.choice((" ◎", " ○", " Lvl 2", "!"))
+        skills.add(name)
+    return sorted(skills)
+
+
+def ocr_noise(text, rng):
+    """Mimic a recognizer read: a confusion or two, a dropped character, stray punctuation"""
+    for _ in range(rng.randint(0, 2)):
+        source = rng.choice(list(CONFUSIONS))
+        if source in text:
+            text = text.replace(source, CONFUSIONS[source], 1)
+    if rng.random() < 0.3 and len(text) > 4:
+        position = rng.randrange(len(text))
+        text = text[:position] + text[position + 1:]
+    if rng.random() < 0.2:
+        text = text.replace(" ", "", 1)
+    return text
+
+
+def linear_match(text, skills, threshold):
+    best, best_score = None, 0.0
+    for skill in skills:
+        score = Levenshtein.ratio(text.lower(), skill.lower())
+        if score > best_score:
+            best, best_score = skill, score
+    return (best if best_score >= threshold else None), best_score
+
+
+def bench(size, queries, rng, threshold=0.75):
+    vocabulary = make_skills(size * 2, rng)
+    wishlist = vocabulary[:size]
+    others = vocabulary[size:]
+    # Half the rows on screen are wishlist skills, half are skills nobody asked for
+    sources = [rng.choice(wishlist if i % 2 == 0 else others) for i in range(queries)]
+    texts = [ocr_noise(source, rng) for source in sources]
+    truth = [source if i % 2 == 0 else None for i, source in enumerate(sources)]
+
+    start = time.perf_counter()
+    matcher = SkillMatcher(wishlist, threshold)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    linear = [linear_match(text, wishlist, threshold) for text in texts]
+    linear_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [matcher.match(text) for text in texts]
+    indexed_time = time.perf_counter() - start
+
+    same = sum(a[0] == b[0] for a, b in zip(linear, indexed))
+    return {
+        "size": size,
+        "build_ms": build * 1000,
+        "linear_us": linear_time / queries * 1e6,
+        "indexed_us": indexed_time / queries * 1e6,
+        "agreement": same / queries,
+        "linear_correct": sum(a[0] == t for a, t in zip(linear, truth)) / queries,
+        "indexed_correct": sum(b[0] == t for b, t in zip(indexed, truth)) / queries,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skill wishlist matching")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'skills':>7}{'build ms':>10}{'linear us':>11}{'indexed us':>12}{'speedup':>9}"
+          f"{'agree':>8}{'linear ok':>11}{'indexed ok':>12}")
+    for size in args.sizes:
+        row = bench(size, args.queries, rng)
+        print(f"{row['size']:>7}{row['build_ms']:>10.2f}{row['linear_us']:>11.1f}{row['indexed_us']:>12.1f}"
+              f"{row['linear_us'] / row['indexed_us']:>8.1f}x{row['agreement']:>8.0%}"
+              f"{row['linear_correct']:>11.0%}{row['indexed_correct']:>12.0%}")
+
+
+if __name__ == "__main__":
+    main()
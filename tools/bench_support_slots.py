@@ -0,0 +1,124 @@
+"""
+Support card classification benchmark
+Compares the six-template approach (state.check_support_card plus
+state.check_special_supporters over the whole support column) with the
+slot-based classifier (bot_core/support_slots.py) on training previews.
+Reports ms per preview and, on synthetic previews, how often each gets the
+type and special counts exactly right; on recorded previews, how often the
+two agree.
+
+Usage (from the repository root):
+    python tools/bench_support_slots.py [--previews 200] [--seed 0]
+        Synthetic previews: type icons pasted on a fixed slot grid over noise.
+    python tools/bench_support_slots.py --frames DIR
+        Full-monitor screenshots of training previews (e.g. from replay.py --record).
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from PIL import Image
+
+from monitor_manager import FrameSnapshot
+from bot_core.state import check_support_card, check_special_supporters
+from bot_core.support_slots import SupportSlotClassifier, TYPE_ICONS, SPECIAL_ICONS, count_types, count_specials
+from bot_core.template_cache import ROOT_DIR
+
+# Synthetic layout: icon column and slot grid inside SUPPORT_CARD_ICON_REGION
+ICON_X = 900
+FIRST_SLOT = 175
+SLOT_PITCH = 95
+SLOTS = 5
+PORTRAIT_X = 790
+FRAME_SIZE = (1920, 1080)
+
+
+def load_icon(path):
+    return Image.open(os.path.join(ROOT_DIR, path)).convert("RGB")
+
+
+def make_preview(rng, icons, specials):
+    """A noisy frame with cards stacked from the top slot; returns it with the true counts"""
+    noise = np.random.default_rng(rng.randrange(1 << 30)).integers(90, 140, (FRAME_SIZE[1], FRAME_SIZE[0], 3), dtype=np.uint8)
+    image = Image.fromarray(noise)
+    types = {name: 0 for name in TYPE_ICONS}
+    special_counts = {name: 0 for name in SPECIAL_ICONS}
+    for slot in range(rng.randint(0, SLOTS)):
+        y = FIRST_SLOT + slot * SLOT_PITCH
+        card_type = rng.choice(list(TYPE_ICONS))
+        image.paste(icons[card_type], (ICON_X, y))
+        types[card_type] += 1
+        if rng.random() < 0.3:
+            name = rng.choice(list(SPECIAL_ICONS))
+            image.paste(specials[name], (PORTRAIT_X, y - 5))
+            special_counts[name] += 1
+    return image, types, special_counts
+
+
+def time_calls(function, frames):
+    start = time.perf_counter()
+    results = [function(frame) for frame in frames]
+    return results, (time.perf_counter() - start) / max(1, len(frames))
+
+
+def six_templates(frame):
+    return check_support_card(frame=frame), check_special_supporters(frame=frame)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark support card classification")
+    parser.add_argument("--previews", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--frames", help="directory of recorded training preview screenshots")
+    args = parser.parse_args()
+
+    truth = None
+    if args.frames:
+        names = sorted(name for name in os.listdir(args.frames) if name.lower().endswith(".png"))
+        frames = [FrameSnapshot(Image.open(os.path.join(args.frames, name)).convert("RGB"), None) for name in names]
+    else:
+        rng = random.Random(args.seed)
+        icons = {name: load_icon(path) for name, path in TYPE_ICONS.items()}
+        specials = {name: load_icon(path) for name, path in SPECIAL_ICONS.items()}
+        previews = [make_preview(rng, icons, specials) for _ in range(args.previews)]
+        frames = [FrameSnapshot(image, None) for image, _, _ in previews]
+        truth = [(types, special_counts) for _, types, special_counts in previews]
+    if not frames:
+        print("No frames")
+        return
+
+    classifier = SupportSlotClassifier()
+    # Learn the slot grid the way a run does: full passes until two slots were seen
+    for frame in frames:
+        classifier.classify(frame)
+        if classifier.calibrated:
+            break
+    print(f"Slot grid: icon x {classifier.icon_x}, tops {classifier.slot_positions()}")
+
+    baseline, baseline_time = time_calls(six_templates, frames)
+    slot_results, slot_time = time_calls(lambda frame: classifier.classify(frame), frames)
+    slotted = [(count_types(slots), count_specials(slots)) for slots in slot_results]
+
+    print(f"\n{'method':<16}{'ms/preview':>11}{'types ok':>10}{'specials ok':>13}")
+    for label, results, seconds in (("six templates", baseline, baseline_time), ("slot classifier", slotted, slot_time)):
+        if truth:
+            types_ok = sum(result[0] == expected[0] for result, expected in zip(results, truth)) / len(truth)
+            specials_ok = sum(result[1] == expected[1] for result, expected in zip(results, truth)) / len(truth)
+            print(f"{label:<16}{seconds * 1000:>11.2f}{types_ok:>10.0%}{specials_ok:>13.0%}")
+        else:
+            print(f"{label:<16}{seconds * 1000:>11.2f}{'-':>10}{'-':>13}")
+    agree = sum(a == b for a, b in zip(baseline, slotted)) / len(frames)
+    confidences = [slot["confidence"] for slots in slot_results for slot in slots]
+    print(f"\nAgreement: {agree:.0%} of {len(frames)} previews, speedup {baseline_time / slot_time:.1f}x")
+    if confidences:
+        print(f"Slot confidence: min {min(confidences):.2f}, median {float(np.median(confidences)):.2f}")
+
+
+if __name__ == "__main__":
+    main()
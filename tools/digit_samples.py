@@ -0,0 +1,139 @@
+"""
+Digit reader samples, glyphs and benchmark
+
+The labelled test set is a folder of raw field crops named <label>__<anything>.png,
+e.g. "512__spd_1718000000.png". The file name is the ground truth.
+
+Usage (from the repository root):
+    python tools/digit_samples.py capture [--dir tools/digit_samples]
+        Save the stat and skill point fields of the current screen, labelled with
+        the EasyOCR reading. Check the names and rename any misread sample.
+    python tools/digit_samples.py build [--dir tools/digit_samples]
+        Segment the labelled samples (enhanced, as at runtime) and write one
+        averaged glyph per digit to game_assets/digits/.
+    python tools/digit_samples.py bench [--dir tools/digit_samples]
+        Accuracy and latency of the digit reader against EasyOCR on the samples.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from bot_core.digit_reader import GLYPH_DIR, split_glyphs, normalize_glyph
+
+DEFAULT_DIR = os.path.join(os.path.dirname(__file__), 'digit_samples')
+
+
+def load_samples(sample_dir):
+    samples = []
+    for filename in sorted(os.listdir(sample_dir)):
+        if "__" not in filename or not filename.lower().endswith(".png"):
+            continue
+        label = filename.split("__")[0]
+        if label.isdigit():
+            samples.append((label, Image.open(os.path.join(sample_dir, filename)).convert("RGB")))
+    return samples
+
+
+def capture(sample_dir):
+    from monitor_manager import monitor_manager
+    from bot_core import ocr
+    from bot_utils.screenshot import enhance_image
+    from bot_utils.constants import STAT_REGIONS, SKILL_PTS_REGION
+
+    os.makedirs(sample_dir, exist_ok=True)
+    frame = monitor_manager.refresh_frame()
+    fields = dict(STAT_REGIONS, skill_pts=SKILL_PTS_REGION)
+    stamp = int(time.time())
+    ocr.use_digit_reader = False
+    for field, region in fields.items():
+        crop = frame.crop(region)
+        label = ocr.extract_number(enhance_image(crop), detect=False)
+        name = f"{label if label >= 0 else 'unlabelled'}__{field}_{stamp}.png"
+        crop.save(os.path.join(sample_dir, name))
+        print(f"[INFO] Saved {name}")
+
+
+def build(sample_dir):
+    from bot_utils.screenshot import enhance_image
+
+    buckets = {str(digit): [] for digit in range(10)}
+    skipped = 0
+    for label, img in load_samples(sample_dir):
+        # Segment what the reader sees at runtime: the enhanced crop, as ocr._job_image makes it
+        masks = split_glyphs(np.array(enhance_image(img).convert("L")))
+        if len(masks) != len(label):
+            skipped += 1
+            continue
+        for digit, mask in zip(label, masks):
+            buckets[digit].append(normalize_glyph(mask))
+
+    os.makedirs(GLYPH_DIR, exist_ok=True)
+    for digit, glyphs in buckets.items():
+        if not glyphs:
+            print(f"[WARNING] No samples for digit {digit}")
+            continue
+        mean = (np.mean(glyphs, axis=0) * 255).astype(np.uint8)
+        cv2.imwrite(os.path.join(GLYPH_DIR, f"{digit}.png"), mean)
+        print(f"[INFO] Glyph {digit}: {len(glyphs)} samples")
+    if skipped:
+        print(f"[WARNING] {skipped} samples skipped (glyph count did not match the label)")
+
+
+def bench(sample_dir):
+    from bot_core import ocr
+    from bot_core.digit_reader import digit_reader
+    from bot_utils.screenshot import enhance_image
+
+    samples = load_samples(sample_dir)
+    if not samples:
+        print(f"[ERROR] No labelled samples in {sample_dir}")
+        return
+    if not digit_reader.available:
+        print(f"[ERROR] No glyphs in {GLYPH_DIR}; run the build step first")
+        return
+
+    ocr.use_digit_reader = False
+    rows = {"digit reader": [0, 0.0], "easyocr": [0, 0.0], "digit reader + fallback": [0, 0.0]}
+    for label, img in samples:
+        enhanced = enhance_image(img)
+        expected = int(label)
+
+        start = time.perf_counter()
+        value, confidence = digit_reader.read(enhanced)
+        glyph_time = time.perf_counter() - start
+        rows["digit reader"][0] += value == expected
+        rows["digit reader"][1] += glyph_time
+
+        start = time.perf_counter()
+        easy_value = ocr.extract_number(enhanced, detect=False)
+        easy_time = time.perf_counter() - start
+        rows["easyocr"][0] += easy_value == expected
+        rows["easyocr"][1] += easy_time
+
+        confident = value is not None and confidence >= digit_reader.min_confidence
+        rows["digit reader + fallback"][0] += (value if confident else easy_value) == expected
+        rows["digit reader + fallback"][1] += glyph_time + (0 if confident else easy_time)
+
+    print(f"{len(samples)} labelled samples\n")
+    for name, (correct, elapsed) in rows.items():
+        print(f"{name:<26} accuracy {correct / len(samples):6.1%}   {elapsed / len(samples) * 1000:8.2f} ms/field")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Digit reader samples, glyphs and benchmark")
+    parser.add_argument("command", choices=["capture", "build", "bench"])
+    parser.add_argument("--dir", default=DEFAULT_DIR, help="labelled sample folder")
+    args = parser.parse_args()
+    {"capture": capture, "build": build, "bench": bench}[args.command](args.dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Screen-type references for the screen classifier
+Saves labelled, downscaled game-column crops to game_assets/screens/<type>/,
+which bot_core/screen_classifier.py compares each lobby frame against, and
+measures how well (and how fast) the current references classify.
+
+Usage (from the repository root):
+    python tools/label_screens.py capture TYPE [--frames 1] [--interval 1.0]
+        Save the current screen of the selected monitor as a TYPE reference.
+    python tools/label_screens.py import DIR TYPE
+        Save every full-monitor frame in DIR (e.g. from tools/replay.py capture) as TYPE.
+    python tools/label_screens.py eval [--runs 200]
+        Leave-one-out accuracy over the references and ms per classification.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PIL import Image
+
+from bot_core.screen_classifier import (SCREEN_DIR, SCREEN_TYPES, UNKNOWN, ScreenClassifier,
+                                        reference_image, screen_signature)
+
+
+def next_path(label):
+    folder = os.path.join(SCREEN_DIR, label)
+    os.makedirs(folder, exist_ok=True)
+    index = len([name for name in os.listdir(folder) if name.lower().endswith(".png")])
+    while os.path.exists(os.path.join(folder, f"{label}_{index:03d}.png")):
+        index += 1
+    return os.path.join(folder, f"{label}_{index:03d}.png")
+
+
+def check_label(label):
+    if label not in SCREEN_TYPES:
+        print(f"[WARNING] '{label}' is not one of {', '.join(SCREEN_TYPES)}; the lobby loop only dispatches on those")
+
+
+def capture(label, frames, interval):
+    from monitor_manager import monitor_manager
+    check_label(label)
+    for index in range(frames):
+        path = next_path(label)
+        reference_image(monitor_manager.grab_monitor()).save(path)
+        print(f"[INFO] Saved {path}")
+        if index + 1 < frames:
+            time.sleep(interval)
+
+
+def import_frames(directory, label):
+    check_label(label)
+    names = sorted(name for name in os.listdir(directory) if name.lower().endswith((".png", ".jpg", ".jpeg", ".bmp")))
+    for name in names:
+        with Image.open(os.path.join(directory, name)) as frame:
+            reference_image(frame.convert("RGB")).save(next_path(label))
+    print(f"[INFO] Imported {len(names)} frames from {directory} as '{label}'")
+
+
+def evaluate(runs):
+    classifier = ScreenClassifier()
+    if not classifier.available:
+        print(f"No references in {SCREEN_DIR}")
+        return
+
+    labels = classifier.labels
+    correct = unknown = 0
+    confusions = {}
+    for index, label in enumerate(labels):
+        # Classify each reference against all the others
+        held_out = classifier.signatures[index].copy()
+        classifier.signatures[index] = 0
+        predicted, _ = classifier.classify_signature(held_out)
+        classifier.signatures[index] = held_out
+        if predicted == label:
+            correct += 1
+        elif predicted == UNKNOWN:
+            unknown += 1
+        else:
+            confusions[(label, predicted)] = confusions.get((label, predicted), 0) + 1
+
+    counts = {label: labels.count(label) for label in sorted(set(labels))}
+    print("References: " + ", ".join(f"{label} {count}" for label, count in counts.items()))
+    print(f"Leave-one-out: {correct}/{len(labels)} correct, {unknown} unknown")
+    for (label, predicted), count in sorted(confusions.items()):
+        print(f"  {label} -> {predicted}: {count}")
+
+    # Timing on a full-size frame rebuilt from the first reference
+    with Image.open(os.path.join(SCREEN_DIR, labels[0], sorted(os.listdir(os.path.join(SCREEN_DIR, labels[0])))[0])) as img:
+        column = img.convert("RGB").resize((img.width * 4, img.height * 4))
+    from bot_utils.constants import GAME_REGION
+    frame = Image.new("RGB", (GAME_REGION[2], GAME_REGION[3]))
+    frame.paste(column, GAME_REGION[:2])
+    start = time.perf_counter()
+    for _ in range(runs):
+        classifier.classify(frame)
+    per_call = (time.perf_counter() - start) / runs
+    start = time.perf_counter()
+    for _ in range(runs):
+        screen_signature(frame, box=GAME_REGION)
+    per_signature = (time.perf_counter() - start) / runs
+    print(f"classify: {per_call * 1000:.2f} ms per frame ({per_signature * 1000:.2f} ms of it the thumbnail)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Label reference screens for the screen classifier")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    capture_parser = commands.add_parser("capture", help="save the current screen as a reference")
+    capture_parser.add_argument("label")
+    capture_parser.add_argument("--frames", type=int, default=1)
+    capture_parser.add_argument("--interval", type=float, default=1.0, help="seconds between frames")
+
+    import_parser = commands.add_parser("import", help="save recorded full-monitor frames as references")
+    import_parser.add_argument("dir")
+    import_parser.add_argument("label")
+
+    eval_parser = commands.add_parser("eval", help="leave-one-out accuracy and classification speed")
+    eval_parser.add_argument("--runs", type=int, default=200)
+
+    args = parser.parse_args()
+    if args.command == "capture":
+        capture(args.label, args.frames, args.interval)
+    elif args.command == "import":
+        import_frames(args.dir, args.label)
+    else:
+        evaluate(args.runs)
+
+
+if __name__ == "__main__":
+    main()
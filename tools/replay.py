@@ -0,0 +1,154 @@
+"""
+Offline replay harness
+Drives career_lobby_iteration from recorded frames instead of the live game.
+Frames come from a directory or a .zip of screenshots (full selected-monitor
+frames, sorted by file name); clicks, scrolls and waits go to a recording input
+sink instead of the mouse, so the whole perception and decision path runs
+headless and as fast as it can.
+
+Usage (from the repository root):
+    python tools/replay.py capture DIR [--frames 50] [--interval 2.0]
+        Save a screenshot of the selected monitor every INTERVAL seconds.
+    python tools/replay.py run DIR_OR_ZIP [--step tick] [--out actions.jsonl] [--seed 0]
+        --step tick: one frame per career_lobby_iteration (default)
+        --step grab: every capture the bot makes takes the next frame, for
+                     recordings made with --record during a live run
+    python tools/replay.py run ... --record DIR
+        Run live against the game and save every frame the bot grabs.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from monitor_manager import monitor_manager
+
+
+def capture(directory, frames, interval):
+    os.makedirs(directory, exist_ok=True)
+    for index in range(frames):
+        monitor_manager.grab_monitor().save(os.path.join(directory, f"frame_{index:05d}.png"))
+        print(f"[INFO] Saved frame {index + 1}/{frames}")
+        if index + 1 < frames:
+            time.sleep(interval)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run(path, step, out, seed, record):
+    import bot_core.state as state
+    from bot_core.execute import career_lobby_iteration
+    from bot_utils.frame_source import ReplayFrameSource, FrameRecorder
+    from bot_utils.input_sink import input_sink, RecordingInput
+    from bot_utils.tracing import tracer
+    from bot_core.ocr import get_ocr_cache_stats
+    from bot_core.position_cache import position_cache
+    from bot_core.game_state import game_state
+
+    random.seed(seed)
+    state.reload_config()
+    state.is_bot_running = True
+
+    if record:
+        # Live run that keeps every frame for a later --step grab replay
+        monitor_manager.set_frame_source(FrameRecorder(record, monitor_manager.grab_monitor))
+        try:
+            while state.is_bot_running and career_lobby_iteration():
+                pass
+        except KeyboardInterrupt:
+            print(f"\n[INFO] Recorded {monitor_manager.frame_source.count} frames to {record}")
+        return
+
+    source = ReplayFrameSource(path, step=step)
+    recorder = RecordingInput()
+    input_sink.use(recorder)
+    monitor_manager.set_frame_source(source)
+    print(f"[INFO] Replaying {len(source)} frames from {path} (step={step})")
+
+    log = open(out, "w", encoding="utf-8") if out else None
+    timings = []
+    tick = 0
+    try:
+        while not source.exhausted:
+            frame_name = source.name
+            start = time.perf_counter()
+            try:
+                career_lobby_iteration()
+                error = None
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                print(f"[ERROR] Tick {tick} ({frame_name}): {error}")
+            elapsed = time.perf_counter() - start
+            timings.append(elapsed)
+
+            actions = recorder.take_actions()
+            slept, recorder.slept = recorder.slept, 0.0
+            entry = {
+                "tick": tick,
+                "frame": frame_name,
+                "seconds": round(elapsed, 4),
+                "skipped_sleep": round(slept, 3),
+                "actions": [{k: v for k, v in action.items() if k != "time"} for action in actions],
+                "error": error,
+            }
+            if log:
+                log.write(json.dumps(entry, default=str) + "\n")
+            summary = ", ".join(a["action"] for a in actions if a["action"] != "moveTo") or "no input"
+            print(f"[REPLAY] {tick:4d} {frame_name}: {elapsed * 1000:7.1f} ms, {summary}")
+
+            tick += 1
+            if step == "tick":
+                source.advance()
+            monitor_manager.invalidate_frame()
+    finally:
+        if log:
+            log.close()
+        source.close()
+
+    if timings:
+        total = sum(timings)
+        print(f"\n{tick} ticks in {total:.2f} s ({tick / total:.1f} ticks/s)")
+        print(f"per tick: mean {total / tick * 1000:.1f} ms, "
+              f"p50 {percentile(timings, 50) * 1000:.1f} ms, p95 {percentile(timings, 95) * 1000:.1f} ms")
+        print(f"\n{tracer.format_summary()}")
+        cache = get_ocr_cache_stats()
+        print(f"\nOCR cache: {cache['hits']} hits, {cache['misses']} misses ({cache['hit_rate']:.0%})")
+        print(position_cache.format_summary())
+        print(game_state.format_summary())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded frames through the bot")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    capture_parser = commands.add_parser("capture", help="save periodic screenshots of the selected monitor")
+    capture_parser.add_argument("dir")
+    capture_parser.add_argument("--frames", type=int, default=50)
+    capture_parser.add_argument("--interval", type=float, default=2.0, help="seconds between frames")
+
+    run_parser = commands.add_parser("run", help="drive career_lobby_iteration from recorded frames")
+    run_parser.add_argument("path", nargs="?", help="frame directory or .zip archive")
+    run_parser.add_argument("--step", choices=["tick", "grab"], default="tick")
+    run_parser.add_argument("--out", help="write one JSON line of recorded input per tick")
+    run_parser.add_argument("--seed", type=int, default=0, help="seed for the human-like randomness")
+    run_parser.add_argument("--record", metavar="DIR", help="run live and save every grabbed frame to DIR")
+
+    args = parser.parse_args()
+    if args.command == "capture":
+        capture(args.dir, args.frames, args.interval)
+    else:
+        if not args.path and not args.record:
+            parser.error("run needs a frame directory/archive, or --record DIR")
+        run(args.path, args.step, args.out, args.seed, args.record)
+
+
+if __name__ == "__main__":
+    main()